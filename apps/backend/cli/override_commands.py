@@ -19,6 +19,7 @@ from security.output_validation.overrides import (
     OverrideTokenManager,
     format_command_scope,
     format_file_scope,
+    is_token_id,
 )
 from ui import Icons, icon, success, warning, error as ui_error
 
@@ -78,6 +79,7 @@ def handle_override_create_command(
             reason=reason,
             creator="cli",
         )
+        manager.flush()
     except ValueError as e:
         print(ui_error(f"{icon(Icons.ERROR)} Failed to create token: {e}"))
         sys.exit(1)
@@ -256,12 +258,12 @@ def handle_override_revoke_command(project_dir: Path, token_id: str) -> None:
         project_dir: Project root directory
         token_id: Token ID to revoke
     """
-    # Validate token ID format (basic check for UUID)
-    if len(token_id.split("-")) != 5:
+    # Validate token ID format
+    if not is_token_id(token_id):
         print(
             ui_error(
                 f"{icon(Icons.ERROR)} Invalid token ID format. "
-                f"Token IDs should be UUIDs."
+                f"Use the Token ID shown by 'override list'."
             )
         )
         print()
@@ -290,6 +292,7 @@ def handle_override_revoke_command(project_dir: Path, token_id: str) -> None:
 
     # Revoke the token
     success_revoked = manager.revoke_token(token_id)
+    manager.flush()
 
     if success_revoked:
         print()
@@ -45,6 +45,7 @@ from .rules import (
     BASH_RULES,
     FILE_PATH_RULES,
     FILE_WRITE_RULES,
+    RULES_BY_TOOL,
     WEB_RULES,
     get_default_rules,
     get_rule_by_id,
@@ -91,10 +92,13 @@ from .overrides import (
     OverrideTokenManager,
     TokenStorage,
     cleanup_expired_tokens,
+    clear_manager_cache,
     format_command_scope,
     format_file_scope,
     generate_override_token,
+    is_token_id,
     list_override_tokens,
+    new_token_id,
     parse_scope,
     revoke_override_token,
     use_override_token,
@@ -153,6 +157,7 @@ __all__ = [
     "FILE_WRITE_RULES",
     "FILE_PATH_RULES",
     "WEB_RULES",
+    "RULES_BY_TOOL",
     "get_default_rules",
     "get_rule_by_id",
     "list_rule_categories",
@@ -192,9 +197,12 @@ __all__ = [
     "revoke_override_token",
     "list_override_tokens",
     "cleanup_expired_tokens",
+    "clear_manager_cache",
     "format_file_scope",
     "format_command_scope",
     "parse_scope",
+    "new_token_id",
+    "is_token_id",
     # Validation event logging
     "ValidationEventLogger",
     "get_validation_logger",
@@ -44,10 +44,14 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import logging
-from fnmatch import fnmatch
+import os
+import re
+import sys
+from collections import OrderedDict
+from fnmatch import fnmatch, translate
 from pathlib import Path
-from typing import Optional
 
 from .config import OutputValidationConfig
 
@@ -58,6 +62,77 @@ from .config import OutputValidationConfig
 logger = logging.getLogger(__name__)
 
 
+# Number of is_allowed() results each checker remembers
+MATCH_CACHE_SIZE = 1024
+
+# Number of checkers is_path_allowed() keeps for reuse
+CHECKER_CACHE_SIZE = 32
+
+
+# Characters that make a glob path component a wildcard
+_GLOB_MAGIC_CHARS = frozenset("*?[")
+
+# Compiled allowlist: (patterns without wildcards, regex for each fixed
+# first path component, regex for paths with any other first component).
+# See _compile_allowed_patterns().
+_AllowedRegexes = tuple[
+    frozenset[str], dict[str, re.Pattern[str]], re.Pattern[str] | None
+]
+
+
+def _first_component(path: str) -> str:
+    """Return the part of a normcased path before its first separator."""
+    return path.partition(os.sep)[0]
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_allowed_patterns(patterns: tuple[str, ...]) -> _AllowedRegexes | None:
+    """
+    Combine glob patterns into regexes keyed by their first path component.
+
+    Each pattern is translated the way fnmatch() does, so a path matches
+    exactly when fnmatch() matches it against one of the patterns. A
+    pattern whose first component has no wildcard (e.g. "tests/**") can
+    only match paths with that first component, so a path is only tried
+    against the patterns for its own first component plus those starting
+    with a wildcard (e.g. "*.tmp"). A pattern without any wildcard only
+    matches the identical path, so it is kept in a set instead of a regex.
+    Checkers of the same project share the result.
+
+    Args:
+        patterns: Glob patterns from allowed_paths
+
+    Returns:
+        Compiled regexes, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+
+    literals: set[str] = set()
+    by_first: dict[str, list[str]] = {}
+    wildcard_first: list[str] = []
+    for pattern in patterns:
+        normalized = os.path.normcase(pattern)
+        first = _first_component(normalized)
+        if _GLOB_MAGIC_CHARS.isdisjoint(normalized):
+            literals.add(normalized)
+        elif _GLOB_MAGIC_CHARS.isdisjoint(first):
+            by_first.setdefault(first, []).append(normalized)
+        else:
+            wildcard_first.append(normalized)
+
+    def combine(group: list[str]) -> re.Pattern[str] | None:
+        if not group:
+            return None
+        return re.compile("|".join(translate(pattern) for pattern in group))
+
+    return (
+        frozenset(literals),
+        {first: combine(group + wildcard_first) for first, group in by_first.items()},
+        combine(wildcard_first),
+    )
+
+
 # =============================================================================
 # ALLOWED PATHS CHECKER
 # =============================================================================
@@ -68,7 +143,8 @@ class AllowedPathsChecker:
 
     This class provides efficient path matching against glob patterns
     defined in the project's validation configuration. Paths matching
-    allowed patterns bypass validation checks.
+    allowed patterns bypass validation checks. Uses __slots__ since
+    is_path_allowed() keeps a checker for every project and allowlist.
 
     Attributes:
         project_dir: Root directory of the project
@@ -89,6 +165,14 @@ class AllowedPathsChecker:
         False
     """
 
+    __slots__ = (
+        "project_dir",
+        "config",
+        "allowed_patterns",
+        "_allowed_regexes",
+        "_match_cache",
+    )
+
     def __init__(
         self,
         project_dir: Path,
@@ -104,6 +188,11 @@ class AllowedPathsChecker:
         self.project_dir = Path(project_dir).resolve()
         self.config = config
         self.allowed_patterns = self._compile_patterns()
+        # Compiled on the first is_allowed() call; checkers made only to
+        # list the patterns (get_allowed_paths()) never need them
+        self._allowed_regexes: _AllowedRegexes | None = None
+        # file_path -> matching pattern (None if not allowed), least recent first
+        self._match_cache: OrderedDict[str, str | None] = OrderedDict()
 
     def _compile_patterns(self) -> list[str]:
         """
@@ -125,6 +214,10 @@ class AllowedPathsChecker:
                 )
                 continue
 
+            # Checkers of different projects mostly configure the same
+            # patterns (tests/**, build/**), so share one string for each
+            pattern = sys.intern(pattern)
+
             # Resolve relative patterns against project directory
             if not Path(pattern).is_absolute():
                 # For relative patterns, we'll match against relative paths
@@ -176,32 +269,89 @@ class AllowedPathsChecker:
             # No allowed paths configured
             return False
 
+        # Writes tend to hit the same paths again, so reuse earlier results
+        if file_path in self._match_cache:
+            self._match_cache.move_to_end(file_path)
+            pattern = self._match_cache[file_path]
+        else:
+            pattern = self._find_allowed_pattern(file_path)
+            # A relative path allowed only through its resolved form may
+            # stop being allowed when a symlink on it changes, so only
+            # results that don't depend on resolving symlinks are kept
+            if (
+                pattern is None
+                or os.path.isabs(file_path)
+                or self._matches_pattern(file_path, pattern)
+            ):
+                self._match_cache[file_path] = pattern
+                if len(self._match_cache) > MATCH_CACHE_SIZE:
+                    self._match_cache.popitem(last=False)
+
+        if pattern is None:
+            return False
+
+        # Log the allowlist usage; allowed writes are frequent, so skip
+        # formatting the message unless debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Path '%s' matched allowed pattern '%s' - bypassing validation",
+                file_path,
+                pattern,
+            )
+        return True
+
+    def _find_allowed_pattern(self, file_path: str) -> str | None:
+        """
+        Find the first allowed path pattern that matches a file path.
+
+        Args:
+            file_path: File path to check (can be relative or absolute)
+
+        Returns:
+            The matching pattern, or None if no pattern matches
+        """
         # Convert to Path object for easier manipulation
         path_obj = Path(file_path)
 
         # Try matching against both relative and absolute paths
         paths_to_check = self._get_paths_to_check(path_obj)
 
+        if self._allowed_regexes is None:
+            self._allowed_regexes = _compile_allowed_patterns(
+                tuple(self.allowed_patterns)
+            )
+
+        # A set lookup and at most one regex run per path decide; the
+        # patterns are only walked to name the one that matched
+        literals, by_first, wildcard_first = self._allowed_regexes
+        for path in paths_to_check:
+            path = os.path.normcase(path)
+            if path in literals:
+                break
+            regex = by_first.get(_first_component(path), wildcard_first)
+            if regex is not None and regex.match(path):
+                break
+        else:
+            return None
+
         # Check each pattern
         for pattern in self.allowed_patterns:
             for check_path in paths_to_check:
                 if self._matches_pattern(check_path, pattern):
-                    # Log the allowlist usage
-                    logger.debug(
-                        f"Path '{file_path}' matched allowed pattern '{pattern}' - "
-                        "bypassing validation"
-                    )
-                    return True
+                    return pattern
 
         # No match found
-        return False
+        return None
 
     def _get_paths_to_check(self, path_obj: Path) -> list[str]:
         """
         Get list of path variations to check against patterns.
 
         This handles the complexity of relative vs absolute paths and
-        ensures we match patterns appropriately.
+        ensures we match patterns appropriately. Relative paths are made
+        absolute with symlinks resolved, so a path through a link that
+        points outside the project never matches a pattern for the
+        project itself.
 
         Args:
             path_obj: Path object to check
@@ -287,9 +437,8 @@ def is_path_allowed(
     """
     Check if a file path matches allowed path patterns from config.
 
-    This is a convenience function that creates a temporary checker
-    instance and performs the check. For repeated checks, use the
-    AllowedPathsChecker class directly.
+    This is a convenience function that reuses one checker per project
+    directory and allowlist, so repeated checks hit its result cache.
 
     Args:
         file_path: File path to check
@@ -304,10 +453,38 @@ def is_path_allowed(
         >>> if is_path_allowed("tests/test.py", project_dir, config):
         ...     print("Path is allowed - skip validation")
     """
-    checker = AllowedPathsChecker(project_dir, config)
+    if not config.allowed_paths:
+        # Nothing can match; skip resolving project_dir for a checker
+        return False
+
+    try:
+        checker = _get_checker(
+            os.path.abspath(project_dir), tuple(config.allowed_paths)
+        )
+    except TypeError:
+        # Unhashable (invalid) pattern; the checker skips it with a warning
+        checker = AllowedPathsChecker(project_dir, config)
     return checker.is_allowed(file_path)
 
 
+@functools.lru_cache(maxsize=CHECKER_CACHE_SIZE)
+def _get_checker(
+    project_dir: str, allowed_paths: tuple[str, ...]
+) -> AllowedPathsChecker:
+    """
+    Get the shared checker for a project directory and allowlist.
+
+    Args:
+        project_dir: Absolute project directory
+        allowed_paths: Patterns from allowed_paths
+
+    Returns:
+        AllowedPathsChecker for the project and patterns
+    """
+    config = OutputValidationConfig(allowed_paths=list(allowed_paths))
+    return AllowedPathsChecker(Path(project_dir), config)
+
+
 def get_allowed_paths(
     project_dir: Path,
     config: OutputValidationConfig,
@@ -393,6 +570,7 @@ def normalize_pattern(pattern: str) -> str:
     return normalized
 
 
+@functools.lru_cache(maxsize=1024)
 def pattern_to_regex(pattern: str) -> str:
     """
     Convert a glob pattern to a regex pattern (for advanced use cases).
@@ -412,8 +590,6 @@ def pattern_to_regex(pattern: str) -> str:
         >>> pattern_to_regex("build/*.js")
         'build/[^/]*\\.js'
     """
-    import re
-
     # First, replace ** with a placeholder (must do this before *)
     # Use a unique placeholder that won't appear in normal paths
     pattern = pattern.replace("**", "\x00DOUBLESTAR\x00")
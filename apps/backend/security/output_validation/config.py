@@ -35,6 +35,7 @@ Usage:
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Literal
 
@@ -46,6 +47,14 @@ try:
 except ImportError:
     HAS_YAML = False
 
+# Optional fast JSON support (same pattern as overrides.py)
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .models import OutputValidationConfig, SeverityLevel, ToolType, ValidationRule
 
 
@@ -108,6 +117,15 @@ CONFIG_SCHEMA = {
     "additionalProperties": False,
 }
 
+# Lookups used by ValidationConfigLoader, derived from the schema once
+_CONFIG_KEYS = frozenset(CONFIG_SCHEMA["properties"])
+_RULE_SCHEMA = CONFIG_SCHEMA["properties"]["custom_rules"]["items"]
+_REQUIRED_RULE_FIELDS = tuple(_RULE_SCHEMA["required"])
+_VALID_SEVERITIES = frozenset(_RULE_SCHEMA["properties"]["severity"]["enum"])
+_VALID_PRIORITIES = frozenset(_RULE_SCHEMA["properties"]["priority"]["enum"])
+_VALID_CONTEXTS = frozenset(_RULE_SCHEMA["properties"]["context"]["enum"])
+_VALID_TOOL_TYPES = frozenset(t.value for t in ToolType)
+
 
 # =============================================================================
 # CONFIG LOADER
@@ -199,6 +217,9 @@ class ValidationConfigLoader:
         """
         Read and parse config file based on extension.
 
+        JSON is parsed with orjson when available. orjson.JSONDecodeError
+        subclasses json.JSONDecodeError, so errors are reported the same way.
+
         Args:
             config_path: Path to config file
 
@@ -211,6 +232,9 @@ class ValidationConfigLoader:
         suffix = config_path.suffix.lower()
 
         try:
+            if suffix == ".json" and HAS_ORJSON:
+                return orjson.loads(config_path.read_bytes())
+
             with open(config_path, "r") as f:
                 if suffix == ".json":
                     return json.load(f)
@@ -241,8 +265,7 @@ class ValidationConfigLoader:
         errors = []
 
         # Check for unknown top-level keys
-        valid_keys = set(CONFIG_SCHEMA["properties"].keys())
-        unknown_keys = set(config_data.keys()) - valid_keys
+        unknown_keys = config_data.keys() - _CONFIG_KEYS
         if unknown_keys:
             errors.append(f"Unknown keys: {', '.join(sorted(unknown_keys))}")
 
@@ -270,14 +293,13 @@ class ValidationConfigLoader:
             if not isinstance(config_data["severity_overrides"], dict):
                 errors.append("'severity_overrides' must be an object")
             else:
-                valid_severities = {"critical", "high", "medium", "low"}
                 for rule_id, severity in config_data["severity_overrides"].items():
                     if not isinstance(rule_id, str):
                         errors.append(f"'severity_overrides' key must be string: {rule_id}")
-                    if severity not in valid_severities:
+                    if severity not in _VALID_SEVERITIES:
                         errors.append(
                             f"Invalid severity for rule '{rule_id}': {severity}. "
-                            f"Must be one of: {', '.join(sorted(valid_severities))}"
+                            f"Must be one of: {', '.join(sorted(_VALID_SEVERITIES))}"
                         )
 
         # Validate allowed_paths
@@ -325,8 +347,7 @@ class ValidationConfigLoader:
         prefix = f"'custom_rules[{index}]'"
 
         # Required fields
-        required_fields = ["rule_id", "name", "description", "pattern"]
-        for field in required_fields:
+        for field in _REQUIRED_RULE_FIELDS:
             if field not in rule_data:
                 errors.append(f"{prefix}: Missing required field '{field}'")
             elif not isinstance(rule_data[field], str):
@@ -341,36 +362,35 @@ class ValidationConfigLoader:
                 )
 
         if "severity" in rule_data:
-            valid_severities = {"critical", "high", "medium", "low"}
-            if rule_data["severity"] not in valid_severities:
+            if rule_data["severity"] not in _VALID_SEVERITIES:
                 errors.append(
-                    f"{prefix}: 'severity' must be one of: {', '.join(sorted(valid_severities))}"
+                    f"{prefix}: 'severity' must be one of: "
+                    f"{', '.join(sorted(_VALID_SEVERITIES))}"
                 )
 
         if "priority" in rule_data:
-            valid_priorities = {"p0", "p1", "p2", "p3"}
-            if rule_data["priority"] not in valid_priorities:
+            if rule_data["priority"] not in _VALID_PRIORITIES:
                 errors.append(
-                    f"{prefix}: 'priority' must be one of: {', '.join(sorted(valid_priorities))}"
+                    f"{prefix}: 'priority' must be one of: "
+                    f"{', '.join(sorted(_VALID_PRIORITIES))}"
                 )
 
         if "tool_types" in rule_data:
             if not isinstance(rule_data["tool_types"], list):
                 errors.append(f"{prefix}: 'tool_types' must be a list")
             else:
-                valid_tools = {t.value for t in ToolType}
                 for j, tool in enumerate(rule_data["tool_types"]):
-                    if tool not in valid_tools:
+                    if tool not in _VALID_TOOL_TYPES:
                         errors.append(
                             f"{prefix}: 'tool_types[{j}]' invalid tool '{tool}'. "
-                            f"Must be one of: {', '.join(sorted(valid_tools))}"
+                            f"Must be one of: {', '.join(sorted(_VALID_TOOL_TYPES))}"
                         )
 
         if "context" in rule_data:
-            valid_contexts = {"command", "file_content", "file_path", "all"}
-            if rule_data["context"] not in valid_contexts:
+            if rule_data["context"] not in _VALID_CONTEXTS:
                 errors.append(
-                    f"{prefix}: 'context' must be one of: {', '.join(sorted(valid_contexts))}"
+                    f"{prefix}: 'context' must be one of: "
+                    f"{', '.join(sorted(_VALID_CONTEXTS))}"
                 )
 
         if "enabled" in rule_data and not isinstance(rule_data["enabled"], bool):
@@ -395,7 +415,36 @@ class ValidationConfigLoader:
 # CONFIG CACHE
 # =============================================================================
 
-_config_cache: dict[str, OutputValidationConfig] = {}
+# Identifies the state of a project's config files: (mtime_ns, size) for
+# each of CONFIG_FILENAMES, or None where the file does not exist
+_ConfigStamp = tuple[tuple[int, int] | None, ...]
+
+_config_cache: dict[str, tuple[_ConfigStamp, OutputValidationConfig]] = {}
+
+
+def _config_stamp(project_dir: Path) -> _ConfigStamp:
+    """
+    Stat the candidate config files of a project.
+
+    A config file that is created, edited or removed changes the stamp,
+    so cached configs are reloaded without clear_config_cache().
+
+    Args:
+        project_dir: Resolved root directory of the project
+
+    Returns:
+        Stamp of the project's config files
+    """
+    config_dir = project_dir / AUTO_CLAUDE_DIR
+    stamp = []
+    for filename in CONFIG_FILENAMES:
+        try:
+            st = os.stat(config_dir / filename)
+        except OSError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
 
 
 def load_validation_config(project_dir: Path) -> OutputValidationConfig:
@@ -403,7 +452,8 @@ def load_validation_config(project_dir: Path) -> OutputValidationConfig:
     Load validation configuration for a project.
 
     Configuration is loaded from .auto-claude/output-validation.{json,yaml,yml}
-    and merged with defaults. Results are cached by project directory.
+    and merged with defaults. Results are cached by project directory
+    and reloaded when a config file is created, modified or removed.
 
     Args:
         project_dir: Root directory of the project
@@ -416,17 +466,19 @@ def load_validation_config(project_dir: Path) -> OutputValidationConfig:
     """
     project_dir = Path(project_dir).resolve()
     cache_key = str(project_dir)
+    stamp = _config_stamp(project_dir)
 
     # Check cache
-    if cache_key in _config_cache:
-        return _config_cache[cache_key]
+    cached = _config_cache.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
 
     # Load config
     loader = ValidationConfigLoader(project_dir)
     config = loader.load()
 
     # Cache result
-    _config_cache[cache_key] = config
+    _config_cache[cache_key] = (stamp, config)
     return config
 
 
@@ -444,7 +496,8 @@ def get_validation_config(project_dir: Path) -> OutputValidationConfig | None:
     """
     project_dir = Path(project_dir).resolve()
     cache_key = str(project_dir)
-    return _config_cache.get(cache_key)
+    cached = _config_cache.get(cache_key)
+    return cached[1] if cached is not None else None
 
 
 def clear_config_cache(project_dir: Path | None = None) -> None:
@@ -41,9 +41,17 @@ Usage:
 """
 
 import re
+import sys
 from pathlib import Path
 from typing import List, Literal, Optional, Union
 
+# The regex parser moved to re._parser in Python 3.11 (same fallback as
+# pattern_detector.py)
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python 3.10
+    import sre_parse
+
 from .config import OutputValidationConfig
 from .models import (
     RulePriority,
@@ -52,6 +60,22 @@ from .models import (
     ValidationRule,
 )
 
+# Rank of each priority when ordering merged rules (P0 first)
+_PRIORITY_ORDER: dict[RulePriority, int] = {
+    RulePriority.P0: 0,
+    RulePriority.P1: 1,
+    RulePriority.P2: 2,
+    RulePriority.P3: 3,
+}
+
+# Rank of each severity for min_severity filtering (LOW lowest)
+_SEVERITY_ORDER: dict[SeverityLevel, int] = {
+    SeverityLevel.LOW: 0,
+    SeverityLevel.MEDIUM: 1,
+    SeverityLevel.HIGH: 2,
+    SeverityLevel.CRITICAL: 3,
+}
+
 
 # =============================================================================
 # EXCEPTIONS
@@ -102,6 +126,58 @@ DANGEROUS_REGEX_DESCRIPTIONS = [
     "evil regex pattern (known ReDoS vulnerability)",
 ]
 
+# Possessive repeats and atomic groups are new in Python 3.11
+_REPEAT_OPS = tuple(
+    op
+    for op in (
+        sre_parse.MAX_REPEAT,
+        sre_parse.MIN_REPEAT,
+        getattr(sre_parse, "POSSESSIVE_REPEAT", None),
+    )
+    if op is not None
+)
+_ATOMIC_GROUP = getattr(sre_parse, "ATOMIC_GROUP", None)
+
+
+def _subpatterns(op, av) -> list:
+    """Return the nested sequences of a parsed regex node."""
+    if op in _REPEAT_OPS:
+        return [av[2]]
+    if op is sre_parse.SUBPATTERN:
+        return [av[3]]
+    if op is sre_parse.BRANCH:
+        return list(av[1])
+    if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        return [av[1]]
+    if _ATOMIC_GROUP is not None and op is _ATOMIC_GROUP:
+        return [av]
+    return []
+
+
+def _has_unbounded_repeat(items) -> bool:
+    """Check whether a parsed sequence contains a `*`, `+` or `{n,}` repeat."""
+    for op, av in items:
+        if op in _REPEAT_OPS and av[1] is sre_parse.MAXREPEAT:
+            return True
+        if any(_has_unbounded_repeat(sub) for sub in _subpatterns(op, av)):
+            return True
+    return False
+
+
+def _has_nested_repeat(items) -> bool:
+    """
+    Check whether an unbounded repeat is itself repeated.
+
+    Works on the parsed pattern, so it also sees nesting hidden behind
+    alternation or extra groups, e.g. (\\w+|-)+ or ((a+))+.
+    """
+    for op, av in items:
+        if op in _REPEAT_OPS and av[1] != 1 and _has_unbounded_repeat(av[2]):
+            return True
+        if any(_has_nested_repeat(sub) for sub in _subpatterns(op, av)):
+            return True
+    return False
+
 
 def validate_pattern_safety(pattern: str, pattern_type: Literal["regex", "literal"]) -> None:
     """
@@ -171,9 +247,10 @@ def validate_pattern_safety(pattern: str, pattern_type: Literal["regex", "litera
         )
 
     # Check for (content)+ where content has quantifiers but no alternation
-    # This catches (a+)+, (b*)* but not (a|b)+ which is caught above
+    # This catches (a+)+, (b*)* but not (a|b)+ which is caught above; the
+    # parsed-pattern check also catches nesting behind alternation or groups
     nested_paren = re.search(r"\(([^|*)]+[*+?{]+)\)[*+?{]", pattern)
-    if nested_paren:
+    if nested_paren or _has_nested_repeat(sre_parse.parse(pattern)):
         raise CustomRuleError(
             f"Pattern contains nested quantifiers which can cause catastrophic backtracking. "
             f"Consider simplifying the pattern.",
@@ -235,6 +312,11 @@ def load_custom_rules(
     """
     custom_rules = []
 
+    # One string object per distinct message/suggestion text: rules in a
+    # config often repeat the same advice, and parsed YAML/JSON gives every
+    # occurrence its own copy
+    text_pool: dict[str, str] = {}
+
     for i, rule_dict in enumerate(config.custom_rules):
         try:
             # Validate required fields
@@ -325,12 +407,20 @@ def load_custom_rules(
                     rule_id=rule_id,
                     field="context"
                 )
+            # Interned like category (below): the detector compares the
+            # context of every rule it evaluates
+            context = sys.intern(context)
 
             # Extract optional fields
             message = rule_dict.get("message", "")
             suggestions = rule_dict.get("suggestions", [])
             enabled = rule_dict.get("enabled", True)
             category = rule_dict.get("category", "custom")
+            if isinstance(category, str):
+                # Share one string per category name, like the literals
+                # used by the default rules, so comparisons and grouping
+                # by category short-circuit on identity
+                category = sys.intern(category)
 
             # Validate suggestions is a list
             if not isinstance(suggestions, list):
@@ -340,6 +430,13 @@ def load_custom_rules(
                     field="suggestions"
                 )
 
+            if isinstance(message, str):
+                message = text_pool.setdefault(message, message)
+            suggestions = [
+                text_pool.setdefault(text, text) if isinstance(text, str) else text
+                for text in suggestions
+            ]
+
             # Create ValidationRule object
             rule = ValidationRule(
                 rule_id=rule_id,
@@ -435,15 +532,8 @@ def merge_with_defaults(
     )
 
     # Sort by priority and category for consistent ordering
-    priority_order = {
-        RulePriority.P0: 0,
-        RulePriority.P1: 1,
-        RulePriority.P2: 2,
-        RulePriority.P3: 3,
-    }
-
     merged_rules.sort(
-        key=lambda r: (priority_order.get(r.priority, 99), r.category, r.rule_id)
+        key=lambda r: (_PRIORITY_ORDER.get(r.priority, 99), r.category, r.rule_id)
     )
 
     return merged_rules
@@ -544,13 +634,9 @@ def get_active_rules(
 
     # Filter by severity
     if min_severity:
-        severity_order = {
-            SeverityLevel.LOW: 0,
-            SeverityLevel.MEDIUM: 1,
-            SeverityLevel.HIGH: 2,
-            SeverityLevel.CRITICAL: 3,
-        }
-        min_level = severity_order[min_severity]
-        filtered = [r for r in filtered if severity_order.get(r.severity, 0) >= min_level]
+        min_level = _SEVERITY_ORDER[min_severity]
+        filtered = [
+            r for r in filtered if _SEVERITY_ORDER.get(r.severity, 0) >= min_level
+        ]
 
     return filtered
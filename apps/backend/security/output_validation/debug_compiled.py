@@ -10,6 +10,7 @@ from security.output_validation.rules import get_default_rules
 detector = create_pattern_detector()
 all_rules = get_default_rules()
 detector.add_rules(all_rules)
+detector.precompile_all()
 
 # Check compiled patterns
 print("=== Checking compiled patterns ===\n")
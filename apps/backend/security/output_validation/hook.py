@@ -23,13 +23,13 @@ from .models import (
     ValidationResult,
 )
 from .overrides import (
-    OverrideTokenManager,
     format_file_scope,
     format_command_scope,
     list_override_tokens,
+    validate_and_use_override_token,
 )
 from .pattern_detector import create_pattern_detector
-from .rules import get_default_rules
+from .rules import ALL_DEFAULT_RULES
 
 
 # =============================================================================
@@ -49,8 +49,8 @@ def _get_detector():
     global _detector
     if _detector is None:
         _detector = create_pattern_detector()
-        # Load default rules
-        _detector.add_rules(get_default_rules())
+        # Load default rules (the shared tuple; add_rules() only reads it)
+        _detector.add_rules(ALL_DEFAULT_RULES)
     return _detector
 
 
@@ -145,8 +145,6 @@ def _check_override_tokens(
             return False, None
 
         # Try to find a token that applies to this context
-        manager = OverrideTokenManager(project_dir)
-
         for token in tokens:
             # Check if token applies to the context
             if context and not token.applies_to(context):
@@ -156,9 +154,10 @@ def _check_override_tokens(
                 continue
 
             # Token applies - use it
-            if manager.validate_and_use_token(
+            if validate_and_use_override_token(
                 token_id=token.token_id,
                 rule_id=rule_id,
+                project_dir=project_dir,
                 context=context or "",
             ):
                 logger.info(
@@ -13,11 +13,13 @@ This module provides:
 - OverrideToken: User bypass mechanism
 """
 
-from dataclasses import asdict, dataclass, field
+import math
+import time
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Literal
+from typing import Any, ClassVar, Literal
 
 
 class SeverityLevel(str, Enum):
@@ -72,11 +74,17 @@ class ToolType(str, Enum):
     WEB_SEARCH = "WebSearch"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationRule:
     """
     A validation rule that detects dangerous patterns in tool outputs.
 
+    Uses __slots__ since the detector reads rule attributes on every match.
+
+    Changing enabled or severity on a rule in place bumps _state_version,
+    so detectors drop match decisions they cached under the old values.
+    Other fields must not be changed once the rule is added to a detector.
+
     Attributes:
         rule_id: Unique identifier (e.g., "bash-rm-rf-root")
         name: Human-readable name
@@ -107,6 +115,16 @@ class ValidationRule:
     enabled: bool = True
     category: str = "general"
 
+    # Number of in-place changes to enabled or severity of any rule
+    _state_version: ClassVar[int] = 0
+
+    def __setattr__(self, name: str, value) -> None:
+        """Bump _state_version when enabled or severity changes."""
+        # Unset while __init__ assigns the fields, so construction never bumps
+        if name in _RULE_STATE_FIELDS and getattr(self, name, value) != value:
+            ValidationRule._state_version += 1
+        object.__setattr__(self, name, value)
+
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
         return {
@@ -154,11 +172,17 @@ class ValidationRule:
         )
 
 
-@dataclass
+# Rule fields the detector reads on every match rather than indexing
+_RULE_STATE_FIELDS = frozenset({"enabled", "severity"})
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """
     Result of validating a tool call against a rule.
 
+    Uses __slots__ since one is created for every validated tool call.
+
     Attributes:
         is_blocked: Whether the operation should be blocked
         rule_id: ID of the rule that triggered (if any)
@@ -290,16 +314,17 @@ class OutputValidationConfig:
         return rule_id in self.disabled_rules
 
 
-@dataclass
+@dataclass(slots=True)
 class OverrideToken:
     """
     Token that allows bypassing specific validation rules.
 
     Generated by users to temporarily allow operations that would
-    normally be blocked.
+    normally be blocked. Uses __slots__ since many tokens may be loaded
+    at once.
 
     Attributes:
-        token_id: Unique token identifier (UUID)
+        token_id: Unique token identifier
         rule_id: ID of the rule this token overrides
         scope: Scope of override ("all", "file:/path/to/file", "command:pattern")
         created_at: Timestamp when token was created
@@ -319,25 +344,102 @@ class OverrideToken:
     use_count: int = 0
     reason: str = ""
     creator: str = "user"
+    # (expires_at, epoch) pair so is_valid() avoids re-parsing the timestamp
+    _expiry_cache: tuple[str, float] = field(
+        default=("", math.inf), init=False, repr=False, compare=False
+    )
+    # JSON form reused across saves; dropped whenever a persisted field changes
+    _serialized: dict | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # TokenStorage holding this token, told when expiry or usage changes in
+    # place so its cleanup index stays current
+    _storage: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        """
+        Invalidate the cached serialized form when a field changes.
+
+        Changes to expires_at, max_uses or use_count are also reported to
+        the owning TokenStorage, if any.
+        """
+        object.__setattr__(self, name, value)
+        if name in _OVERRIDE_TOKEN_FIELDS:
+            object.__setattr__(self, "_serialized", None)
+            if name in _CLEANUP_FIELDS:
+                # Not set yet while __init__ assigns the fields
+                storage = getattr(self, "_storage", None)
+                if storage is not None:
+                    storage._token_changed(self, name)
 
     def __post_init__(self):
         """Set created_at if not provided."""
         if not self.created_at:
             self.created_at = datetime.now(timezone.utc).isoformat()
 
+    @property
+    def expires_epoch(self) -> float:
+        """
+        Expiry as a POSIX timestamp.
+
+        Parsed once per distinct expires_at value. Returns math.inf when
+        the token never expires and -math.inf when expires_at is invalid
+        (treated as already expired).
+        """
+        source, epoch = self._expiry_cache
+        if source != self.expires_at:
+            if not self.expires_at:
+                epoch = math.inf
+            else:
+                try:
+                    epoch = datetime.fromisoformat(self.expires_at).timestamp()
+                except ValueError:
+                    # Invalid expiry format - treat as expired
+                    epoch = -math.inf
+            self._expiry_cache = (self.expires_at, epoch)
+        return epoch
+
+    def set_expires_epoch(self, epoch: float) -> None:
+        """
+        Set the expiry from a POSIX timestamp.
+
+        Formats expires_at once and primes the expiry cache with the exact
+        epoch, so is_valid() never parses the string back.
+
+        Args:
+            epoch: Expiry timestamp (math.inf for no expiry)
+        """
+        if epoch == math.inf:
+            self.expires_at = ""
+        else:
+            self.expires_at = datetime.fromtimestamp(epoch, timezone.utc).isoformat()
+        self._expiry_cache = (self.expires_at, epoch)
+
+    def serialized(self) -> dict:
+        """
+        Get the cached JSON-serializable dict.
+
+        Built once and reused until a field changes, so rewriting the
+        tokens file does not rebuild a dict per token. Treat as read-only;
+        use to_dict() for a copy that may be modified.
+        """
+        if self._serialized is None:
+            object.__setattr__(self, "_serialized", {
+                "token_id": self.token_id,
+                "rule_id": self.rule_id,
+                "scope": self.scope,
+                "created_at": self.created_at,
+                "expires_at": self.expires_at,
+                "max_uses": self.max_uses,
+                "use_count": self.use_count,
+                "reason": self.reason,
+                "creator": self.creator,
+            })
+        return self._serialized
+
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
-        return {
-            "token_id": self.token_id,
-            "rule_id": self.rule_id,
-            "scope": self.scope,
-            "created_at": self.created_at,
-            "expires_at": self.expires_at,
-            "max_uses": self.max_uses,
-            "use_count": self.use_count,
-            "reason": self.reason,
-            "creator": self.creator,
-        }
+        return dict(self.serialized())
 
     @classmethod
     def from_dict(cls, data: dict) -> "OverrideToken":
@@ -354,23 +456,22 @@ class OverrideToken:
             creator=data.get("creator", "user"),
         )
 
-    def is_valid(self) -> bool:
-        """Check if token is still valid (not expired or used up)."""
+    def is_valid(self, now: float | None = None) -> bool:
+        """
+        Check if token is still valid (not expired or used up).
+
+        Args:
+            now: Current POSIX timestamp; pass it when checking many tokens
+                 to read the clock once
+        """
         # Check usage count
         if self.max_uses > 0 and self.use_count >= self.max_uses:
             return False
 
         # Check expiry
-        if self.expires_at:
-            try:
-                expires = datetime.fromisoformat(self.expires_at)
-                if datetime.now(timezone.utc) > expires:
-                    return False
-            except ValueError:
-                # Invalid expiry format - treat as expired
-                return False
-
-        return True
+        if now is None:
+            now = time.time()
+        return now <= self.expires_epoch
 
     def applies_to(self, context: str) -> bool:
         """Check if token applies to a given context."""
@@ -392,6 +493,14 @@ class OverrideToken:
         return True
 
 
+_OVERRIDE_TOKEN_FIELDS = frozenset(
+    f.name for f in fields(OverrideToken) if not f.name.startswith("_")
+)
+
+# Fields that decide when TokenStorage.cleanup_expired() removes a token
+_CLEANUP_FIELDS = frozenset({"expires_at", "max_uses", "use_count"})
+
+
 @dataclass
 class ValidationEvent:
     """
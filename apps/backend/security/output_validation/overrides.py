@@ -57,13 +57,36 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
+import base64
+import heapq
 import json
 import logging
-import uuid
-from datetime import datetime, timezone, timedelta
+import math
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Literal, Optional
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Optional fast JSON support (follows the optional-YAML pattern in config.py)
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .models import OverrideToken
 
 
@@ -81,7 +104,188 @@ logger = logging.getLogger(__name__)
 DEFAULT_EXPIRY_MINUTES = 60
 DEFAULT_MAX_USES = 1
 TOKENS_FILENAME = "override-tokens.json"
+LOCK_FILENAME = "override-tokens.json.lock"
 AUTO_CLAUDE_DIR = ".auto-claude"
+TOKEN_ID_BYTES = 16
+
+# Current ids are unpadded lowercase base32 (26 chars); tokens created
+# before that used UUID4 strings, which remain valid
+TOKEN_ID_PATTERN = re.compile(
+    r"^(?:[a-z2-7]{26}"
+    r"|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$"
+)
+
+
+# =============================================================================
+# PATH CACHES
+# =============================================================================
+
+# Absolute project paths -> resolved paths, so repeated convenience calls
+# skip the realpath() syscalls
+_resolved_cache: dict[str, Path] = {}
+
+# .auto-claude directories already created in this process
+_dir_ready: set[Path] = set()
+
+
+def _resolve_project_dir(project_dir: Path) -> Path:
+    """
+    Resolve a project directory, caching results for absolute paths.
+
+    Relative paths depend on the current working directory and are
+    resolved on every call.
+
+    Args:
+        project_dir: Root directory of the project
+
+    Returns:
+        Resolved project directory
+    """
+    key = os.fspath(project_dir)
+    resolved = _resolved_cache.get(key)
+    if resolved is None:
+        resolved = Path(key).resolve()
+        if os.path.isabs(key):
+            _resolved_cache[key] = resolved
+    return resolved
+
+
+# =============================================================================
+# JSON I/O
+# =============================================================================
+
+def _read_tokens_data(tokens_file: Path) -> dict:
+    """
+    Read and parse the tokens file.
+
+    Uses orjson when available, falling back to the stdlib json module.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    handle parse errors the same way with either backend.
+
+    Args:
+        tokens_file: Path to override-tokens.json
+
+    Returns:
+        Parsed JSON document
+    """
+    if HAS_ORJSON:
+        return orjson.loads(tokens_file.read_bytes())
+
+    with open(tokens_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_tokens_data(data: dict) -> bytes:
+    """
+    Serialize the tokens document as indented, key-sorted UTF-8 JSON.
+
+    Args:
+        data: Document to serialize
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+@contextmanager
+def _exclusive_lock(lock_file: Path) -> Iterator[None]:
+    """
+    Hold an exclusive cross-process lock on a lock file.
+
+    Serializes token file writers across processes (e.g. the CLI and a
+    running agent). Uses fcntl.flock; where fcntl is unavailable (Windows)
+    writers rely on the atomic rename alone.
+
+    Args:
+        lock_file: Path of the lock file (created if missing)
+    """
+    if fcntl is None:
+        yield
+        return
+
+    fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """
+    Flush a directory entry so a completed rename survives a crash.
+
+    Directories cannot be opened for fsync on Windows; there the rename is
+    left to the filesystem's own guarantees.
+
+    Args:
+        directory: Directory containing the renamed file
+    """
+    if os.name == "nt":
+        return
+
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+# =============================================================================
+# PENDING WRITES
+# =============================================================================
+
+# Storages with unsaved mutations. Held strongly so nothing is lost before
+# the atexit flush; entries are discarded as soon as they are saved.
+_dirty_storages: set[TokenStorage] = set()
+
+
+def _flush_dirty_storages() -> None:
+    """Save every storage that still has unsaved mutations."""
+    for storage in list(_dirty_storages):
+        # The project may have been removed (e.g. a temp dir) since the edit
+        if storage.tokens_file.parent.is_dir():
+            storage.save_tokens()
+
+
+atexit.register(_flush_dirty_storages)
+
+
+# =============================================================================
+# TOKEN IDS
+# =============================================================================
+
+def new_token_id() -> str:
+    """
+    Generate a random token identifier.
+
+    128 bits from os.urandom encoded as unpadded lowercase base32, which
+    never starts with "-" (safe as a CLI argument) and is shorter than a
+    formatted UUID.
+
+    Returns:
+        26-character token id
+    """
+    raw = base64.b32encode(os.urandom(TOKEN_ID_BYTES))
+    return raw.decode("ascii").rstrip("=").lower()
+
+
+def is_token_id(token_id: str) -> bool:
+    """
+    Check whether a string looks like a token id.
+
+    Args:
+        token_id: Candidate token id
+
+    Returns:
+        True for new_token_id() output or a legacy UUID token id
+    """
+    return TOKEN_ID_PATTERN.match(token_id) is not None
 
 
 # =============================================================================
@@ -156,6 +360,12 @@ class TokenStorage:
     Manages reading and writing tokens to .auto-claude/override-tokens.json.
     Provides thread-safe access and automatic cleanup of expired tokens.
 
+    Mutations only mark the storage as dirty; the file is rewritten once on
+    the next save_tokens() call (or at interpreter exit), so a burst of
+    changes costs a single serialization. If another process saved the
+    file in the meantime, its changes are merged in under the file lock
+    before writing, so a stale in-memory view never overwrites them.
+
     Attributes:
         tokens_file: Path to the tokens JSON file
         tokens: Dict mapping token_id -> OverrideToken
@@ -178,6 +388,22 @@ class TokenStorage:
         self.project_dir = Path(project_dir).resolve()
         self.tokens_file = self._get_tokens_file()
         self.tokens: dict[str, OverrideToken] = {}
+        # Whether self.tokens reflects the file as last loaded or saved; an
+        # empty dict alone can't tell an unloaded storage from an empty file
+        self._loaded = False
+        self._dirty = False
+        self._synced_signature: tuple[int, int, int] | None = None
+        # Token ids in the file as of the last load/save; the base for
+        # merging changes another process saved in the meantime
+        self._synced_ids: set[str] = set()
+        # Cleanup index: min-heap of (expires_epoch, token_id) plus the ids
+        # of tokens that ran out of uses or whose expiry or limits changed
+        # in place. Entries may be stale (revoked or already removed
+        # tokens) and are re-checked when consumed.
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._recheck_ids: set[str] = set()
+        # Inverted index rule_id -> token ids, kept exact (no stale entries)
+        self._by_rule: defaultdict[str, set[str]] = defaultdict(set)
 
     def _get_tokens_file(self) -> Path:
         """
@@ -189,7 +415,9 @@ class TokenStorage:
             Path to override-tokens.json
         """
         auto_claude_dir = self.project_dir / AUTO_CLAUDE_DIR
-        auto_claude_dir.mkdir(parents=True, exist_ok=True)
+        if auto_claude_dir not in _dir_ready:
+            auto_claude_dir.mkdir(parents=True, exist_ok=True)
+            _dir_ready.add(auto_claude_dir)
         return auto_claude_dir / TOKENS_FILENAME
 
     def load_tokens(self, include_invalid: bool = False) -> dict[str, OverrideToken]:
@@ -202,80 +430,288 @@ class TokenStorage:
         Returns:
             Dict mapping token_id -> OverrideToken
         """
-        if not self.tokens_file.exists():
-            logger.debug(f"Tokens file does not exist: {self.tokens_file}")
-            return {}
+        # Don't let a reload discard mutations that were never written
+        if self._dirty:
+            self.save_tokens()
+
+        self._synced_signature = self._file_signature()
+        if self._synced_signature is None:
+            logger.debug("Tokens file does not exist: %s", self.tokens_file)
+            # Deleting the file revokes every token it held
+            self.tokens = {}
+            self._synced_ids = set()
+            self._rebuild_cleanup_index()
+            self._rebuild_rule_index()
+            self._loaded = True
+            return self.tokens
 
         try:
-            with open(self.tokens_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_tokens_data(self.tokens_file)
 
             # Parse tokens
             tokens = {}
+            synced_ids = set()
             skipped_count = 0
+            now = time.time()
+            debug = logger.isEnabledFor(logging.DEBUG)
 
             for token_data in data.get("tokens", []):
                 token = OverrideToken.from_dict(token_data)
+                synced_ids.add(token.token_id)
 
                 # Skip expired or exhausted tokens (unless include_invalid is True)
-                if not include_invalid and not token.is_valid():
-                    logger.debug(
-                        f"Skipping expired/exhausted token: {token.token_id}"
-                    )
+                if not include_invalid and not token.is_valid(now):
+                    if debug:
+                        logger.debug(
+                            "Skipping expired/exhausted token: %s", token.token_id
+                        )
                     skipped_count += 1
                     continue
 
+                token._storage = self
                 tokens[token.token_id] = token
 
             self.tokens = tokens
+            self._synced_ids = synced_ids
+            self._rebuild_cleanup_index()
+            self._rebuild_rule_index()
+            self._loaded = True
             logger.info(
-                f"Loaded {len(tokens)} override tokens "
-                f"({skipped_count} skipped)"
+                "Loaded %d override tokens (%d skipped)",
+                len(tokens),
+                skipped_count,
             )
 
             return tokens
 
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse tokens file: {e}")
+            logger.error("Failed to parse tokens file: %s", e)
             return {}
         except Exception as e:
-            logger.error(f"Error loading tokens: {e}")
+            logger.error("Error loading tokens: %s", e)
             return {}
 
+    def _file_signature(self) -> tuple[int, int, int] | None:
+        """
+        Get a cheap change signature for the tokens file.
+
+        Writers always replace the file via rename, so the inode changes on
+        every save; combined with mtime and size this catches updates even
+        on filesystems with coarse timestamps.
+
+        Returns:
+            (st_ino, st_mtime_ns, st_size), or None if the file is missing
+        """
+        try:
+            st = os.stat(self.tokens_file)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def is_stale(self) -> bool:
+        """
+        Check whether the tokens file changed since it was last read/written.
+
+        Lets long-lived instances pick up tokens created by other processes
+        (e.g. the CLI) without re-parsing the file on every call.
+
+        Returns:
+            True if the on-disk file differs from the in-memory view
+        """
+        return self._file_signature() != self._synced_signature
+
+    @property
+    def dirty(self) -> bool:
+        """Whether there are mutations not yet written to disk."""
+        return self._dirty
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the tokens were loaded from (or saved to) the file."""
+        return self._loaded
+
+    def mark_dirty(self) -> None:
+        """Record that tokens changed and must be written on next save."""
+        self._dirty = True
+        _dirty_storages.add(self)
+
     def save_tokens(self) -> bool:
         """
         Save tokens to file.
 
+        Does nothing if no mutation happened since the last save.
+
         Returns:
-            True if successful, False otherwise
+            True if successful (or nothing to save), False otherwise
         """
+        if not self._dirty:
+            return True
+
         try:
-            # Convert tokens to dict
-            tokens_data = [
-                token.to_dict() for token in self.tokens.values()
-            ]
-
-            # Write to file with atomic update
-            temp_file = self.tokens_file.with_suffix(".tmp")
-
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    {"tokens": tokens_data},
-                    f,
-                    indent=2,
-                    sort_keys=True,
+            # The directory may have been removed since it was first created
+            tokens_dir = self.tokens_file.parent
+            tokens_dir.mkdir(parents=True, exist_ok=True)
+
+            # Write to file with atomic update. The temp file gets a unique
+            # name (created O_CREAT|O_EXCL) in the same directory, so
+            # concurrent savers never share it and the rename stays on one
+            # filesystem. fsync before the rename so the new contents are
+            # on disk when the rename becomes visible; batching (see
+            # mark_dirty) keeps this to one fsync per flush. The lock keeps
+            # writers in other processes from interleaving with ours, and
+            # anything they saved since our last sync is merged in before
+            # the payload is built.
+            with _exclusive_lock(tokens_dir / LOCK_FILENAME):
+                if self.is_stale():
+                    self._merge_from_disk()
+
+                tokens_data = [
+                    token.serialized() for token in self.tokens.values()
+                ]
+                payload = _dump_tokens_data({"tokens": tokens_data})
+
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=tokens_dir,
+                    prefix=".override-tokens.",
+                    suffix=".tmp",
                 )
-
-            # Atomic rename
-            temp_file.replace(self.tokens_file)
-
-            logger.debug(f"Saved {len(tokens_data)} tokens to {self.tokens_file}")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(payload)
+                        f.flush()
+                        os.fsync(f.fileno())
+
+                    # Atomic rename
+                    os.replace(tmp_path, self.tokens_file)
+                except Exception:
+                    # Clean up temp file on failure
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                    raise
+
+                _fsync_dir(tokens_dir)
+
+                self._synced_signature = self._file_signature()
+                self._synced_ids = set(self.tokens)
+            self._loaded = True
+            self._dirty = False
+            _dirty_storages.discard(self)
+
+            logger.debug("Saved %d tokens to %s", len(tokens_data), self.tokens_file)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to save tokens: {e}")
+            logger.error("Failed to save tokens: %s", e)
             return False
 
+    def _merge_from_disk(self) -> None:
+        """
+        Merge changes another process saved since the last load/save.
+
+        Called with the file lock held, right before writing. Tokens added
+        or removed here since the last sync keep this side's change; tokens
+        the other process added or removed keep its change. A token held
+        on both sides keeps the in-memory copy with the larger use count,
+        so no recorded use is lost.
+        """
+        try:
+            data = _read_tokens_data(self.tokens_file)
+        except FileNotFoundError:
+            # Deleted behind our back, which revokes every saved token
+            data = {}
+        except (OSError, ValueError) as e:
+            logger.warning("Not merging unreadable tokens file: %s", e)
+            return
+
+        on_disk = {
+            token_data["token_id"]: token_data
+            for token_data in data.get("tokens", [])
+        }
+        merged: dict[str, OverrideToken] = {}
+        for token_id, token_data in on_disk.items():
+            token = self.tokens.get(token_id)
+            if token is None:
+                if token_id in self._synced_ids:
+                    # Removed here
+                    continue
+                # Added by the other process
+                token = OverrideToken.from_dict(token_data)
+                token._storage = self
+            elif token_data.get("use_count", 0) > token.use_count:
+                token.use_count = token_data["use_count"]
+            merged[token_id] = token
+
+        for token_id, token in self.tokens.items():
+            if token_id in merged:
+                continue
+            if token_id not in self._synced_ids:
+                # Added here
+                merged[token_id] = token
+            elif token._storage is self:
+                # Removed by the other process
+                token._storage = None
+
+        logger.debug("Merged token changes saved by another process")
+        self.tokens = merged
+        self._rebuild_cleanup_index()
+        self._rebuild_rule_index()
+
+    def _index_token(self, token: OverrideToken) -> None:
+        """Register a token with the cleanup index."""
+        if token.expires_epoch != math.inf:
+            heapq.heappush(self._expiry_heap, (token.expires_epoch, token.token_id))
+        if token.max_uses > 0 and token.use_count >= token.max_uses:
+            self._recheck_ids.add(token.token_id)
+
+    def _token_changed(self, token: OverrideToken, name: str) -> None:
+        """
+        Queue a stored token for the next cleanup after an in-place change.
+
+        Called by OverrideToken when expires_at, max_uses or use_count is
+        assigned, so cleanup_expired() sees the new expiry or limits.
+
+        Args:
+            token: Token that changed
+            name: Name of the changed field
+        """
+        if self.tokens.get(token.token_id) is not token:
+            return
+        if name == "use_count" and not (0 < token.max_uses <= token.use_count):
+            # Only running out of uses matters to cleanup
+            return
+        self._recheck_ids.add(token.token_id)
+
+    def _rebuild_cleanup_index(self) -> None:
+        """Rebuild the cleanup index from the current tokens."""
+        self._expiry_heap = [
+            (token.expires_epoch, token_id)
+            for token_id, token in self.tokens.items()
+            if token.expires_epoch != math.inf
+        ]
+        heapq.heapify(self._expiry_heap)
+        self._recheck_ids = {
+            token_id
+            for token_id, token in self.tokens.items()
+            if token.max_uses > 0 and token.use_count >= token.max_uses
+        }
+
+    def _rebuild_rule_index(self) -> None:
+        """Rebuild the rule_id -> token ids index from the current tokens."""
+        self._by_rule = defaultdict(set)
+        for token_id, token in self.tokens.items():
+            self._by_rule[token.rule_id].add(token_id)
+
+    def _discard_token(self, token_id: str) -> None:
+        """Delete a stored token and drop it from the rule index."""
+        token = self.tokens.pop(token_id)
+        if token._storage is self:
+            token._storage = None
+        rule_tokens = self._by_rule.get(token.rule_id)
+        if rule_tokens is not None:
+            rule_tokens.discard(token_id)
+            if not rule_tokens:
+                del self._by_rule[token.rule_id]
+
     def add_token(self, token: OverrideToken) -> None:
         """
         Add a token to storage.
@@ -283,8 +719,15 @@ class TokenStorage:
         Args:
             token: Token to add
         """
+        if token.token_id in self.tokens:
+            # Replacing a token (possibly under another rule)
+            self._discard_token(token.token_id)
         self.tokens[token.token_id] = token
-        logger.debug(f"Added token: {token.token_id}")
+        token._storage = self
+        self._by_rule[token.rule_id].add(token.token_id)
+        self._index_token(token)
+        self.mark_dirty()
+        logger.debug("Added token: %s", token.token_id)
 
     def get_token(self, token_id: str) -> OverrideToken | None:
         """
@@ -303,6 +746,58 @@ class TokenStorage:
 
         return None
 
+    def get_token_lazy(self, token_id: str) -> OverrideToken | None:
+        """
+        Get a token by ID without loading the whole tokens file.
+
+        If the in-memory view is current it is used directly. Unsaved
+        changes are first saved if another process changed the file since,
+        which merges in its changes (e.g. a revocation). Otherwise the file
+        is scanned for the matching entry and only that one token is
+        constructed; storage state is left untouched.
+
+        Args:
+            token_id: Token identifier
+
+        Returns:
+            OverrideToken if found and valid, None otherwise
+        """
+        if self._dirty and self.is_stale():
+            self.save_tokens()
+        # Memory is current, or holds changes that could not be saved
+        if self._dirty or (self._loaded and not self.is_stale()):
+            return self.get_token(token_id)
+
+        if not self.tokens_file.exists():
+            return None
+
+        try:
+            data = _read_tokens_data(self.tokens_file)
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse tokens file: %s", e)
+            return None
+        except Exception as e:
+            logger.error("Error loading tokens: %s", e)
+            return None
+
+        for token_data in data.get("tokens", []):
+            if token_data.get("token_id") == token_id:
+                token = OverrideToken.from_dict(token_data)
+                return token if token.is_valid() else None
+
+        return None
+
+    def record_use(self, token: OverrideToken) -> None:
+        """
+        Record that a stored token was used.
+
+        Args:
+            token: Token whose use_count was incremented
+        """
+        if token.max_uses > 0 and token.use_count >= token.max_uses:
+            self._recheck_ids.add(token.token_id)
+        self.mark_dirty()
+
     def remove_token(self, token_id: str) -> bool:
         """
         Remove a token from storage.
@@ -314,8 +809,9 @@ class TokenStorage:
             True if token was removed, False if not found
         """
         if token_id in self.tokens:
-            del self.tokens[token_id]
-            logger.debug(f"Removed token: {token_id}")
+            self._discard_token(token_id)
+            self.mark_dirty()
+            logger.debug("Removed token: %s", token_id)
             return True
 
         return False
@@ -324,25 +820,56 @@ class TokenStorage:
         """
         Remove expired and exhausted tokens.
 
+        Only candidates from the cleanup index are examined: tokens whose
+        expiry has passed (popped off the heap), tokens that used up their
+        uses and tokens whose expires_at or max_uses changed in place
+        (reported by the token itself). This is O(k log N) for k
+        candidates instead of a scan of every stored token.
+
         Returns:
             Number of tokens cleaned up
         """
         cleanup_count = 0
-        expired_tokens = []
-
-        for token_id, token in self.tokens.items():
-            if not token.is_valid():
-                expired_tokens.append(token_id)
-
-        for token_id in expired_tokens:
-            del self.tokens[token_id]
+        now = time.time()
+
+        candidates = self._recheck_ids
+        self._recheck_ids = set()
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            candidates.add(heapq.heappop(heap)[1])
+
+        for token_id in candidates:
+            token = self.tokens.get(token_id)
+            if token is None:
+                # Stale entry for a token that was already removed
+                continue
+
+            if token.is_valid(now):
+                # Expiry or max_uses changed after indexing; re-index it
+                self._index_token(token)
+                continue
+
+            self._discard_token(token_id)
             cleanup_count += 1
 
         if cleanup_count > 0:
-            logger.info(f"Cleaned up {cleanup_count} expired tokens")
+            self.mark_dirty()
+            logger.info("Cleaned up %d expired tokens", cleanup_count)
 
         return cleanup_count
 
+    def tokens_for_rule(self, rule_id: str) -> list[OverrideToken]:
+        """
+        Get all stored tokens for a rule, valid or not.
+
+        Args:
+            rule_id: Rule ID to look up
+
+        Returns:
+            List of OverrideToken objects for the rule
+        """
+        return [self.tokens[tid] for tid in self._by_rule.get(rule_id, ())]
+
     def list_tokens(
         self,
         rule_id: str | None = None,
@@ -350,21 +877,20 @@ class TokenStorage:
         """
         List all valid tokens, optionally filtered by rule_id.
 
+        Filtering by rule_id uses the rule index, so only that rule's
+        tokens are examined.
+
         Args:
             rule_id: Optional rule ID to filter by
 
         Returns:
             List of valid OverrideToken objects
         """
-        tokens = [
-            token for token in self.tokens.values()
-            if token.is_valid()
-        ]
-
-        if rule_id:
-            tokens = [t for t in tokens if t.rule_id == rule_id]
-
-        return tokens
+        now = time.time()
+        candidates = (
+            self.tokens_for_rule(rule_id) if rule_id else self.tokens.values()
+        )
+        return [token for token in candidates if token.is_valid(now)]
 
 
 # =============================================================================
@@ -379,6 +905,9 @@ class OverrideTokenManager:
     and revoking override tokens. It handles persistence, cleanup, and
     validation logic.
 
+    Mutating methods do not write to disk themselves; call flush() to
+    persist a batch of changes (pending changes are also flushed at exit).
+
     Attributes:
         project_dir: Root directory of the project
         storage: TokenStorage instance for persistence
@@ -417,10 +946,19 @@ class OverrideTokenManager:
         self.storage = TokenStorage(self.project_dir)
 
     def _ensure_loaded(self) -> None:
-        """Ensure tokens are loaded from storage."""
-        if not self.storage.tokens:
+        """Ensure tokens are loaded and in sync with storage."""
+        if not self.storage.loaded or self.storage.is_stale():
             self.storage.load_tokens()
 
+    def flush(self) -> bool:
+        """
+        Write pending token changes to disk.
+
+        Returns:
+            True if successful (or nothing to write), False otherwise
+        """
+        return self.storage.save_tokens()
+
     def generate_token(
         self,
         rule_id: str,
@@ -457,35 +995,34 @@ class OverrideTokenManager:
         if max_uses < 0:
             raise ValueError("max_uses must be >= 0")
 
-        # Calculate expiry
-        expires_at = ""
-        if expiry_minutes > 0:
-            expiry_time = datetime.now(timezone.utc) + timedelta(
-                minutes=expiry_minutes
-            )
-            expires_at = expiry_time.isoformat()
-
         # Create token
         token = OverrideToken(
-            token_id=str(uuid.uuid4()),
+            token_id=new_token_id(),
             rule_id=rule_id,
             scope=scope,
-            expires_at=expires_at,
             max_uses=max_uses,
             use_count=0,
             reason=reason,
             creator=creator,
         )
 
+        # Set expiry from epoch math; the token keeps the epoch so it never
+        # has to parse its own expires_at back
+        if expiry_minutes > 0:
+            token.set_expires_epoch(time.time() + expiry_minutes * 60)
+
         # Save to storage
         self._ensure_loaded()
         self.storage.add_token(token)
-        self.storage.save_tokens()
 
         logger.info(
-            f"Generated override token: {token.token_id} "
-            f"for rule {rule_id}, scope={scope}, "
-            f"expires={expiry_minutes}min, max_uses={max_uses}"
+            "Generated override token: %s for rule %s, scope=%s, "
+            "expires=%smin, max_uses=%s",
+            token.token_id,
+            rule_id,
+            scope,
+            expiry_minutes,
+            max_uses,
         )
 
         return token
@@ -507,31 +1044,52 @@ class OverrideTokenManager:
         Returns:
             True if token is valid and applies, False otherwise
         """
-        self._ensure_loaded()
+        # Read-only check: no need to materialize every token
+        token = self.storage.get_token_lazy(token_id)
 
-        token = self.storage.get_token(token_id)
+        return self._token_applies(token, token_id, rule_id, context)
 
+    def _token_applies(
+        self,
+        token: OverrideToken | None,
+        token_id: str,
+        rule_id: str,
+        context: str,
+    ) -> bool:
+        """
+        Check a looked-up token against a rule and context.
+
+        Args:
+            token: Token returned by storage (None if missing or invalid)
+            token_id: Token identifier (for logging)
+            rule_id: Rule ID that the token should override
+            context: Context string (e.g., "file:/path" or "command:pattern")
+
+        Returns:
+            True if token is valid and applies, False otherwise
+        """
         if not token:
-            logger.debug(f"Token not found or invalid: {token_id}")
+            logger.debug("Token not found or invalid: %s", token_id)
             return False
 
         # Check rule ID match
         if token.rule_id != rule_id:
             logger.debug(
-                f"Token {token_id} is for rule {token.rule_id}, "
-                f"not {rule_id}"
+                "Token %s is for rule %s, not %s", token_id, token.rule_id, rule_id
             )
             return False
 
         # Check scope
         if context and not token.applies_to(context):
             logger.debug(
-                f"Token {token_id} scope ({token.scope}) "
-                f"does not match context ({context})"
+                "Token %s scope (%s) does not match context (%s)",
+                token_id,
+                token.scope,
+                context,
             )
             return False
 
-        logger.debug(f"Token {token_id} is valid for {rule_id}")
+        logger.debug("Token %s is valid for %s", token_id, rule_id)
         return True
 
     def use_token(
@@ -556,17 +1114,32 @@ class OverrideTokenManager:
         if not token:
             return False
 
-        # Increment usage count
+        return self._consume(token, token_id, context)
+
+    def _consume(self, token: OverrideToken, token_id: str, context: str) -> bool:
+        """
+        Increment a stored token's usage count and record it.
+
+        Args:
+            token: Token held by storage
+            token_id: Token identifier (for logging)
+            context: Context string for logging
+
+        Returns:
+            True if token was used, False if exhausted/invalid
+        """
         if token.use_token():
-            self.storage.save_tokens()
+            self.storage.record_use(token)
             logger.info(
-                f"Used override token: {token_id}, "
-                f"context={context}, "
-                f"use_count={token.use_count}/{token.max_uses}"
+                "Used override token: %s, context=%s, use_count=%d/%d",
+                token_id,
+                context,
+                token.use_count,
+                token.max_uses,
             )
             return True
 
-        logger.debug(f"Token {token_id} is exhausted")
+        logger.debug("Token %s is exhausted", token_id)
         return False
 
     def validate_and_use_token(
@@ -580,6 +1153,7 @@ class OverrideTokenManager:
 
         This is the most common operation when checking overrides:
         first validate the token applies to the rule/context, then use it.
+        The token is loaded and looked up once for both steps.
 
         Args:
             token_id: Token identifier
@@ -589,10 +1163,14 @@ class OverrideTokenManager:
         Returns:
             True if token was valid and used, False otherwise
         """
-        if not self.validate_token(token_id, rule_id, context):
+        self._ensure_loaded()
+
+        token = self.storage.get_token(token_id)
+
+        if not self._token_applies(token, token_id, rule_id, context):
             return False
 
-        return self.use_token(token_id, context)
+        return self._consume(token, token_id, context)
 
     def revoke_token(self, token_id: str) -> bool:
         """
@@ -607,8 +1185,7 @@ class OverrideTokenManager:
         self._ensure_loaded()
 
         if self.storage.remove_token(token_id):
-            self.storage.save_tokens()
-            logger.info(f"Revoked override token: {token_id}")
+            logger.info("Revoked override token: %s", token_id)
             return True
 
         return False
@@ -628,23 +1205,17 @@ class OverrideTokenManager:
         Returns:
             List of OverrideToken objects
         """
-        # Force reload from disk when including expired tokens to get fresh data
-        if include_expired:
-            self.storage.load_tokens(include_invalid=True)
-        else:
+        if not include_expired:
             self._ensure_loaded()
+            return self.storage.list_tokens(rule_id=rule_id)
 
-        if include_expired:
-            # Return all tokens
-            tokens = list(self.storage.tokens.values())
-        else:
-            # Return only valid tokens
-            tokens = self.storage.list_tokens(rule_id=rule_id)
+        # Force reload from disk when including expired tokens to get fresh data
+        self.storage.load_tokens(include_invalid=True)
 
-        if rule_id and include_expired:
-            tokens = [t for t in tokens if t.rule_id == rule_id]
+        if rule_id:
+            return self.storage.tokens_for_rule(rule_id)
 
-        return tokens
+        return list(self.storage.tokens.values())
 
     def cleanup_expired(self) -> int:
         """
@@ -655,12 +1226,56 @@ class OverrideTokenManager:
         """
         self._ensure_loaded()
 
-        cleanup_count = self.storage.cleanup_expired()
+        return self.storage.cleanup_expired()
 
-        if cleanup_count > 0:
-            self.storage.save_tokens()
 
-        return cleanup_count
+# =============================================================================
+# MANAGER CACHE
+# =============================================================================
+
+_manager_cache: dict[Path, OverrideTokenManager] = {}
+_manager_cache_lock = threading.Lock()
+
+
+def _get_manager(project_dir: Path) -> OverrideTokenManager:
+    """
+    Get the cached manager for a project, creating it on first use.
+
+    Args:
+        project_dir: Root directory of the project
+
+    Returns:
+        OverrideTokenManager shared by all convenience functions
+    """
+    key = _resolve_project_dir(project_dir)
+
+    with _manager_cache_lock:
+        manager = _manager_cache.get(key)
+        if manager is None:
+            manager = OverrideTokenManager(key)
+            _manager_cache[key] = manager
+
+    return manager
+
+
+def clear_manager_cache(project_dir: Path | None = None) -> None:
+    """
+    Clear cached token managers, flushing any pending changes first.
+
+    Args:
+        project_dir: If provided, only clear cache for this project.
+                     If None, clear all cached managers.
+    """
+    with _manager_cache_lock:
+        if project_dir is None:
+            managers = list(_manager_cache.values())
+            _manager_cache.clear()
+        else:
+            manager = _manager_cache.pop(_resolve_project_dir(project_dir), None)
+            managers = [manager] if manager else []
+
+    for manager in managers:
+        manager.flush()
 
 
 # =============================================================================
@@ -679,7 +1294,8 @@ def generate_override_token(
     """
     Generate a new override token.
 
-    Convenience function that creates a manager and generates a token.
+    Convenience function that uses the cached project manager to generate
+    a token and write it to disk immediately.
 
     Args:
         rule_id: ID of the rule this token overrides
@@ -705,8 +1321,8 @@ def generate_override_token(
         >>> print(f"Token ID: {token.token_id}")
         >>> print(f"Expires: {token.expires_at}")
     """
-    manager = OverrideTokenManager(project_dir)
-    return manager.generate_token(
+    manager = _get_manager(project_dir)
+    token = manager.generate_token(
         rule_id=rule_id,
         scope=scope,
         expiry_minutes=expiry_minutes,
@@ -714,6 +1330,8 @@ def generate_override_token(
         reason=reason,
         creator=creator,
     )
+    manager.flush()
+    return token
 
 
 def validate_override_token(
@@ -725,7 +1343,7 @@ def validate_override_token(
     """
     Check if an override token is valid and applies to the given context.
 
-    Convenience function that creates a manager and validates a token.
+    Convenience function that validates a token via the cached project manager.
 
     Args:
         token_id: Token identifier
@@ -739,7 +1357,7 @@ def validate_override_token(
     Example:
         >>> from pathlib import Path
         >>> is_valid = validate_override_token(
-        ...     token_id="123e4567-e89b-12d3-a456-426614174000",
+        ...     token_id="mfrggzdfmztwq2lknnwg23tpoa",
         ...     rule_id="bash-rm-rf",
         ...     project_dir=Path("/my/project"),
         ...     context="file:/tmp/test.txt",
@@ -747,7 +1365,7 @@ def validate_override_token(
         >>> if is_valid:
         ...     print("Token is valid")
     """
-    manager = OverrideTokenManager(project_dir)
+    manager = _get_manager(project_dir)
     return manager.validate_token(token_id, rule_id, context)
 
 
@@ -759,7 +1377,7 @@ def use_override_token(
     """
     Use an override token (increment usage count).
 
-    Convenience function that creates a manager and uses a token.
+    Convenience function that uses a token via the cached project manager.
 
     Args:
         token_id: Token identifier
@@ -772,15 +1390,17 @@ def use_override_token(
     Example:
         >>> from pathlib import Path
         >>> success = use_override_token(
-        ...     token_id="123e4567-e89b-12d3-a456-426614174000",
+        ...     token_id="mfrggzdfmztwq2lknnwg23tpoa",
         ...     project_dir=Path("/my/project"),
         ...     context="file:/tmp/test.txt",
         ... )
         >>> if success:
         ...     print("Token used successfully")
     """
-    manager = OverrideTokenManager(project_dir)
-    return manager.use_token(token_id, context)
+    manager = _get_manager(project_dir)
+    used = manager.use_token(token_id, context)
+    manager.flush()
+    return used
 
 
 def validate_and_use_override_token(
@@ -807,7 +1427,7 @@ def validate_and_use_override_token(
     Example:
         >>> from pathlib import Path
         >>> if validate_and_use_override_token(
-        ...     token_id="123e4567-e89b-12d3-a456-426614174000",
+        ...     token_id="mfrggzdfmztwq2lknnwg23tpoa",
         ...     rule_id="bash-rm-rf",
         ...     project_dir=Path("/my/project"),
         ...     context="file:/tmp/test.txt",
@@ -816,8 +1436,10 @@ def validate_and_use_override_token(
         ... else:
         ...     print("Invalid or exhausted token")
     """
-    manager = OverrideTokenManager(project_dir)
-    return manager.validate_and_use_token(token_id, rule_id, context)
+    manager = _get_manager(project_dir)
+    used = manager.validate_and_use_token(token_id, rule_id, context)
+    manager.flush()
+    return used
 
 
 def revoke_override_token(
@@ -827,7 +1449,7 @@ def revoke_override_token(
     """
     Revoke an override token before it expires.
 
-    Convenience function that creates a manager and revokes a token.
+    Convenience function that revokes a token via the cached project manager.
 
     Args:
         token_id: Token identifier
@@ -839,13 +1461,15 @@ def revoke_override_token(
     Example:
         >>> from pathlib import Path
         >>> if revoke_override_token(
-        ...     token_id="123e4567-e89b-12d3-a456-426614174000",
+        ...     token_id="mfrggzdfmztwq2lknnwg23tpoa",
         ...     project_dir=Path("/my/project"),
         ... ):
         ...     print("Token revoked")
     """
-    manager = OverrideTokenManager(project_dir)
-    return manager.revoke_token(token_id)
+    manager = _get_manager(project_dir)
+    revoked = manager.revoke_token(token_id)
+    manager.flush()
+    return revoked
 
 
 def list_override_tokens(
@@ -856,7 +1480,7 @@ def list_override_tokens(
     """
     List override tokens.
 
-    Convenience function that creates a manager and lists tokens.
+    Convenience function that lists tokens via the cached project manager.
 
     Args:
         project_dir: Root directory of the project
@@ -875,7 +1499,7 @@ def list_override_tokens(
         >>> for token in tokens:
         ...     print(f"{token.token_id}: {token.scope}")
     """
-    manager = OverrideTokenManager(project_dir)
+    manager = _get_manager(project_dir)
     return manager.list_tokens(rule_id=rule_id, include_expired=include_expired)
 
 
@@ -883,7 +1507,7 @@ def cleanup_expired_tokens(project_dir: Path) -> int:
     """
     Remove expired and exhausted tokens from storage.
 
-    Convenience function that creates a manager and cleans up tokens.
+    Convenience function that cleans up tokens via the cached project manager.
 
     Args:
         project_dir: Root directory of the project
@@ -896,5 +1520,7 @@ def cleanup_expired_tokens(project_dir: Path) -> int:
         >>> count = cleanup_expired_tokens(Path("/my/project"))
         >>> print(f"Cleaned up {count} expired tokens")
     """
-    manager = OverrideTokenManager(project_dir)
-    return manager.cleanup_expired()
+    manager = _get_manager(project_dir)
+    cleanup_count = manager.cleanup_expired()
+    manager.flush()
+    return cleanup_count
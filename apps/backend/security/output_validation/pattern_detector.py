@@ -12,11 +12,946 @@ This module provides:
 - Pattern priority handling
 """
 
+import bisect
+import functools
+import hashlib
+import logging
+import os
 import re
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any
 
+# The regex parser moved to re._parser in Python 3.11; the old sre_parse
+# module still works there but warns on import
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python 3.10
+    import sre_parse
+
+# Optional Aho-Corasick support for literal patterns (follows the optional-YAML
+# pattern in config.py)
+try:
+    import ahocorasick
+
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Optional RE2 engine (google-re2): linear-time matching, immune to
+# catastrophic backtracking
+try:
+    import re2
+
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# Optional Hyperscan (python-hyperscan): multi-pattern scanning used as a
+# per-bucket prefilter, with re confirming each candidate rule
+try:
+    import hyperscan
+
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+# Supported values for PatternDetector(regex_engine=...)
+REGEX_ENGINES = ("re", "re2", "hyperscan")
+
+# Optional engines: (installed, package to install)
+_ENGINE_PACKAGES: dict[str, tuple[bool, str]] = {
+    "re2": (HAS_RE2, "google-re2"),
+    "hyperscan": (HAS_HYPERSCAN, "hyperscan"),
+}
+
+# Environment variable selecting the engine used by create_pattern_detector()
+REGEX_ENGINE_ENV_VAR = "AUTO_CLAUDE_REGEX_ENGINE"
+
+# Engine used when neither the caller nor the environment picks one
+DEFAULT_REGEX_ENGINE = "re"
+
 from .models import RulePriority, SeverityLevel, ToolType, ValidationResult, ValidationRule
 
+logger = logging.getLogger(__name__)
+
+# Leading global inline flags such as "(?i)". Python only accepts these at the
+# very start of an expression, so they have to be scoped before a pattern can
+# be embedded in a larger alternation.
+_GLOBAL_FLAGS_RE = re.compile(r"^\(\?([a-zA-Z]+)\)")
+
+# Flags that keep their meaning when scoped to a group. Verbose mode does not:
+# a trailing comment would swallow the closing parenthesis.
+_SCOPABLE_FLAGS = frozenset("aimsu")
+
+# Constructs that refer to groups by number or name. Their meaning changes
+# once a pattern is renumbered inside an alternation, so such patterns are
+# never combined.
+_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Severities that block an operation, by strict_mode. CRITICAL and HIGH
+# always block; strict mode adds MEDIUM.
+_BLOCKING_SEVERITIES: dict[bool, frozenset[SeverityLevel]] = {
+    False: frozenset({SeverityLevel.CRITICAL, SeverityLevel.HIGH}),
+    True: frozenset({SeverityLevel.CRITICAL, SeverityLevel.HIGH, SeverityLevel.MEDIUM}),
+}
+
+# Repeat operators whose body must occur at least `min` times (possessive
+# repeats are new in Python 3.11)
+_REPEAT_OPS = tuple(
+    op
+    for op in (
+        sre_parse.MAX_REPEAT,
+        sre_parse.MIN_REPEAT,
+        getattr(sre_parse, "POSSESSIVE_REPEAT", None),
+    )
+    if op is not None
+)
+
+# Position of each priority in evaluation order (P0 first)
+_PRIORITY_INDEX: dict[RulePriority, int] = {
+    priority: index for index, priority in enumerate(RulePriority)
+}
+
+
+def _rule_sort_key(rule: ValidationRule) -> tuple[int, str]:
+    """Evaluation order of a rule: priority (P0 first), then rule_id."""
+    return (_PRIORITY_INDEX[rule.priority], rule.rule_id)
+
+
+# Contexts validators pass to match(), warmed up by precompile_all()
+_MATCH_CONTEXTS = ("command", "file_content", "file_path")
+
+# Bytes each character category matches in a bytes pattern, for the ones a
+# first-byte set can include
+_CATEGORY_BYTES: dict[Any, bytes] = {
+    sre_parse.CATEGORY_DIGIT: b"0123456789",
+    sre_parse.CATEGORY_SPACE: b" \t\n\r\x0b\x0c",
+    sre_parse.CATEGORY_WORD: (
+        b"0123456789_ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+    ),
+}
+
+# Regex that only matches fixed strings, found with str.find() instead:
+# ((string, anchored at end) in order of preference, ignore_case, anchored
+# at start). See _literal_alternation().
+_LiteralAlternation = tuple[tuple[tuple[str, bool], ...], bool, bool]
+
+# Literals every match of a regex has near its start: (literals, most
+# characters before them, ignore_case). See _leading_literals().
+_LeadingLiterals = tuple[tuple[str, ...], int, bool]
+
+# Furthest a leading literal may sit from the start of a match
+_LEADING_LITERAL_OFFSET_MAX = 16
+
+# Most strings a literal alternation may expand to
+_LITERAL_ALTERNATION_MAX = 64
+
+# Key of a rule bucket: (tool_type, context, priority)
+_BucketKey = tuple[ToolType, str, RulePriority]
+
+# Per-rule prefilter data read by the match loop, resolved once per match
+# plan: (rule, shortest match, required literals, literals ignore case,
+# leading literals)
+_RuleCheck = tuple[ValidationRule, int, tuple[str, ...], bool, Any]
+
+# One priority bucket in a match plan: (rule checks, alternation, bytes
+# alternation, case-folded bytes alternation, literal automaton, Hyperscan
+# database). Only rules that apply to the plan's context and can match get
+# a check.
+_PlanStep = tuple[
+    list[_RuleCheck],
+    re.Pattern[str] | None,
+    re.Pattern[bytes] | None,
+    re.Pattern[bytes] | None,
+    Any,
+    Any,
+]
+
+# Alternation that never matches, used when no rule can apply
+_NEVER_MATCHES = re.compile(r"(?!)")
+
+# Syntax Hyperscan reads differently from Python: "{,n}" repeats, "\N{...}"
+# and "\u" escapes, and POSIX classes inside brackets
+_HYPERSCAN_UNSAFE_PATTERN_RE = re.compile(r"\{,|\\[NuU]|\[:")
+
+# Negative lookarounds and negated classes. In a case-sensitive pattern they
+# can reject lowercased text the original accepted, so such a pattern cannot
+# be folded into a case-folded alternation.
+_CASE_SENSITIVE_NEGATION_RE = re.compile(r"\(\?<?!|\[\^")
+
+# Characters a case-insensitive ASCII pattern matches besides ASCII letters
+# ("\u0130" and "\u0131" for i, "\u017f" for s, "\u212a" for k). They are
+# also the only ones str.lower() maps to ASCII or to several characters, so
+# content without them lowercases position by position, and a case-folded
+# pattern reads it exactly as the original reads the content.
+_CASE_FOLD_UNSAFE_RE = re.compile("[\u0130\u0131\u017f\u212a]")
+
+# ASCII characters \s matches in str patterns only, not in bytes patterns or
+# Hyperscan (information separators). Other ASCII content reads the same.
+_STR_ONLY_WHITESPACE_RE = re.compile(r"[\x1c-\x1f]")
+
+# Longest content scanned with a bucket's combined alternation first. SRE
+# runs an alternation position by position through every branch, while a
+# single pattern skips ahead to its literal prefix, so on longer content
+# scanning the rules one by one is cheaper than the combined pre-pass.
+_UNION_CONTENT_MAX = 128
+
+# Default number of match() decisions remembered per detector
+RESULT_CACHE_SIZE = 1024
+
+# Content shorter than this is part of the result cache key as-is; longer
+# content is keyed by a digest so the cache does not pin large strings
+_CACHE_INLINE_CONTENT_MAX = 256
+
+# Size of that digest. hash() is not enough: two contents whose hashes
+# collide would share a decision, letting one through on the other's verdict.
+_CACHE_DIGEST_SIZE = 16
+
+# Marks a result cache miss (None is a cached "allowed" decision)
+_CACHE_MISS = object()
+
+# Decision cached by match(): the blocking rule and matched text, or None
+_Decision = tuple[ValidationRule, str] | None
+
+# Rule patterns whose compiled form and analysis are shared between
+# detectors; comfortably more than the default rules plus custom rules
+_PATTERN_CACHE_SIZE = 1024
+
+# What a detector derives from a rule's pattern: (compiled, required
+# literals, minimum match length, bytes variant, folded variant, literal
+# alternation, leading literals). See _analyze_pattern().
+_PatternAnalysis = tuple[Any, Any, int, Any, Any, Any, Any]
+
+
+def _collect_literal_runs(
+    items: Any, runs: list[tuple[str, ...]], current: list[str]
+) -> list[str]:
+    """
+    Collect the literals every match must contain.
+
+    Runs of consecutive literal characters are collected as one-element
+    tuples. An alternation contributes a tuple with one literal per branch,
+    at least one of which every match contains.
+
+    Args:
+        items: Parsed (opcode, argument) sequence from sre_parse
+        runs: Output list of completed runs and alternatives
+        current: Characters of the run in progress
+
+    Returns:
+        The run still in progress after the sequence
+    """
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            current.append(chr(av))
+        elif op is sre_parse.AT:
+            # Zero-width anchors (\b, ^) keep neighbouring literals adjacent
+            continue
+        elif op is sre_parse.SUBPATTERN and not av[1] and not av[2]:
+            # Plain group: its body is part of the same concatenation
+            current = _collect_literal_runs(av[3], runs, current)
+        else:
+            runs.append(("".join(current),))
+            current = []
+            if op in _REPEAT_OPS and av[0] >= 1:
+                # Body occurs at least once, but not next to its neighbours
+                runs.append(("".join(_collect_literal_runs(av[2], runs, [])),))
+            elif op is sre_parse.BRANCH:
+                runs.append(_branch_literals(av[1]))
+    return current
+
+
+def _best_literals(runs: list[tuple[str, ...]]) -> tuple[str, ...]:
+    """
+    Pick the most selective entry collected by _collect_literal_runs().
+
+    An entry is as selective as its shortest literal; fewer alternatives
+    break ties.
+
+    Args:
+        runs: Runs and alternatives that every match must contain
+
+    Returns:
+        The chosen literals, or () if every entry has an empty literal
+    """
+    best = max(runs, key=lambda literals: (min(map(len, literals)), -len(literals)))
+    return best if all(best) else ()
+
+
+def _branch_literals(branches: list[Any]) -> tuple[str, ...]:
+    """
+    Find literals of which every match of an alternation contains one.
+
+    Args:
+        branches: Parsed item sequences of the alternation's branches
+
+    Returns:
+        One literal per branch, without those that contain another (a
+        match containing them contains the shorter one too), or ("",) if
+        some branch requires no literal
+    """
+    literals: set[str] = set()
+    for branch in branches:
+        runs: list[tuple[str, ...]] = []
+        runs.append(("".join(_collect_literal_runs(branch, runs, [])),))
+        best = _best_literals(runs)
+        if not best:
+            return ("",)
+        literals.update(best)
+    return _drop_redundant_literals(literals)
+
+
+def _drop_redundant_literals(literals: set[str]) -> tuple[str, ...]:
+    """Keep the literals that do not contain another one, shortest first."""
+    kept: list[str] = []
+    for literal in sorted(literals, key=lambda literal: (len(literal), literal)):
+        if not any(shorter in literal for shorter in kept):
+            kept.append(literal)
+    return tuple(kept)
+
+
+def _required_literals(pattern: str) -> tuple[tuple[str, ...], bool] | None:
+    """
+    Find literals of which every match of a regex must contain at least one.
+
+    Usually this is the longest literal substring of the pattern. For an
+    alternation such as "(curl|wget)" it is one literal per branch.
+
+    Args:
+        pattern: Regex pattern of a single rule
+
+    Returns:
+        (literals, ignore_case) for the most selective choice, or None if
+        the pattern has none. With ignore_case the literals are lowercased
+        and only apply to ASCII content.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None
+
+    flags = parsed.state.flags
+    if flags & re.LOCALE:
+        return None
+
+    runs: list[tuple[str, ...]] = []
+    runs.append(("".join(_collect_literal_runs(parsed, runs, [])),))
+    literals = _best_literals(runs)
+    if not literals:
+        return None
+
+    if flags & re.IGNORECASE:
+        # Case-insensitive matching folds some non-ASCII characters onto
+        # ASCII ones (e.g. "ſ" matches "s"), so only plain ASCII is safe
+        if not all(literal.isascii() for literal in literals):
+            return None
+        return _drop_redundant_literals({literal.lower() for literal in literals}), True
+    return literals, False
+
+
+def _expand_literals(items: Any) -> list[tuple[str, bool]] | None:
+    """
+    List the strings a parsed sequence of literals and alternations matches.
+
+    A "$" may end any of the strings, so "/\\.env$|/\\.env\\." expands
+    to ("/.env", True) and ("/.env.", False).
+
+    Args:
+        items: Parsed (opcode, argument) sequence from sre_parse
+
+    Returns:
+        (string, anchored at end) in the order a backtracking search tries
+        them, or None if the sequence has other constructs or too many
+        strings
+    """
+    expanded = [("", False)]
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            options = [(chr(av), False)]
+        elif op is sre_parse.IN and all(item[0] is sre_parse.LITERAL for item in av):
+            options = [(chr(item_av), False) for _, item_av in av]
+        elif op is sre_parse.AT and av is sre_parse.AT_END:
+            options = [("", True)]
+        elif op is sre_parse.SUBPATTERN and not av[1] and not av[2]:
+            options = _expand_literals(av[3])
+        elif op is sre_parse.BRANCH:
+            options = []
+            for branch in av[1]:
+                branch_options = _expand_literals(branch)
+                if branch_options is None:
+                    return None
+                options.extend(branch_options)
+        else:
+            return None
+        if options is None or len(expanded) * len(options) > _LITERAL_ALTERNATION_MAX:
+            return None
+        if any(prefix_end for _, prefix_end in expanded) and any(
+            option for option, _ in options
+        ):
+            # Text after "$" (e.g. "a$\n") is left to the regex
+            return None
+        expanded = [
+            (prefix + option, prefix_end or option_end)
+            for prefix, prefix_end in expanded
+            for option, option_end in options
+        ]
+    return expanded
+
+
+def _literal_alternation(pattern: str) -> _LiteralAlternation | None:
+    """
+    Recognize a regex that only matches fixed strings.
+
+    Such a pattern is a literal or an alternation of literals, optionally
+    anchored with "^" and with "$" after any of them, e.g.
+    "(?i)(coinhive|minergate)", "^/etc/passwd$" or "/\\.ssh/config$".
+
+    Args:
+        pattern: Regex pattern of a single rule
+
+    Returns:
+        ((string, anchored at end) in order of preference, ignore_case,
+        anchored at start), or None for any other pattern. With
+        ignore_case the strings are lowercased ASCII.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None
+
+    flags = parsed.state.flags
+    if flags & ~(re.IGNORECASE | re.UNICODE) or parsed.state.groupdict:
+        # Named groups have to be reported, so leave those to the regex
+        return None
+
+    items = list(parsed)
+    at_start = bool(items) and items[0] == (sre_parse.AT, sre_parse.AT_BEGINNING)
+    alternatives = _expand_literals(items[at_start:])
+    if alternatives is None:
+        return None
+
+    ignore_case = bool(flags & re.IGNORECASE)
+    if ignore_case:
+        if not all(literal.isascii() for literal, _ in alternatives):
+            return None
+        alternatives = [
+            (literal.lower(), at_end) for literal, at_end in alternatives
+        ]
+    return tuple(alternatives), ignore_case, at_start
+
+
+def _find_literal_alternation(
+    text: str, alternation: _LiteralAlternation, start: int
+) -> tuple[int, int] | None:
+    """
+    Find the match of a literal alternation the regex itself would report.
+
+    Args:
+        text: Content, lowercased when the alternation ignores case
+        alternation: Result of _literal_alternation()
+        start: Position to start searching from
+
+    Returns:
+        (start, end) of the leftmost match, preferring earlier strings at
+        the same position, or None
+    """
+    alternatives, _, at_start = alternation
+    # Like re, searching past the end starts at the end
+    start = min(start, len(text))
+    if at_start:
+        if start:
+            # "^" only matches at the real start of the content
+            return None
+        for literal, at_end in alternatives:
+            if not text.startswith(literal):
+                continue
+            end = len(literal)
+            # "$" also matches before a trailing newline
+            if not at_end or end == len(text) or text[end:] == "\n":
+                return 0, end
+        return None
+
+    best: tuple[int, int] | None = None
+    for literal, at_end in alternatives:
+        if not at_end:
+            position = text.find(literal, start)
+        else:
+            # Before a trailing newline is further left than the very end
+            position = len(text) - len(literal) - 1
+            if not (
+                position >= start
+                and text.endswith("\n")
+                and text.startswith(literal, position)
+            ):
+                position = len(text) - len(literal)
+                if position < start or not text.endswith(literal):
+                    position = -1
+        if position != -1 and (best is None or position < best[0]):
+            best = (position, position + len(literal))
+    return best
+
+
+def _starting_literals(items: Any) -> tuple[str, ...] | None:
+    """
+    Find literals one of which every match of a parsed sequence starts with.
+
+    Args:
+        items: Parsed (opcode, argument) sequence from sre_parse
+
+    Returns:
+        The leading literal of each alternative, or None if some
+        alternative does not start with one
+    """
+    run: list[str] = []
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            # sre_parse factors a shared prefix out of alternations, so
+            # "eval|exec" arrives as "e" followed by "val|xec"
+            tail = _starting_literals([(op, av)])
+            if tail is None:
+                break
+            prefix = "".join(run)
+            return tuple(prefix + literal for literal in tail)
+        if op is sre_parse.AT:
+            # Zero-width anchors (\b, ^) do not move the start
+            continue
+        if op is sre_parse.SUBPATTERN and not av[1] and not av[2]:
+            return _starting_literals(av[3])
+        if op is sre_parse.BRANCH:
+            literals: list[str] = []
+            for branch in av[1]:
+                branch_literals = _starting_literals(branch)
+                if branch_literals is None:
+                    return None
+                literals.extend(branch_literals)
+            # A literal another one starts with never occurs first
+            kept = [
+                literal
+                for literal in literals
+                if not any(
+                    literal != other and literal.startswith(other) for other in literals
+                )
+            ]
+            return tuple(dict.fromkeys(kept))
+        return None
+    return ("".join(run),) if run else None
+
+
+def _leading_literals(pattern: str) -> _LeadingLiterals | None:
+    """
+    Find literals one of which every match has close to its start.
+
+    For "(?:^|\\W)(eval|exec)\\s*\\(" every match starts at most one
+    character before "eval" or "exec". A match therefore cannot start
+    further than that before the first occurrence of either, and the
+    regex search can begin there instead of at the start of the content.
+
+    Args:
+        pattern: Regex pattern of a single rule
+
+    Returns:
+        (literals, most characters before them, ignore_case), or None if
+        the pattern does not start within _LEADING_LITERAL_OFFSET_MAX
+        characters of a literal. With ignore_case the literals are
+        lowercased and only apply to ASCII content.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None
+
+    flags = parsed.state.flags
+    if flags & re.LOCALE:
+        return None
+
+    offset = 0
+    for index, item in enumerate(parsed):
+        literals = _starting_literals(parsed[index:])
+        if literals is not None:
+            break
+        offset += sre_parse.SubPattern(parsed.state, [item]).getwidth()[1]
+        if offset > _LEADING_LITERAL_OFFSET_MAX:
+            return None
+    else:
+        return None
+
+    if "" in literals:
+        return None
+    if flags & re.IGNORECASE:
+        # Same restriction as _required_literals()
+        if not all(literal.isascii() for literal in literals):
+            return None
+        return tuple(literal.lower() for literal in literals), offset, True
+    return literals, offset, False
+
+
+def _min_match_length(pattern: str) -> int:
+    """
+    Find the length of the shortest string a regex can match.
+
+    Args:
+        pattern: Regex pattern of a single rule
+
+    Returns:
+        Minimum match length in characters, or 0 if it cannot be determined
+    """
+    try:
+        return sre_parse.parse(pattern).getwidth()[0]
+    except re.error:
+        return 0
+
+
+def _bytes_variant(compiled: Any) -> re.Pattern[bytes] | None:
+    """
+    Compile a bytes version of a compiled str regex.
+
+    SRE runs bytes patterns faster than str ones. On ASCII content without
+    _STR_ONLY_WHITESPACE_RE characters both find the same matches.
+
+    Args:
+        compiled: Pattern returned by PatternDetector._compile()
+
+    Returns:
+        Equivalent bytes pattern, or None for RE2 patterns and patterns
+        that are not plain ASCII
+    """
+    if not isinstance(compiled, re.Pattern):
+        return None
+    try:
+        return re.compile(compiled.pattern.encode("ascii"))
+    except (UnicodeEncodeError, re.error):
+        # e.g. non-ASCII literals or "\u" escapes
+        return None
+
+
+def _first_bytes(items: Any, ignore_case: bool) -> tuple[set[int] | None, bool]:
+    """
+    Collect the bytes a match of a parsed bytes pattern can start with.
+
+    Args:
+        items: Parsed (opcode, argument) sequence from sre_parse
+        ignore_case: Whether the sequence is matched ignoring case
+
+    Returns:
+        (first bytes, whether the sequence can match the empty string);
+        first bytes is None when they cannot be bounded
+    """
+    first: set[int] = set()
+    for op, av in items:
+        if op is sre_parse.AT or op is sre_parse.ASSERT or op is sre_parse.ASSERT_NOT:
+            # Zero-width: the match still starts with what follows
+            continue
+        elif op is sre_parse.LITERAL:
+            chars = {av}
+        elif op is sre_parse.IN:
+            chars = set()
+            for item_op, item_av in av:
+                if item_op is sre_parse.LITERAL:
+                    chars.add(item_av)
+                elif item_op is sre_parse.RANGE:
+                    chars.update(range(item_av[0], item_av[1] + 1))
+                elif item_op is sre_parse.CATEGORY and item_av in _CATEGORY_BYTES:
+                    chars.update(_CATEGORY_BYTES[item_av])
+                else:
+                    # Negated sets and complemented categories
+                    return None, False
+        elif op is sre_parse.SUBPATTERN:
+            group_ignore_case = (ignore_case or bool(av[1] & re.IGNORECASE)) and not (
+                av[2] & re.IGNORECASE
+            )
+            chars, nullable = _first_bytes(av[3], group_ignore_case)
+            if chars is None:
+                return None, False
+            first |= chars
+            if nullable:
+                continue
+            return first, False
+        elif op is sre_parse.BRANCH or op in _REPEAT_OPS:
+            branches = av[1] if op is sre_parse.BRANCH else [av[2]]
+            nullable = op is not sre_parse.BRANCH and av[0] == 0
+            for branch in branches:
+                chars, branch_nullable = _first_bytes(branch, ignore_case)
+                if chars is None:
+                    return None, False
+                first |= chars
+                nullable = nullable or branch_nullable
+            if nullable:
+                continue
+            return first, False
+        else:
+            # Any character, group references, ...
+            return None, False
+
+        if ignore_case:
+            # Bytes patterns only fold ASCII letters
+            chars |= {c ^ 0x20 for c in chars if chr(c).isascii() and chr(c).isalpha()}
+        return first | chars, False
+    return first, True
+
+
+def _gated_alternation(compiled: re.Pattern[bytes]) -> re.Pattern[bytes]:
+    """
+    Prefix a bytes alternation with a lookahead on its possible first bytes.
+
+    SRE otherwise tries every branch at every position. The lookahead is a
+    single 256-entry set lookup, so positions no rule can start at are
+    rejected without entering any branch. Matches are unchanged.
+
+    Args:
+        compiled: Combined alternation of a bucket
+
+    Returns:
+        The gated alternation, or compiled itself when it holds a single
+        rule, its first bytes cannot be bounded or a rule can match the
+        empty string
+    """
+    if compiled.pattern.startswith(b"(?") and _GLOBAL_FLAGS_RE.match(
+        compiled.pattern.decode("ascii", "replace")
+    ):
+        # Global flags must stay at the very start
+        return compiled
+    parsed = sre_parse.parse(compiled.pattern)
+    if len(parsed) != 1 or parsed[0][0] is not sre_parse.BRANCH:
+        # A single rule, which SRE can scan for by its own prefix
+        return compiled
+    first, nullable = _first_bytes(parsed, False)
+    if first is None or nullable:
+        return compiled
+    gate = b"".join(re.escape(bytes([byte])) for byte in sorted(first))
+    return re.compile(b"(?=[" + gate + b"])(?:" + compiled.pattern + b")")
+
+
+def _folded_variant(
+    compiled: Any,
+) -> tuple[re.Pattern[str], re.Pattern[bytes]] | None:
+    """
+    Compile the case-folded versions of a case-insensitive str regex.
+
+    Args:
+        compiled: Pattern returned by PatternDetector._compile()
+
+    Returns:
+        (str pattern, bytes pattern) to search lowercased content with, or
+        None for RE2 patterns, case-sensitive patterns and patterns that
+        cannot be rewritten (see _casefolded_pattern)
+    """
+    if not isinstance(compiled, re.Pattern) or not compiled.flags & re.IGNORECASE:
+        return None
+    folded = _casefolded_pattern(compiled.pattern)
+    if folded is None:
+        return None
+    try:
+        return re.compile(folded), re.compile(folded.encode("ascii"))
+    except re.error:
+        return None
+
+
+def _casefolded_pattern(pattern: str) -> str | None:
+    """
+    Rewrite a regex to run case-sensitively on lowercased text.
+
+    The result matches lowercased content at the same spans where the
+    pattern, ignoring case, matches the content (for content without
+    _CASE_FOLD_UNSAFE_RE characters). SRE scans case-sensitive patterns
+    several times faster than case-insensitive ones, and lowercasing is
+    cheap.
+
+    Literal letters and same-case class ranges are lowercased. Patterns
+    with escapes that can spell a letter (hex, octal or named), scoped or
+    verbose flags, or mixed-case ranges are not rewritten.
+
+    Args:
+        pattern: Regex pattern of a single rule
+
+    Returns:
+        Case-folded pattern, or None if the pattern is not rewritten
+    """
+    if not pattern.isascii():
+        return None
+
+    out: list[str] = []
+    flags_match = _GLOBAL_FLAGS_RE.match(pattern)
+    if flags_match:
+        flags = flags_match.group(1)
+        if not set(flags) <= set("aims"):
+            return None
+        if flags.replace("i", ""):
+            out.append(f"(?{flags.replace('i', '')})")
+    i = flags_match.end() if flags_match else 0
+
+    in_class = False
+    # At the first member of a class, where "]" is a literal
+    class_start = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            if not escaped or escaped in "xuUN" or escaped.isdigit():
+                return None
+            if in_class and pattern[i + 2 : i + 3] == "-":
+                # Range from an escape (e.g. "[\--z]")
+                return None
+            class_start = False
+            out.append(pattern[i : i + 2])
+            i += 2
+            continue
+
+        if in_class:
+            if char == "]" and not class_start:
+                in_class = False
+                out.append(char)
+                i += 1
+                continue
+            class_start = False
+            high = pattern[i + 2 : i + 3]
+            if pattern[i + 1 : i + 2] == "-" and high not in ("]", ""):
+                if high == "\\":
+                    return None
+                no_letters = high < "A" or char > "z" or "Z" < char <= high < "a"
+                lowercase = "a" <= char and high <= "z"
+                uppercase = "A" <= char and high <= "Z"
+                if not (no_letters or lowercase or uppercase):
+                    # Mixed-case or letter-spanning range
+                    return None
+                out.append(f"{char.lower()}-{high.lower()}")
+                i += 3
+                continue
+            out.append(char.lower())
+            i += 1
+            continue
+
+        if char == "[":
+            in_class = True
+            class_start = True
+            out.append(char)
+            i += 1
+            if pattern[i : i + 1] == "^":
+                out.append("^")
+                i += 1
+            continue
+
+        if pattern.startswith("(?", i):
+            header = re.match(r"\(\?(?:[:=!]|<[=!]|P<\w+>|P=\w+\))", pattern[i:])
+            if header is None:
+                # Scoped flags, comments, conditionals
+                return None
+            out.append(header.group(0))
+            i += header.end()
+            continue
+
+        out.append(char.lower())
+        i += 1
+
+    return "".join(out)
+
+
+def _scoped_pattern(pattern: str) -> str | None:
+    """
+    Wrap a regex pattern so it can be embedded in an alternation.
+
+    Args:
+        pattern: Regex pattern of a single rule
+
+    Returns:
+        Self-contained group equivalent to the pattern, or None if the
+        pattern cannot safely be combined with others
+    """
+    if _GROUP_REFERENCE_RE.search(pattern):
+        return None
+
+    flags_match = _GLOBAL_FLAGS_RE.match(pattern)
+    if flags_match:
+        flags = flags_match.group(1)
+        if not _SCOPABLE_FLAGS.issuperset(flags):
+            return None
+        return f"(?{flags}:{pattern[flags_match.end():]})"
+
+    return f"(?:{pattern})"
+
+
+def _compile_pattern(pattern: str, regex_engine: str) -> Any:
+    """
+    Compile a pattern with a regex engine.
+
+    Args:
+        pattern: Regex pattern to compile
+        regex_engine: One of REGEX_ENGINES
+
+    Returns:
+        Compiled pattern exposing search()
+
+    Raises:
+        re.error: If the pattern is not a valid regex
+    """
+    if regex_engine == "re2":
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            # Unsupported by RE2 (lookarounds, back-references, ...)
+            pass
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=_PATTERN_CACHE_SIZE)
+def _analyze_pattern(pattern: str, regex_engine: str) -> _PatternAnalysis:
+    """
+    Compile and analyze a rule pattern once per process.
+
+    Every detector holding the default rules needs the same compiled
+    patterns and literals, so they are computed once and shared. The
+    results are immutable.
+
+    Args:
+        pattern: Regex pattern of a single rule
+        regex_engine: One of REGEX_ENGINES
+
+    Returns:
+        Analysis of the pattern
+
+    Raises:
+        re.error: If the pattern is not a valid regex
+    """
+    compiled = _compile_pattern(pattern, regex_engine)
+    return (
+        compiled,
+        _required_literals(pattern),
+        _min_match_length(pattern),
+        _bytes_variant(compiled),
+        _folded_variant(compiled),
+        _literal_alternation(pattern),
+        _leading_literals(pattern),
+    )
+
+
+def _config_cache_key(config: Any | None) -> tuple | None:
+    """
+    Snapshot the config settings a match() decision depends on.
+
+    Args:
+        config: Optional OutputValidationConfig
+
+    Returns:
+        Hashable (strict_mode, disabled_rules, severity_overrides) tuple, an
+        empty tuple when there is no config, or None when the config cannot
+        be snapshotted (results are then not cached)
+    """
+    if not config:
+        return ()
+    try:
+        key = (
+            bool(getattr(config, "strict_mode", False)),
+            tuple(config.disabled_rules),
+            tuple(config.severity_overrides.items()),
+        )
+        hash(key)
+    except (AttributeError, TypeError):
+        return None
+    return key
+
 
 class PatternDetector:
     """
@@ -49,15 +984,41 @@ class PatternDetector:
             print(f"Blocked: {result.reason}")
     """
 
-    def __init__(self) -> None:
-        """Initialize the pattern detector with empty rule sets."""
-        # Rules organized by priority for efficient matching
-        self._rules_by_priority: dict[RulePriority, list[ValidationRule]] = {
-            RulePriority.P0: [],
-            RulePriority.P1: [],
-            RulePriority.P2: [],
-            RulePriority.P3: [],
-        }
+    def __init__(
+        self, regex_engine: str = "re", result_cache_size: int = RESULT_CACHE_SIZE
+    ) -> None:
+        """
+        Initialize the pattern detector with empty rule sets.
+
+        Args:
+            regex_engine: "re" (default), "re2" or "hyperscan". RE2 runs in
+                linear time, but its whitespace, word and word-boundary
+                classes are ASCII-only, so it is opt-in rather than picked up
+                whenever it is installed. Patterns RE2 rejects (lookarounds,
+                back-references) still use the re module. "hyperscan" scans
+                each priority bucket once to find candidate rules and
+                confirms them with re; it only applies to ASCII content.
+            result_cache_size: Number of match() decisions to remember for
+                repeated content (0 disables the cache)
+
+        Raises:
+            ValueError: If the engine is unknown or not installed
+        """
+        if regex_engine not in REGEX_ENGINES:
+            raise ValueError(
+                f"Unknown regex engine: {regex_engine!r}. "
+                f"Must be one of: {', '.join(REGEX_ENGINES)}"
+            )
+        installed, package = _ENGINE_PACKAGES.get(regex_engine, (True, ""))
+        if not installed:
+            raise ValueError(
+                f"{regex_engine} regex engine requires the {package} package. "
+                f"Install with: pip install {package}"
+            )
+        self._regex_engine = regex_engine
+
+        # Rules organized by priority, indexed by _PRIORITY_INDEX (P0 first)
+        self._rules_by_priority: list[list[ValidationRule]] = [[] for _ in RulePriority]
 
         # Rules organized by tool type for quick filtering
         self._rules_by_tool: dict[ToolType, list[ValidationRule]] = {
@@ -69,11 +1030,79 @@ class PatternDetector:
             ToolType.WEB_SEARCH: [],
         }
 
+        # Per-tool rules bucketed by priority in a fixed-size list indexed by
+        # _PRIORITY_INDEX (P0 first), each bucket kept sorted by rule_id so
+        # evaluation order needs no per-call sort
+        self._rules_by_tool_priority: dict[ToolType, list[list[ValidationRule]]] = {
+            tool_type: [[] for _ in RulePriority] for tool_type in ToolType
+        }
+
         # All rules for iteration
         self._all_rules: list[ValidationRule] = []
 
-        # Compiled regex cache for performance
-        self._compiled_patterns: dict[str, re.Pattern[str]] = {}
+        # First rule added for each rule_id, for constant-time lookups
+        self._rules_by_id: dict[str, ValidationRule] = {}
+
+        # Compiled regex cache for performance. Patterns are compiled on
+        # first use (or by precompile_all); None marks an invalid regex.
+        self._compiled_patterns: dict[str, re.Pattern[str] | None] = {}
+
+        # Bytes versions of the compiled patterns, used for ASCII content
+        self._compiled_bytes_patterns: dict[str, re.Pattern[bytes]] = {}
+
+        # Case-folded (str, bytes) versions of the case-insensitive patterns,
+        # used on lowercased content
+        self._compiled_folded_patterns: dict[
+            str, tuple[re.Pattern[str], re.Pattern[bytes]]
+        ] = {}
+
+        # Literals near the start of every match of a regex rule, used to
+        # begin its search close to where a match can first occur
+        self._leading_literals: dict[str, _LeadingLiterals] = {}
+
+        # Regex rules that only match fixed strings, searched with str.find()
+        self._literal_alternations: dict[str, _LiteralAlternation] = {}
+
+        # Regex rules added but not compiled yet, by rule_id
+        self._pending_rules: dict[str, ValidationRule] = {}
+
+        # Literals of which every match of a rule must contain one, as
+        # (literals, ignore_case), checked with substring tests before
+        # running the regex
+        self._required_literals: dict[str, tuple[tuple[str, ...], bool]] = {}
+
+        # Shortest match of a regex rule, when longer than zero. Content too
+        # short to hold one skips the regex without running it.
+        self._min_match_lengths: dict[str, int] = {}
+
+        # Aho-Corasick automaton over the required literals and the literals
+        # it holds, built lazily when pyahocorasick is installed
+        self._required_literal_automaton: tuple[Any, frozenset[str]] | None = None
+
+        # Combined alternation of every rule pattern per
+        # (tool_type, context, priority), built lazily in match(). None means
+        # the bucket cannot be combined.
+        self._union_patterns: dict[_BucketKey, re.Pattern[str] | None] = {}
+
+        # Aho-Corasick automaton over the literal patterns of each bucket, used
+        # instead of folding literals into the alternation when available
+        self._literal_automata: dict[_BucketKey, Any] = {}
+
+        # Hyperscan prefilter database of each bucket (hyperscan engine only)
+        self._hyperscan_databases: dict[_BucketKey, Any] = {}
+
+        # Per (tool_type, context): the non-empty priority buckets in order,
+        # each with its alternation and automaton, so match() needs a single
+        # dict lookup to find everything it scans
+        self._match_plans: dict[tuple[ToolType, str], list[_PlanStep]] = {}
+
+        # Recent match() decisions, least recently used first. Keyed by
+        # (tool_type, context, config snapshot, content key) and dropped
+        # when a rule's enabled flag or severity changes in place (see
+        # ValidationRule._state_version).
+        self._result_cache: OrderedDict[tuple, _Decision] = OrderedDict()
+        self._result_cache_size = result_cache_size
+        self._result_cache_rule_version = ValidationRule._state_version
 
     def add_rule(self, rule: ValidationRule) -> None:
         """
@@ -84,31 +1113,113 @@ class PatternDetector:
         Args:
             rule: ValidationRule to add
         """
-        # Add to priority-indexed dict
-        self._rules_by_priority[rule.priority].append(rule)
+        # Add to priority-indexed list
+        self._rules_by_priority[_PRIORITY_INDEX[rule.priority]].append(rule)
 
         # Add to tool-type-indexed dict
         for tool_type in rule.tool_types:
             self._rules_by_tool[tool_type].append(rule)
+            bisect.insort(
+                self._rules_by_tool_priority[tool_type][_PRIORITY_INDEX[rule.priority]],
+                rule,
+                key=_rule_sort_key,
+            )
 
         # Add to all rules list
         self._all_rules.append(rule)
-
-        # Compile regex pattern if needed
+        self._rules_by_id.setdefault(rule.rule_id, rule)
+        self._union_patterns.clear()
+        self._literal_automata.clear()
+        self._hyperscan_databases.clear()
+        self._match_plans.clear()
+        self._result_cache.clear()
+
+        # Defer regex compilation until the rule is first needed
         if rule.pattern_type == "regex":
-            try:
-                self._compiled_patterns[rule.rule_id] = re.compile(rule.pattern)
-            except re.error as e:
-                # Invalid regex - log and disable the rule
-                print(f"Warning: Invalid regex pattern for rule {rule.rule_id}: {e}")
-                rule.enabled = False
+            self._pending_rules[rule.rule_id] = rule
+            self._compiled_patterns.pop(rule.rule_id, None)
+            self._compiled_bytes_patterns.pop(rule.rule_id, None)
+            self._compiled_folded_patterns.pop(rule.rule_id, None)
+            self._literal_alternations.pop(rule.rule_id, None)
+            self._leading_literals.pop(rule.rule_id, None)
+            self._required_literals.pop(rule.rule_id, None)
+            self._min_match_lengths.pop(rule.rule_id, None)
+            self._required_literal_automaton = None
+
+    def precompile_all(self) -> None:
+        """
+        Compile every pending pattern and combined alternation up front.
 
-    def add_rules(self, rules: list[ValidationRule]) -> None:
+        Patterns are otherwise compiled lazily, bucket by bucket, the first
+        time match() needs them. Call this to move that cost to startup in
+        latency-sensitive callers.
+        """
+        for rule_id in list(self._pending_rules):
+            self._get_compiled(rule_id)
+
+        for tool_type in ToolType:
+            for context in _MATCH_CONTEXTS:
+                self._get_match_plan(tool_type, context)
+
+    def _get_compiled(self, rule_id: str) -> Any | None:
+        """
+        Get the compiled pattern for a regex rule, compiling it on first use.
+
+        An invalid regex is reported once and disables its rule.
+
+        Args:
+            rule_id: ID of the regex rule
+
+        Returns:
+            Compiled pattern, or None if the rule has no valid regex
+        """
+        if rule_id in self._compiled_patterns:
+            return self._compiled_patterns[rule_id]
+
+        rule = self._pending_rules.pop(rule_id, None)
+        if rule is None:
+            return None
+
+        compiled = None
+        try:
+            analysis = _analyze_pattern(rule.pattern, self._regex_engine)
+        except re.error as e:
+            # Invalid regex - log and disable the rule
+            logger.warning("Invalid regex pattern for rule %s: %s", rule.rule_id, e)
+            rule.enabled = False
+        else:
+            (
+                compiled,
+                required,
+                min_length,
+                compiled_bytes,
+                compiled_folded,
+                alternation,
+                leading,
+            ) = analysis
+            if required is not None:
+                self._required_literals[rule_id] = required
+                self._required_literal_automaton = None
+            if min_length:
+                self._min_match_lengths[rule_id] = min_length
+            if compiled_bytes is not None:
+                self._compiled_bytes_patterns[rule_id] = compiled_bytes
+            if compiled_folded is not None:
+                self._compiled_folded_patterns[rule_id] = compiled_folded
+            if alternation is not None:
+                self._literal_alternations[rule_id] = alternation
+            if leading is not None:
+                self._leading_literals[rule_id] = leading
+
+        self._compiled_patterns[rule_id] = compiled
+        return compiled
+
+    def add_rules(self, rules: Iterable[ValidationRule]) -> None:
         """
         Add multiple validation rules at once.
 
         Args:
-            rules: List of ValidationRule objects to add
+            rules: ValidationRule objects to add, e.g. ALL_DEFAULT_RULES
         """
         for rule in rules:
             self.add_rule(rule)
@@ -138,24 +1249,276 @@ class PatternDetector:
         Returns:
             ValidationResult indicating if operation should be blocked
         """
-        # Get rules applicable to this tool type
-        applicable_rules = self._rules_by_tool.get(tool_type, [])
+        decision = self._decide(
+            tool_type,
+            content,
+            context,
+            config,
+            self._config_key(config),
+            self._blocking_severities(config),
+        )
+        return self._build_result(decision, tool_type, tool_input)
 
-        # If no rules apply, allow immediately
-        if not applicable_rules:
-            return ValidationResult.allowed()
+    def match_many(
+        self,
+        items: list[tuple[ToolType, str, str]],
+        *,
+        config: Any | None = None,
+    ) -> list[ValidationResult]:
+        """
+        Match a batch of contents against the applicable validation rules.
 
-        # Sort by priority (P0 first, P3 last)
-        sorted_rules = sorted(
-            applicable_rules,
-            key=lambda r: (
-                list(RulePriority).index(r.priority),
-                r.rule_id,
+        Equivalent to calling match() for each item, but the config is
+        resolved once for the whole batch.
+
+        Args:
+            items: (tool_type, content, context) tuples to validate
+            config: Optional OutputValidationConfig for rule overrides
+
+        Returns:
+            ValidationResult for each item, in the order given
+        """
+        config_key = self._config_key(config)
+        blocking = self._blocking_severities(config)
+        return [
+            self._build_result(
+                self._decide(tool_type, content, context, config, config_key, blocking),
+                tool_type,
+                None,
             )
+            for tool_type, content, context in items
+        ]
+
+    def _config_key(self, config: Any | None) -> tuple | None:
+        """
+        Get the result cache key part for a config.
+
+        Args:
+            config: Optional OutputValidationConfig
+
+        Returns:
+            Config snapshot, or None if results must not be cached
+        """
+        if self._result_cache_size <= 0:
+            return None
+        return _config_cache_key(config)
+
+    def _decide(
+        self,
+        tool_type: ToolType,
+        content: str,
+        context: str,
+        config: Any | None,
+        config_key: tuple | None,
+        blocking: frozenset[SeverityLevel],
+    ) -> _Decision:
+        """
+        Find the blocking rule for content, reusing cached decisions.
+
+        Args:
+            tool_type: Type of tool being validated
+            content: The content to validate
+            context: Context of validation
+            config: Optional OutputValidationConfig for rule overrides
+            config_key: Snapshot of config from _config_key()
+            blocking: Severities that block under the config
+
+        Returns:
+            (rule, matched_text) of the blocking rule, or None if allowed
+        """
+        if config_key is None:
+            return self._find_blocking_rule(tool_type, content, context, config, blocking)
+
+        if self._result_cache_rule_version != ValidationRule._state_version:
+            # A rule was disabled or re-rated since these were decided
+            self._result_cache.clear()
+            self._result_cache_rule_version = ValidationRule._state_version
+
+        # Repeated content under the same config reuses the earlier decision
+        content_key = (
+            content
+            if len(content) < _CACHE_INLINE_CONTENT_MAX
+            else hashlib.blake2b(
+                content.encode("utf-8", "surrogatepass"),
+                digest_size=_CACHE_DIGEST_SIZE,
+            ).digest()
+        )
+        cache_key = (tool_type, context, config_key, content_key)
+
+        decision = self._result_cache.get(cache_key, _CACHE_MISS)
+        if decision is not _CACHE_MISS:
+            self._result_cache.move_to_end(cache_key)
+            return decision
+
+        decision = self._find_blocking_rule(tool_type, content, context, config, blocking)
+        self._result_cache[cache_key] = decision
+        if len(self._result_cache) > self._result_cache_size:
+            self._result_cache.popitem(last=False)
+        return decision
+
+    @staticmethod
+    def _build_result(
+        decision: _Decision,
+        tool_type: ToolType,
+        tool_input: dict[str, Any] | None,
+    ) -> ValidationResult:
+        """
+        Turn a match decision into a ValidationResult.
+
+        Results are built per call rather than cached, since tool_input
+        differs between callers.
+
+        Args:
+            decision: (rule, matched_text) of the blocking rule, or None
+            tool_type: Type of tool being validated
+            tool_input: Optional tool input data (for logging)
+
+        Returns:
+            Blocked ValidationResult, or an allowed one if decision is None
+        """
+        # No rules matched - allow the operation
+        if decision is None:
+            return ValidationResult.allowed()
+
+        rule, matched_text = decision
+        return ValidationResult.blocked(
+            rule=rule,
+            reason=rule.message or rule.description,
+            matched_pattern=matched_text,
+            tool_name=tool_type.value,
+            tool_input=tool_input or {},
         )
 
-        # Check each rule in priority order
-        for rule in sorted_rules:
+    def _find_blocking_rule(
+        self,
+        tool_type: ToolType,
+        content: str,
+        context: str,
+        config: Any | None,
+        blocking: frozenset[SeverityLevel],
+    ) -> _Decision:
+        """
+        Find the first rule that blocks content, in priority order.
+
+        Args:
+            tool_type: Type of tool being validated
+            content: The content to validate
+            context: Context of validation
+            config: Optional OutputValidationConfig for rule overrides
+            blocking: Severities that block under the config
+
+        Returns:
+            (rule, matched_text) of the blocking rule, or None if allowed
+        """
+        # Get the non-empty priority buckets applicable to this tool type
+        plan = self._get_match_plan(tool_type, context)
+
+        # If no rules apply, allow immediately
+        if not plan:
+            return None
+
+        # ASCII content is scanned as bytes, by the bytes patterns and the
+        # Hyperscan databases, whenever both read it the same as the str.
+        # Case-insensitive patterns run several times faster as case-sensitive
+        # ones over a lowercased copy, made once up front: of the bytes when
+        # there are some, else of the str unless lowercasing would change
+        # what the patterns read.
+        data: bytes | None = None
+        folded: str | bytes | None = None
+        if content.isascii() and _STR_ONLY_WHITESPACE_RE.search(content) is None:
+            data = content.encode("ascii")
+            folded = data.lower()
+        elif _CASE_FOLD_UNSAFE_RE.search(content) is None:
+            folded = content.lower()
+
+        # Walk the priority buckets in order; the first blocking hit wins
+        for checks, union, union_bytes, union_folded, automaton, database in plan:
+            if database is not None and data is not None:
+                # Only rules the database reports can match
+                hits: set[int] = set()
+                database.scan(
+                    data,
+                    match_event_handler=lambda index, *_, hits=hits: hits.add(index),
+                )
+                if not hits:
+                    continue
+                candidates = [checks[index] for index in sorted(hits)]
+                decision = self._match_rules(
+                    candidates, content, config, blocking, data=data, folded=folded
+                )
+                if decision is not None:
+                    return decision
+                continue
+
+            # A single scan over the bucket's combined patterns skips the
+            # whole bucket when none of its rules can match. Otherwise no
+            # regex rule can match before the alternation's leftmost hit,
+            # so each one resumes searching from there.
+            start = 0
+            if union is not None and len(content) <= _UNION_CONTENT_MAX:
+                if data is not None and union_folded is not None:
+                    found = union_folded.search(folded)
+                elif data is not None and union_bytes is not None:
+                    found = union_bytes.search(data)
+                else:
+                    found = union.search(content)
+                if found is not None:
+                    start = found.start()
+                elif automaton is None or next(automaton.iter(content), None) is None:
+                    continue
+                else:
+                    # Only the automaton's literal rules can match
+                    start = len(content)
+
+            decision = self._match_rules(
+                checks, content, config, blocking, start, data, folded
+            )
+            if decision is not None:
+                return decision
+
+        return None
+
+    def _match_rules(
+        self,
+        checks: list[_RuleCheck],
+        content: str,
+        config: Any | None,
+        blocking: frozenset[SeverityLevel],
+        start: int = 0,
+        data: bytes | None = None,
+        folded: str | bytes | None = None,
+    ) -> _Decision:
+        """
+        Evaluate the rules of one priority bucket in order.
+
+        Args:
+            checks: Checks of the bucket's rules, sorted by rule_id
+            content: The content to validate
+            config: Optional OutputValidationConfig for rule overrides
+            blocking: Severities that block under the config
+            start: Position before which no regex rule of the bucket matches
+            data: ASCII encoding of content, when regexes may scan it instead
+            folded: Lowercased content (or data), for the case-folded patterns
+
+        Returns:
+            (rule, matched_text) of the first blocking rule, or None
+        """
+        # Case-insensitive required literals are checked against one shared
+        # lowercased copy, made only once such a rule is reached. Non-ASCII
+        # content skips that check (see _required_literals).
+        content_ascii = content.isascii()
+        content_lower: str | None = None
+
+        # With pyahocorasick, one automaton pass per text (content or its
+        # lowercased copy) finds every known required literal, instead of
+        # one substring search per rule. Keyed by ignore_case.
+        automaton, scanned_literals = self._get_required_literal_automaton()
+        literal_hits: dict[bool, set[str]] = {}
+
+        # Regex matches start at or after `start`
+        remaining = len(content) - start
+
+        for rule, min_length, literals, ignore_case, leading in checks:
             # Skip disabled rules
             if not rule.enabled:
                 continue
@@ -164,12 +1527,42 @@ class PatternDetector:
             if config and config.is_rule_disabled(rule.rule_id):
                 continue
 
-            # Check context filter
-            if rule.context != "all" and rule.context != context:
+            # Skip the regex when the content left is shorter than any match
+            if remaining < min_length:
                 continue
 
+            # Skip the regex when none of the literals it requires is present
+            if literals and (content_ascii or not ignore_case):
+                if ignore_case and content_lower is None:
+                    content_lower = content.lower()
+                text = content_lower if ignore_case else content
+                if scanned_literals.issuperset(literals):
+                    hits = literal_hits.get(ignore_case)
+                    if hits is None:
+                        hits = {word for _, word in automaton.iter(text)}
+                        literal_hits[ignore_case] = hits
+                    if hits.isdisjoint(literals):
+                        continue
+                elif not any(map(text.__contains__, literals)):
+                    continue
+
+            # Begin the search where a match can first start: at most
+            # `offset` characters before the earliest leading literal
+            rule_start = start
+            if leading is not None and (content_ascii or not leading[2]):
+                leading_literals, offset, leading_ignore_case = leading
+                if leading_ignore_case and content_lower is None:
+                    content_lower = content.lower()
+                text = content_lower if leading_ignore_case else content
+                positions = [text.find(literal, start) for literal in leading_literals]
+                found = [position for position in positions if position >= 0]
+                if not found:
+                    continue
+                first = min(found)
+                rule_start = max(start, first - offset)
+
             # Attempt to match the pattern
-            match_result = self._match_pattern(rule, content)
+            match_result = self._match_pattern(rule, content, rule_start, data, folded)
 
             if match_result.is_match:
                 # Pattern matched - create block result
@@ -182,27 +1575,356 @@ class PatternDetector:
                         severity = override
 
                 # Check if should block based on severity
-                should_block = self._should_block_by_severity(severity, config)
-
-                if should_block:
-                    return ValidationResult.blocked(
-                        rule=rule,
-                        reason=rule.message or rule.description,
-                        matched_pattern=match_result.matched_text,
-                        tool_name=tool_type.value,
-                        tool_input=tool_input or {},
+                if severity in blocking:
+                    return rule, match_result.matched_text
+
+        return None
+
+    def _get_required_literal_automaton(self) -> tuple[Any, frozenset[str]]:
+        """
+        Get the Aho-Corasick automaton over all known required literals.
+
+        Rules compiled after the automaton was built are not in it yet, so
+        callers only trust it for the literals it reports holding.
+
+        Returns:
+            (automaton, literals it holds); (None, empty set) when
+            pyahocorasick is not installed or there are no literals
+        """
+        if self._required_literal_automaton is None:
+            literals = frozenset(
+                literal
+                for required, _ in self._required_literals.values()
+                for literal in required
+            )
+            automaton = None
+            if HAS_AHOCORASICK and literals:
+                automaton = ahocorasick.Automaton()
+                for literal in literals:
+                    automaton.add_word(literal, literal)
+                automaton.make_automaton()
+            else:
+                literals = frozenset()
+            self._required_literal_automaton = (automaton, literals)
+        return self._required_literal_automaton
+
+    def _get_match_plan(self, tool_type: ToolType, context: str) -> list[_PlanStep]:
+        """
+        Get the priority buckets match() scans for a (tool_type, context).
+
+        Args:
+            tool_type: Type of tool being validated
+            context: Context of validation
+
+        Returns:
+            (rule checks, alternation, bytes alternation, case-folded
+            alternation, literal automaton, Hyperscan database) for each
+            priority bucket with applicable rules, P0 first
+        """
+        key = (tool_type, context)
+        plan = self._match_plans.get(key)
+        if plan is not None:
+            return plan
+
+        plan = []
+        buckets = self._rules_by_tool_priority.get(tool_type, ())
+        for priority, rules in zip(RulePriority, buckets):
+            checks = self._get_rule_checks(rules, context)
+            if checks:
+                union = self._get_union_pattern(tool_type, context, priority)
+                union_bytes = _bytes_variant(union) if union is not None else None
+                union_folded = (
+                    self._get_folded_union_pattern(tool_type, context, priority)
+                    if union_bytes is not None
+                    else None
+                )
+                if union_bytes is not None:
+                    union_bytes = _gated_alternation(union_bytes)
+                if union_folded is not None:
+                    union_folded = _gated_alternation(union_folded)
+                automaton = self._literal_automata.get((tool_type, context, priority))
+                database = (
+                    self._get_hyperscan_database(
+                        tool_type, context, priority, [check[0] for check in checks]
                     )
+                    if self._regex_engine == "hyperscan"
+                    else None
+                )
+                plan.append(
+                    (checks, union, union_bytes, union_folded, automaton, database)
+                )
 
-        # No rules matched - allow the operation
-        return ValidationResult.allowed()
+        self._match_plans[key] = plan
+        return plan
+
+    def _get_rule_checks(
+        self, rules: list[ValidationRule], context: str
+    ) -> list[_RuleCheck]:
+        """
+        Resolve the per-rule checks of a priority bucket for one context.
 
-    def _match_pattern(self, rule: ValidationRule, content: str) -> "PatternMatchResult":
+        Regex rules are compiled here, so their prefilter data is known.
+        Rules for another context, invalid regexes and unknown pattern
+        types can never match and get no check.
+
+        Args:
+            rules: Rules of the bucket, sorted by rule_id
+            context: Context of validation
+
+        Returns:
+            Checks of the applicable rules, in bucket order
+        """
+        checks: list[_RuleCheck] = []
+        for rule in rules:
+            if rule.context != "all" and rule.context != context:
+                continue
+            if rule.pattern_type == "regex":
+                if self._get_compiled(rule.rule_id) is None:
+                    continue
+            elif rule.pattern_type != "literal":
+                continue
+            required = self._required_literals.get(rule.rule_id, ((), False))
+            min_length = self._min_match_lengths.get(rule.rule_id, 0)
+            leading = self._leading_literals.get(rule.rule_id)
+            checks.append((rule, min_length, *required, leading))
+        return checks
+
+    def _get_union_pattern(
+        self,
+        tool_type: ToolType,
+        context: str,
+        priority: RulePriority,
+    ) -> re.Pattern[str] | None:
+        """
+        Get the combined alternation for a (tool_type, context, priority) bucket.
+
+        The alternation matches wherever at least one applicable rule's
+        pattern matches, so a miss proves no rule in the bucket can fire.
+        A hit only says that some rule matched; the per-rule loop still
+        decides which one, honoring priority, config and severity.
+
+        Literal patterns go into a separate Aho-Corasick automaton when
+        pyahocorasick is installed, and are escaped into the alternation
+        otherwise.
+
+        Args:
+            tool_type: Type of tool being validated
+            context: Context of validation
+            priority: Priority level of the bucket
+
+        Returns:
+            Compiled alternation, or None if the bucket cannot be combined
+        """
+        key = (tool_type, context, priority)
+        if key in self._union_patterns:
+            return self._union_patterns[key]
+
+        parts: list[str] = []
+        literals: list[str] = []
+        union: re.Pattern[str] | None = None
+        for rule in self._rules_by_tool_priority[tool_type][_PRIORITY_INDEX[priority]]:
+            if rule.context != "all" and rule.context != context:
+                continue
+
+            if rule.pattern_type == "regex":
+                if self._get_compiled(rule.rule_id) is None:
+                    # Invalid regex - can never match
+                    continue
+                scoped = _scoped_pattern(rule.pattern)
+            elif rule.pattern_type == "literal":
+                if not rule.pattern:
+                    # Empty literal matches everything
+                    scoped = None
+                elif HAS_AHOCORASICK:
+                    literals.append(rule.pattern)
+                    continue
+                else:
+                    scoped = f"(?:{re.escape(rule.pattern)})"
+            else:
+                # Unknown pattern types never match
+                continue
+
+            if scoped is None:
+                break
+            parts.append(scoped)
+        else:
+            try:
+                union = self._compile("|".join(parts)) if parts else _NEVER_MATCHES
+            except re.error:
+                # e.g. the same named group used by two rules
+                union = None
+
+            if union is not None and literals:
+                automaton = ahocorasick.Automaton()
+                for literal in literals:
+                    automaton.add_word(literal, literal)
+                automaton.make_automaton()
+                self._literal_automata[key] = automaton
+
+        self._union_patterns[key] = union
+        return union
+
+    def _get_folded_union_pattern(
+        self,
+        tool_type: ToolType,
+        context: str,
+        priority: RulePriority,
+    ) -> re.Pattern[bytes] | None:
+        """
+        Get the case-folded bytes alternation for a priority bucket.
+
+        Every part is folded as if its rule ignored case, so the alternation
+        matches lowercased ASCII content wherever the bucket's alternation
+        matches the content, and possibly a bit more. That keeps a miss
+        proving no rule can fire, and its leftmost hit a valid start for
+        the per-rule loop.
+
+        Args:
+            tool_type: Type of tool being validated
+            context: Context of validation
+            priority: Priority level of the bucket
+
+        Returns:
+            Compiled alternation, or None if some part cannot be folded
+        """
+        parts: list[str] = []
+        for rule in self._rules_by_tool_priority[tool_type][_PRIORITY_INDEX[priority]]:
+            if rule.context != "all" and rule.context != context:
+                continue
+
+            if rule.pattern_type == "regex":
+                compiled = self._get_compiled(rule.rule_id)
+                if compiled is None:
+                    # Invalid regex - can never match
+                    continue
+                case_sensitive = not compiled.flags & re.IGNORECASE
+                if case_sensitive and _CASE_SENSITIVE_NEGATION_RE.search(rule.pattern):
+                    # Lowercasing could turn a match into a miss
+                    return None
+                folded = _casefolded_pattern(rule.pattern)
+                scoped = _scoped_pattern(folded) if folded is not None else None
+            elif rule.pattern_type == "literal":
+                if HAS_AHOCORASICK:
+                    # Checked by the bucket's automaton instead
+                    continue
+                scoped = f"(?:{re.escape(rule.pattern.lower())})"
+            else:
+                # Unknown pattern types never match
+                continue
+
+            if scoped is None or not scoped.isascii():
+                return None
+            parts.append(scoped)
+
+        try:
+            return re.compile("|".join(parts).encode("ascii")) if parts else None
+        except re.error:
+            return None
+
+    def _get_hyperscan_database(
+        self,
+        tool_type: ToolType,
+        context: str,
+        priority: RulePriority,
+        rules: list[ValidationRule],
+    ) -> Any | None:
+        """
+        Get the Hyperscan prefilter database for a priority bucket.
+
+        Each rule is compiled in prefilter mode under its index in rules, so
+        a scan reports every rule that can match (and possibly a few that
+        cannot). Buckets with a pattern Hyperscan might read differently
+        from Python fall back to the alternation.
+
+        Args:
+            tool_type: Type of tool being validated
+            context: Context of validation
+            priority: Priority level of the bucket
+            rules: Rules of the bucket that apply to the context and can match
+
+        Returns:
+            Compiled database, or None if the bucket cannot use one
+        """
+        key = (tool_type, context, priority)
+        if key in self._hyperscan_databases:
+            return self._hyperscan_databases[key]
+
+        expressions: list[bytes] | None = []
+        ids: list[int] = []
+        for index, rule in enumerate(rules):
+            if rule.pattern_type == "regex":
+                expression = _scoped_pattern(rule.pattern)
+                if _HYPERSCAN_UNSAFE_PATTERN_RE.search(rule.pattern):
+                    expression = None
+            else:
+                # An empty literal matches everything
+                expression = re.escape(rule.pattern) if rule.pattern else None
+
+            # Content is ASCII-only when scanned, so only ASCII patterns
+            # are guaranteed to be read the same way
+            if expression is None or not expression.isascii():
+                expressions = None
+                break
+            expressions.append(expression.encode("ascii"))
+            ids.append(index)
+
+        database = None
+        if expressions:
+            flags = (
+                hyperscan.HS_FLAG_PREFILTER
+                | hyperscan.HS_FLAG_SINGLEMATCH
+                | hyperscan.HS_FLAG_ALLOWEMPTY
+            )
+            database = hyperscan.Database()
+            try:
+                database.compile(
+                    expressions=expressions,
+                    ids=ids,
+                    elements=len(expressions),
+                    flags=[flags] * len(expressions),
+                )
+            except hyperscan.error as e:
+                logger.debug("Hyperscan cannot compile bucket %s: %s", key, e)
+                database = None
+
+        self._hyperscan_databases[key] = database
+        return database
+
+    def _compile(self, pattern: str) -> Any:
+        """
+        Compile a pattern with the configured regex engine.
+
+        Args:
+            pattern: Regex pattern to compile
+
+        Returns:
+            Compiled pattern exposing search()
+
+        Raises:
+            re.error: If the pattern is not a valid regex
+        """
+        return _compile_pattern(pattern, self._regex_engine)
+
+    def _match_pattern(
+        self,
+        rule: ValidationRule,
+        content: str,
+        start: int = 0,
+        data: bytes | None = None,
+        folded: str | bytes | None = None,
+    ) -> "PatternMatchResult":
         """
         Match a single rule's pattern against content.
 
         Args:
             rule: The validation rule to match
             content: The content to check
+            start: Position to start a regex search from. Anchors and
+                lookbehinds still see the whole content.
+            data: ASCII encoding of content, searched with the rule's bytes
+                pattern when it has one
+            folded: Lowercased content (or data), searched with the rule's
+                case-folded pattern when it has one
 
         Returns:
             PatternMatchResult with match status and details
@@ -214,17 +1936,66 @@ class PatternDetector:
                     is_match=True,
                     matched_text=rule.pattern,
                 )
-            return PatternMatchResult(is_match=False)
+            return _NO_MATCH
 
         elif rule.pattern_type == "regex":
             # Regex pattern matching
-            compiled = self._compiled_patterns.get(rule.rule_id)
+            compiled = self._get_compiled(rule.rule_id)
 
             if not compiled:
                 # Pattern wasn't compiled (invalid regex)
-                return PatternMatchResult(is_match=False)
+                return _NO_MATCH
+
+            alternation = self._literal_alternations.get(rule.rule_id)
+            if alternation is not None:
+                # Fixed strings: str.find() instead of the regex engine, on
+                # text that lines up with content position by position
+                if not alternation[1]:
+                    text = content
+                elif isinstance(folded, bytes):
+                    text = content.lower()
+                else:
+                    text = folded
+                if text is not None:
+                    span = _find_literal_alternation(text, alternation, start)
+                    if span is None:
+                        return _NO_MATCH
+                    return PatternMatchResult(
+                        is_match=True, matched_text=content[span[0] : span[1]]
+                    )
+
+            folded_pair = (
+                self._compiled_folded_patterns.get(rule.rule_id)
+                if folded is not None
+                else None
+            )
+            if folded_pair is not None:
+                # Case-folded text differs from content, so take the
+                # matched text and groups from content by position
+                compiled_folded = folded_pair[isinstance(folded, bytes)]
+                match = compiled_folded.search(folded, start)
+                if match is None:
+                    return _NO_MATCH
+                return PatternMatchResult(
+                    is_match=True,
+                    matched_text=content[match.start() : match.end()],
+                    groups={
+                        name: content[match.start(name) : match.end(name)]
+                        if match.start(name) >= 0
+                        else None
+                        for name in compiled_folded.groupindex
+                    },
+                )
 
-            match = compiled.search(content)
+            compiled_bytes = (
+                self._compiled_bytes_patterns.get(rule.rule_id)
+                if data is not None
+                else None
+            )
+            if compiled_bytes is not None:
+                match = compiled_bytes.search(data, start)
+            else:
+                match = compiled.search(content, start)
             if match:
                 # Extract matched text
                 matched_text = match.group(0)
@@ -232,17 +2003,24 @@ class PatternDetector:
                 # If pattern has named groups, include them in result
                 groups = dict(match.groupdict()) if match.groupdict() else {}
 
+                if compiled_bytes is not None:
+                    matched_text = matched_text.decode("ascii")
+                    groups = {
+                        name: value.decode("ascii") if value is not None else None
+                        for name, value in groups.items()
+                    }
+
                 return PatternMatchResult(
                     is_match=True,
                     matched_text=matched_text,
                     groups=groups,
                 )
 
-            return PatternMatchResult(is_match=False)
+            return _NO_MATCH
 
         else:
             # Unknown pattern type - treat as no match
-            return PatternMatchResult(is_match=False)
+            return _NO_MATCH
 
     def _should_block_by_severity(
         self,
@@ -259,18 +2037,22 @@ class PatternDetector:
         Returns:
             True if operation should be blocked, False otherwise
         """
-        # CRITICAL and HIGH always block
-        if severity in (SeverityLevel.CRITICAL, SeverityLevel.HIGH):
-            return True
+        # MEDIUM and LOW don't block by default (warning only)
+        return severity in self._blocking_severities(config)
 
-        # Check strict_mode config
-        if config and getattr(config, "strict_mode", False):
-            # In strict mode, MEDIUM+ blocks
-            if severity == SeverityLevel.MEDIUM:
-                return True
+    def _blocking_severities(self, config: Any | None) -> frozenset[SeverityLevel]:
+        """
+        Get the severities that block under a config.
 
-        # MEDIUM and LOW don't block by default (warning only)
-        return False
+        Args:
+            config: Optional OutputValidationConfig with strict_mode setting
+
+        Returns:
+            Frozenset of blocking severity levels
+        """
+        # In strict mode, MEDIUM+ blocks
+        strict = bool(config and getattr(config, "strict_mode", False))
+        return _BLOCKING_SEVERITIES[strict]
 
     def get_rules(self, tool_type: ToolType | None = None) -> list[ValidationRule]:
         """
@@ -296,21 +2078,34 @@ class PatternDetector:
         Returns:
             ValidationRule if found, None otherwise
         """
-        for rule in self._all_rules:
-            if rule.rule_id == rule_id:
-                return rule
-        return None
+        return self._rules_by_id.get(rule_id)
 
     def clear_rules(self) -> None:
         """Clear all rules from the detector."""
-        for priority in RulePriority:
-            self._rules_by_priority[priority].clear()
+        for rules in self._rules_by_priority:
+            rules.clear()
 
         for tool_type in ToolType:
             self._rules_by_tool[tool_type].clear()
+            for rules in self._rules_by_tool_priority[tool_type]:
+                rules.clear()
 
         self._all_rules.clear()
+        self._rules_by_id.clear()
         self._compiled_patterns.clear()
+        self._compiled_bytes_patterns.clear()
+        self._compiled_folded_patterns.clear()
+        self._literal_alternations.clear()
+        self._leading_literals.clear()
+        self._pending_rules.clear()
+        self._required_literals.clear()
+        self._min_match_lengths.clear()
+        self._required_literal_automaton = None
+        self._union_patterns.clear()
+        self._literal_automata.clear()
+        self._hyperscan_databases.clear()
+        self._match_plans.clear()
+        self._result_cache.clear()
 
     def remove_rule(self, rule_id: str) -> bool:
         """
@@ -322,34 +2117,76 @@ class PatternDetector:
         Returns:
             True if rule was found and removed, False otherwise
         """
-        # Find and remove from all rules
-        rule_to_remove = None
-        for rule in self._all_rules:
-            if rule.rule_id == rule_id:
-                rule_to_remove = rule
-                break
-
-        if not rule_to_remove:
+        rule_to_remove = self._rules_by_id.pop(rule_id, None)
+        if rule_to_remove is None:
             return False
 
         # Remove from all collections
         self._all_rules.remove(rule_to_remove)
-        self._rules_by_priority[rule_to_remove.priority].remove(rule_to_remove)
+
+        # Promote the next rule sharing this ID, if any (rare)
+        for rule in self._all_rules:
+            if rule.rule_id == rule_id:
+                self._rules_by_id[rule_id] = rule
+                break
+        self._rules_by_priority[_PRIORITY_INDEX[rule_to_remove.priority]].remove(
+            rule_to_remove
+        )
 
         for tool_type in rule_to_remove.tool_types:
             if rule_to_remove in self._rules_by_tool[tool_type]:
                 self._rules_by_tool[tool_type].remove(rule_to_remove)
+            self._remove_sorted(
+                self._rules_by_tool_priority[tool_type][
+                    _PRIORITY_INDEX[rule_to_remove.priority]
+                ],
+                rule_to_remove,
+            )
 
         # Remove compiled pattern
         if rule_id in self._compiled_patterns:
             del self._compiled_patterns[rule_id]
+        self._compiled_bytes_patterns.pop(rule_id, None)
+        self._compiled_folded_patterns.pop(rule_id, None)
+        self._literal_alternations.pop(rule_id, None)
+        self._leading_literals.pop(rule_id, None)
+        self._pending_rules.pop(rule_id, None)
+        self._required_literals.pop(rule_id, None)
+        self._min_match_lengths.pop(rule_id, None)
+        self._required_literal_automaton = None
+        self._union_patterns.clear()
+        self._literal_automata.clear()
+        self._hyperscan_databases.clear()
+        self._match_plans.clear()
+        self._result_cache.clear()
 
         return True
 
+    def _remove_sorted(
+        self,
+        rules: list[ValidationRule],
+        rule: ValidationRule,
+    ) -> None:
+        """
+        Remove a rule from a list kept in evaluation order.
+
+        Args:
+            rules: List sorted by _rule_sort_key
+            rule: The rule to remove (matched by identity)
+        """
+        key = _rule_sort_key(rule)
+        index = bisect.bisect_left(rules, key, key=_rule_sort_key)
+        while index < len(rules) and _rule_sort_key(rules[index]) == key:
+            if rules[index] is rule:
+                del rules[index]
+                return
+            index += 1
+
 
 class PatternMatchResult:
     """
-    Result of matching a single pattern against content.
+    Result of matching a single pattern against content. Uses __slots__
+    since one is created for every rule hit.
 
     Attributes:
         is_match: Whether the pattern matched
@@ -357,6 +2194,8 @@ class PatternMatchResult:
         groups: Named groups from regex pattern (if any)
     """
 
+    __slots__ = ("is_match", "matched_text", "groups")
+
     def __init__(
         self,
         is_match: bool,
@@ -368,14 +2207,56 @@ class PatternMatchResult:
         self.groups = groups or {}
 
 
-def create_pattern_detector() -> PatternDetector:
+# Shared result for every miss, which is by far the common case. Callers only
+# read match results, so it must never be modified.
+_NO_MATCH = PatternMatchResult(is_match=False)
+
+
+def create_pattern_detector(regex_engine: str | None = None) -> PatternDetector:
     """
     Factory function to create a PatternDetector instance.
 
     This is the preferred way to create a detector, as it allows
     for easier dependency injection and testing.
 
+    Args:
+        regex_engine: Regex engine to use (see REGEX_ENGINES). Defaults to the
+            AUTO_CLAUDE_REGEX_ENGINE environment variable, then "re". An
+            unusable engine from the environment is logged and ignored, so
+            a bad setting cannot disable validation.
+
     Returns:
         New PatternDetector instance
     """
-    return PatternDetector()
+    if regex_engine is None:
+        regex_engine = _get_regex_engine_from_env()
+    return PatternDetector(regex_engine=regex_engine)
+
+
+def _get_regex_engine_from_env() -> str:
+    """
+    Get the regex engine selected by the environment.
+
+    Returns:
+        Engine name, or DEFAULT_REGEX_ENGINE if unset or unusable
+    """
+    engine = os.getenv(REGEX_ENGINE_ENV_VAR, DEFAULT_REGEX_ENGINE).strip().lower()
+    if engine not in REGEX_ENGINES:
+        logger.warning(
+            "Invalid regex engine %r in %s, using %r",
+            engine,
+            REGEX_ENGINE_ENV_VAR,
+            DEFAULT_REGEX_ENGINE,
+        )
+        return DEFAULT_REGEX_ENGINE
+    installed, package = _ENGINE_PACKAGES.get(engine, (True, ""))
+    if not installed:
+        logger.warning(
+            "%s=%s requires the %s package, using %r",
+            REGEX_ENGINE_ENV_VAR,
+            engine,
+            package,
+            DEFAULT_REGEX_ENGINE,
+        )
+        return DEFAULT_REGEX_ENGINE
+    return engine
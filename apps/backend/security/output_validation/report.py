@@ -33,10 +33,13 @@ Usage:
 
 from __future__ import annotations
 
+import io
 import logging
+from collections import defaultdict
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, TextIO
 
 from .logger import ValidationEventLogger, get_validation_logger
 from .models import SeverityLevel
@@ -49,6 +52,24 @@ from .models import SeverityLevel
 module_logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# SEVERITY ICONS
+# =============================================================================
+
+# Emoji shown next to each severity level; unknown severities get "⚪"
+_SEVERITY_ICON: dict[SeverityLevel, str] = {
+    SeverityLevel.CRITICAL: "🔴",
+    SeverityLevel.HIGH: "🟠",
+    SeverityLevel.MEDIUM: "🟡",
+    SeverityLevel.LOW: "🔵",
+}
+
+# Same icons keyed by severity value, for statistics keyed by string
+_SEVERITY_ICON_TEXT: dict[str, str] = {
+    severity.value: icon for severity, icon in _SEVERITY_ICON.items()
+}
+
+
 # =============================================================================
 # VALIDATION REPORT GENERATOR
 # =============================================================================
@@ -97,264 +118,241 @@ class ValidationReportGenerator:
         Returns:
             Markdown string containing the full report
         """
-        sections = []
+        buffer = io.StringIO()
+        self._write_markdown(buffer)
+        return buffer.getvalue()
+
+    def _write_markdown(self, out: TextIO) -> None:
+        """
+        Write the markdown report section by section.
+
+        Each section writes newline-terminated lines straight to ``out``,
+        so saving a report never materializes it as one string.
+
+        Args:
+            out: Text stream to write the report to
+        """
+        # Statistics are computed once and shared by every section
+        stats = self.logger.get_statistics()
 
         # Title and metadata
-        sections.append(self._generate_header())
-        sections.append("")
+        self._emit_header(out, stats)
+        out.write("\n")
 
         # Summary statistics
-        sections.append(self._generate_summary_section())
-        sections.append("")
+        self._emit_summary_section(out, stats)
+        out.write("\n")
 
         # Blocked operations
         blocked = self.logger.get_blocked_events()
         if blocked:
-            sections.append(self._generate_blocked_section(blocked))
-            sections.append("")
+            self._emit_blocked_section(out, blocked)
+            out.write("\n")
 
         # Warnings
         warnings = self.logger.get_warning_events()
         if warnings:
-            sections.append(self._generate_warning_section(warnings))
-            sections.append("")
+            self._emit_warning_section(out, warnings)
+            out.write("\n")
 
         # Override usage
         overrides = self.logger.get_override_events()
         if overrides:
-            sections.append(self._generate_override_section(overrides))
-            sections.append("")
+            self._emit_override_section(out, overrides)
+            out.write("\n")
 
         # Statistics by tool
-        sections.append(self._generate_tool_statistics())
-        sections.append("")
+        self._emit_tool_statistics(out, stats)
+        out.write("\n")
 
         # Severity breakdown
-        sections.append(self._generate_severity_breakdown())
-        sections.append("")
+        self._emit_severity_breakdown(out, stats)
+        out.write("\n")
 
         # Footer
-        sections.append(self._generate_footer())
-
-        return "\n".join(sections)
+        self._emit_footer(out)
 
-    def _generate_header(self) -> str:
-        """Generate report header with metadata."""
-        stats = self.logger.get_statistics()
+    def _emit_header(self, out: TextIO, stats: dict[str, Any]) -> None:
+        """Emit report header with metadata."""
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
 
-        lines = [
-            "# Output Validation Report",
-            "",
-            f"**Generated:** {timestamp}",
-        ]
+        out.write(
+            "# Output Validation Report\n"
+            "\n"
+            f"**Generated:** {timestamp}\n"
+        )
 
         if self.logger.project_dir:
-            lines.append(f"**Project:** `{self.logger.project_dir}`")
+            out.write(f"**Project:** `{self.logger.project_dir}`\n")
 
         if self.spec_dir:
-            lines.append(f"**Spec Directory:** `{self.spec_dir}`")
-
-        lines.append(f"**Total Validations:** {stats['total_validations']}")
-
-        return "\n".join(lines)
-
-    def _generate_summary_section(self) -> str:
-        """Generate summary statistics section."""
-        stats = self.logger.get_statistics()
-
-        lines = [
-            "## Summary",
-            "",
-            "| Metric | Count |",
-            "|--------|-------|",
-            f"| **Total Validations** | {stats['total_validations']} |",
-            f"| 🔴 **Blocked** | {stats['blocked']} |",
-            f"| ⚠️  **Warnings** | {stats['warnings']} |",
-            f"| ✅ **Allowed** | {stats['allowed']} |",
-            f"| 🔑 **Overrides Used** | {stats['overrides_used']} |",
-        ]
-
-        return "\n".join(lines)
-
-    def _generate_blocked_section(self, blocked: list) -> str:
-        """Generate blocked operations section."""
-        lines = [
-            "## Blocked Operations",
-            "",
-            f"The following {len(blocked)} operations were blocked by validation rules:",
-            "",
-        ]
+            out.write(f"**Spec Directory:** `{self.spec_dir}`\n")
+
+        out.write(f"**Total Validations:** {stats['total_validations']}\n")
+
+    def _emit_summary_section(self, out: TextIO, stats: dict[str, Any]) -> None:
+        """Emit summary statistics section."""
+        out.write(
+            "## Summary\n"
+            "\n"
+            "| Metric | Count |\n"
+            "|--------|-------|\n"
+            f"| **Total Validations** | {stats['total_validations']} |\n"
+            f"| 🔴 **Blocked** | {stats['blocked']} |\n"
+            f"| ⚠️  **Warnings** | {stats['warnings']} |\n"
+            f"| ✅ **Allowed** | {stats['allowed']} |\n"
+            f"| 🔑 **Overrides Used** | {stats['overrides_used']} |\n"
+        )
+
+    def _emit_blocked_section(self, out: TextIO, blocked: list) -> None:
+        """Emit blocked operations section."""
+        out.write(
+            "## Blocked Operations\n"
+            "\n"
+            f"The following {len(blocked)} operations were blocked by validation rules:\n"
+            "\n"
+        )
 
         # Group by rule ID
-        by_rule: dict[str, list] = {}
+        by_rule: dict[str, list] = defaultdict(list)
         for event in blocked:
-            rule_id = event.rule_id or "unknown"
-            if rule_id not in by_rule:
-                by_rule[rule_id] = []
-            by_rule[rule_id].append(event)
+            by_rule[event.rule_id or "unknown"].append(event)
 
         # List each rule's violations
         for rule_id, events in sorted(by_rule.items()):
-            lines.append(f"### {rule_id}")
+            out.write(f"### {rule_id}\n")
 
             # Get first event's details
             first_event = events[0]
             severity_icon = self._severity_icon(first_event.severity)
-            lines.append(f"{severity_icon} **Severity:** {first_event.severity.value if first_event.severity else 'unknown'}")
-            lines.append(f"**Reason:** {first_event.reason}")
-            lines.append(f"**Occurrences:** {len(events)}")
-            lines.append("")
+            out.write(f"{severity_icon} **Severity:** {first_event.severity.value if first_event.severity else 'unknown'}\n")
+            out.write(f"**Reason:** {first_event.reason}\n")
+            out.write(f"**Occurrences:** {len(events)}\n")
+            out.write("\n")
 
             # Show examples (max 3)
-            lines.append("**Examples:**")
+            out.write("**Examples:**\n")
             for i, event in enumerate(events[:3], 1):
-                lines.append(f"{i}. **{event.tool_name}** - {self._format_tool_input(event.tool_input_summary)}")
+                out.write(f"{i}. **{event.tool_name}** - {self._format_tool_input(event.tool_input_summary)}\n")
 
             if len(events) > 3:
-                lines.append(f"   *... and {len(events) - 3} more*")
+                out.write(f"   *... and {len(events) - 3} more*\n")
 
-            lines.append("")
+            out.write("\n")
 
-        return "\n".join(lines)
-
-    def _generate_warning_section(self, warnings: list) -> str:
-        """Generate warnings section."""
-        lines = [
-            "## Warnings",
-            "",
-            f"The following {len(warnings)} warnings were issued:",
-            "",
-        ]
+    def _emit_warning_section(self, out: TextIO, warnings: list) -> None:
+        """Emit warnings section."""
+        out.write(
+            "## Warnings\n"
+            "\n"
+            f"The following {len(warnings)} warnings were issued:\n"
+            "\n"
+        )
 
         # Group by rule ID
-        by_rule: dict[str, list] = {}
+        by_rule: dict[str, list] = defaultdict(list)
         for event in warnings:
-            rule_id = event.rule_id or "unknown"
-            if rule_id not in by_rule:
-                by_rule[rule_id] = []
-            by_rule[rule_id].append(event)
+            by_rule[event.rule_id or "unknown"].append(event)
 
         # List each rule's warnings
         for rule_id, events in sorted(by_rule.items()):
-            lines.append(f"### {rule_id}")
+            out.write(f"### {rule_id}\n")
 
             first_event = events[0]
             severity_icon = self._severity_icon(first_event.severity)
-            lines.append(f"{severity_icon} **Severity:** {first_event.severity.value if first_event.severity else 'unknown'}")
-            lines.append(f"**Reason:** {first_event.reason}")
-            lines.append(f"**Occurrences:** {len(events)}")
-            lines.append("")
+            out.write(f"{severity_icon} **Severity:** {first_event.severity.value if first_event.severity else 'unknown'}\n")
+            out.write(f"**Reason:** {first_event.reason}\n")
+            out.write(f"**Occurrences:** {len(events)}\n")
+            out.write("\n")
 
             # Show examples (max 3)
-            lines.append("**Examples:**")
+            out.write("**Examples:**\n")
             for i, event in enumerate(events[:3], 1):
-                lines.append(f"{i}. **{event.tool_name}** - {self._format_tool_input(event.tool_input_summary)}")
+                out.write(f"{i}. **{event.tool_name}** - {self._format_tool_input(event.tool_input_summary)}\n")
 
             if len(events) > 3:
-                lines.append(f"   *... and {len(events) - 3} more*")
-
-            lines.append("")
+                out.write(f"   *... and {len(events) - 3} more*\n")
 
-        return "\n".join(lines)
+            out.write("\n")
 
-    def _generate_override_section(self, overrides: list) -> str:
-        """Generate override usage section."""
-        lines = [
-            "## Override Tokens Used",
-            "",
-            f"The following {len(overrides)} override tokens were used to bypass validation:",
-            "",
-        ]
+    def _emit_override_section(self, out: TextIO, overrides: list) -> None:
+        """Emit override usage section."""
+        out.write(
+            "## Override Tokens Used\n"
+            "\n"
+            f"The following {len(overrides)} override tokens were used to bypass validation:\n"
+            "\n"
+        )
 
         for i, event in enumerate(overrides, 1):
             token_id = event.override_token_id or "unknown"
-            lines.append(f"{i}. **Token:** `{token_id}`")
-            lines.append(f"   - **Rule:** {event.rule_id}")
-            lines.append(f"   - **Tool:** {event.tool_name}")
-            lines.append(f"   - **Reason:** {event.reason}")
-            lines.append("")
-
-        return "\n".join(lines)
-
-    def _generate_tool_statistics(self) -> str:
-        """Generate statistics by tool section."""
-        stats = self.logger.get_statistics()
+            out.write(
+                f"{i}. **Token:** `{token_id}`\n"
+                f"   - **Rule:** {event.rule_id}\n"
+                f"   - **Tool:** {event.tool_name}\n"
+                f"   - **Reason:** {event.reason}\n"
+                "\n"
+            )
+
+    def _emit_tool_statistics(self, out: TextIO, stats: dict[str, Any]) -> None:
+        """Emit statistics by tool section (an empty line if there are none)."""
         by_tool = stats.get("by_tool", {})
 
         if not by_tool:
-            return ""
-
-        lines = [
-            "## Statistics by Tool",
-            "",
-            "| Tool | Validations |",
-            "|------|-------------|",
-        ]
+            out.write("\n")
+            return
 
-        for tool, count in sorted(by_tool.items(), key=lambda x: x[1], reverse=True):
-            lines.append(f"| {tool} | {count} |")
+        out.write(
+            "## Statistics by Tool\n"
+            "\n"
+            "| Tool | Validations |\n"
+            "|------|-------------|\n"
+        )
 
-        return "\n".join(lines)
+        for tool, count in sorted(by_tool.items(), key=itemgetter(1), reverse=True):
+            out.write(f"| {tool} | {count} |\n")
 
-    def _generate_severity_breakdown(self) -> str:
-        """Generate severity breakdown section."""
-        stats = self.logger.get_statistics()
+    def _emit_severity_breakdown(self, out: TextIO, stats: dict[str, Any]) -> None:
+        """Emit severity breakdown section (an empty line if there are none)."""
         by_severity = stats.get("by_severity", {})
 
         if not by_severity:
-            return ""
+            out.write("\n")
+            return
 
-        lines = [
-            "## Blocked Operations by Severity",
-            "",
-            "| Severity | Count |",
-            "|----------|-------|",
-        ]
+        out.write(
+            "## Blocked Operations by Severity\n"
+            "\n"
+            "| Severity | Count |\n"
+            "|----------|-------|\n"
+        )
 
         # Order by severity level (critical first)
         severity_order = ["critical", "high", "medium", "low"]
         for severity in severity_order:
             if severity in by_severity:
                 icon = self._severity_icon_text(severity)
-                lines.append(f"| {icon} {severity.upper()} | {by_severity[severity]} |")
-
-        return "\n".join(lines)
-
-    def _generate_footer(self) -> str:
-        """Generate report footer."""
-        lines = [
-            "---",
-            "",
-            "*This report was generated by the Auto Claude Output Validation System.*",
-            "",
-            "For more information about validation rules and configuration, see the documentation.",
-        ]
-
-        return "\n".join(lines)
+                out.write(f"| {icon} {severity.upper()} | {by_severity[severity]} |\n")
+
+    def _emit_footer(self, out: TextIO) -> None:
+        """Emit report footer."""
+        out.write(
+            "---\n"
+            "\n"
+            "*This report was generated by the Auto Claude Output Validation System.*\n"
+            "\n"
+            "For more information about validation rules and configuration, see the documentation.\n"
+        )
 
     def _severity_icon(self, severity: SeverityLevel | None) -> str:
         """Get emoji icon for severity level."""
         if not severity:
             return "⚪"
-
-        icons = {
-            SeverityLevel.CRITICAL: "🔴",
-            SeverityLevel.HIGH: "🟠",
-            SeverityLevel.MEDIUM: "🟡",
-            SeverityLevel.LOW: "🔵",
-        }
-        return icons.get(severity, "⚪")
+        return _SEVERITY_ICON.get(severity, "⚪")
 
     def _severity_icon_text(self, severity: str) -> str:
         """Get emoji icon for severity string."""
-        icons = {
-            "critical": "🔴",
-            "high": "🟠",
-            "medium": "🟡",
-            "low": "🔵",
-        }
-        return icons.get(severity, "⚪")
+        return _SEVERITY_ICON_TEXT.get(severity, "⚪")
 
     def _format_tool_input(self, tool_input: dict[str, Any]) -> str:
         """
@@ -410,12 +408,9 @@ class ValidationReportGenerator:
         # Ensure parent directory exists
         report_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate markdown
-        markdown = self.generate_markdown()
-
-        # Write to file
-        with open(report_path, "w") as f:
-            f.write(markdown)
+        # Stream the report straight into the file
+        with open(report_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            self._write_markdown(f)
 
         module_logger.info(f"Validation report saved to {report_path}")
 
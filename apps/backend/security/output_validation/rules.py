@@ -8,6 +8,7 @@ This module provides:
 - BASH_RULES: Dangerous command patterns (rm -rf, drop database, etc.)
 - FILE_WRITE_RULES: Dangerous file content patterns (secrets, malware indicators)
 - FILE_PATH_RULES: Dangerous path patterns (system files, config overwrites)
+- RULES_BY_TOOL: Default rules that apply to each tool type
 - get_default_rules(): Function to load all default rules
 
 Rules are organized by category with clear documentation for easy customization.
@@ -20,11 +21,15 @@ from .models import (
     ValidationRule,
 )
 
+# Patterns never let two unbounded quantifiers compete for the same characters
+# (e.g. "\s+.*\s*"): the backtracking "re" engine retries every split between
+# them, which turns a long whitespace run into seconds of matching.
+
 # ============================================================================
 # BASH COMMAND RULES
 # ============================================================================
 
-BASH_RULES: list[ValidationRule] = [
+BASH_RULES: tuple[ValidationRule, ...] = (
     # --------------------------------------------------------------------
     # P0: Critical - Destructive operations
     # --------------------------------------------------------------------
@@ -50,7 +55,7 @@ BASH_RULES: list[ValidationRule] = [
         rule_id="bash-dd-overwrite",
         name="Block Device Overwrite",
         description="Detects dd commands that would overwrite disk blocks or devices",
-        pattern=r"(?i)\bdd\s+(.*\s)?(of=/dev/(sd[a-z]|nvme|mmcblk)|if=/dev/zero|if=/dev/random)",
+        pattern=r"(?i)\bdd\s+(\S.*\s)?(of=/dev/(sd[a-z]|nvme|mmcblk)|if=/dev/zero|if=/dev/random)",
         pattern_type="regex",
         severity=SeverityLevel.CRITICAL,
         priority=RulePriority.P0,
@@ -197,7 +202,7 @@ BASH_RULES: list[ValidationRule] = [
         rule_id="bash-sudo-root",
         name="Privilege Escalation to Root",
         description="Detects suspicious sudo commands that escalate to root",
-        pattern=r"(?i)\bsudo\s+(su\s+-|/bin/bash|/bin/sh|.*\s&&\s*)",
+        pattern=r"(?i)\bsudo\s+(su\s+-|/bin/bash|/bin/sh|(?:\S.*)?\s&&\s*)",
         pattern_type="regex",
         severity=SeverityLevel.HIGH,
         priority=RulePriority.P1,
@@ -236,7 +241,7 @@ BASH_RULES: list[ValidationRule] = [
         rule_id="bash-wget-remote-script",
         name="Download and Execute Remote Script",
         description="Detects wget/curl followed by pipe to shell",
-        pattern=r"(?i)(curl|wget)\s+.*\s*\|\s*(bash|sh|python|node)",
+        pattern=r"(?i)(curl|wget)\s+(?:\S.*(?:\n\s*)?)?\|\s*(bash|sh|python|node)",
         pattern_type="regex",
         severity=SeverityLevel.MEDIUM,
         priority=RulePriority.P2,
@@ -254,7 +259,7 @@ BASH_RULES: list[ValidationRule] = [
         rule_id="bash-history-clear",
         name="Clear Command History",
         description="Detects attempts to clear bash history",
-        pattern=r"(?i)\b(history\s+-c|rm\s+.*\.bash_history|cat\s+/dev/null\s+>\s+\.bash_history)",
+        pattern=r"(?i)\b(history\s+-c|rm\s+(?:\S.*)?\.bash_history|cat\s+/dev/null\s+>\s+\.bash_history)",
         pattern_type="regex",
         severity=SeverityLevel.MEDIUM,
         priority=RulePriority.P2,
@@ -293,7 +298,7 @@ BASH_RULES: list[ValidationRule] = [
         rule_id="bash-base64-decode-exec",
         name="Base64-Encoded Command Execution",
         description="Detects base64 decode followed by command execution",
-        pattern=r"(?i)(base64\s+-d|--decode\s+|.*\s*echo\s+.*\s*\|\s*base64\s+-d).*\|\s*(bash|sh|python|php|node|perl)",
+        pattern=r"(?i)(base64\s+-d.*|--decode\s+(?:\S.*)?)\|\s*(bash|sh|python|php|node|perl)",
         pattern_type="regex",
         severity=SeverityLevel.HIGH,
         priority=RulePriority.P2,
@@ -329,7 +334,7 @@ BASH_RULES: list[ValidationRule] = [
         rule_id="bash-command-chain-dangerous",
         name="Dangerous Command Chain",
         description="Detects chains of commands that could be malicious",
-        pattern=r"(?i)\b(rm\s+-rf?|dd\s+|mkfs|chmod\s+777|> /dev/).*(&&|\||;).*\b(rm|dd|mkfs|chmod|kill|drop|truncate)",
+        pattern=r"(?i)\b(rm\s+-rf?|dd\s|mkfs|chmod\s+777|> /dev/)[^\n&|;]*(?:&[^\n&|;]+)*&?(&&|\||;).*\b(rm|dd|mkfs|chmod|kill|drop|truncate)",
         pattern_type="regex",
         severity=SeverityLevel.HIGH,
         priority=RulePriority.P2,
@@ -400,13 +405,13 @@ BASH_RULES: list[ValidationRule] = [
         ],
         category="deprecation",
     ),
-]
+)
 
 # ============================================================================
 # FILE WRITE RULES (Content-based)
 # ============================================================================
 
-FILE_WRITE_RULES: list[ValidationRule] = [
+FILE_WRITE_RULES: tuple[ValidationRule, ...] = (
     # --------------------------------------------------------------------
     # P0: Critical - Secret exposure
     # --------------------------------------------------------------------
@@ -433,7 +438,7 @@ FILE_WRITE_RULES: list[ValidationRule] = [
         rule_id="write-aws-key-pattern",
         name="AWS Access Key in File",
         description="Detects AWS access keys being written to files",
-        pattern=r"(?i)aws_access_key_id\s*[=:]\s*['\"]?(AKIA[0-9A-Z]{16})",
+        pattern=r"(?i:aws_access_key_id)\s*[=:]\s*['\"]?(AKIA[0-9A-Z]{16})",
         pattern_type="regex",
         severity=SeverityLevel.CRITICAL,
         priority=RulePriority.P0,
@@ -530,7 +535,7 @@ FILE_WRITE_RULES: list[ValidationRule] = [
         rule_id="write-reverse-shell",
         name="Reverse Shell Pattern",
         description="Detects reverse shell patterns",
-        pattern=r"(?i)(?:bash\s+-i\s+>&\s*/dev/tcp/|nc\s+.*\s+-e\s+|/bin/sh\s+-i)",
+        pattern=r"(?i)(?:bash\s+-i\s+>&\s*/dev/tcp/|nc\s+(?:\s|\S.*(?:\n\s*|\s))-e\s+|/bin/sh\s+-i)",
         pattern_type="regex",
         severity=SeverityLevel.CRITICAL,
         priority=RulePriority.P1,
@@ -583,13 +588,13 @@ FILE_WRITE_RULES: list[ValidationRule] = [
         ],
         category="resource_abuse",
     ),
-]
+)
 
 # ============================================================================
 # FILE PATH RULES (Path-based)
 # ============================================================================
 
-FILE_PATH_RULES: list[ValidationRule] = [
+FILE_PATH_RULES: tuple[ValidationRule, ...] = (
     # --------------------------------------------------------------------
     # P0: Critical - System files
     # --------------------------------------------------------------------
@@ -797,13 +802,13 @@ FILE_PATH_RULES: list[ValidationRule] = [
         ],
         category="system_files",
     ),
-]
+)
 
 # ============================================================================
 # WEB FETCH/SEARCH RULES
 # ============================================================================
 
-WEB_RULES: list[ValidationRule] = [
+WEB_RULES: tuple[ValidationRule, ...] = (
     ValidationRule(
         rule_id="web-fetch-internal-ip",
         name="Access Internal Network Resource",
@@ -840,19 +845,76 @@ WEB_RULES: list[ValidationRule] = [
         ],
         category="file_access",
     ),
-]
+)
 
 # ============================================================================
 # DEFAULT RULE SETS
 # ============================================================================
 
-ALL_DEFAULT_RULES: list[ValidationRule] = [
+ALL_DEFAULT_RULES: tuple[ValidationRule, ...] = (
     *BASH_RULES,
     *FILE_WRITE_RULES,
     *FILE_PATH_RULES,
     *WEB_RULES,
-]
+)
 
+# Default rules that apply to each tool type, in ALL_DEFAULT_RULES order.
+# Rules without tool_types apply to every tool.
+RULES_BY_TOOL: dict[ToolType, tuple[ValidationRule, ...]] = {
+    tool_type: tuple(
+        r for r in ALL_DEFAULT_RULES if tool_type in r.tool_types or not r.tool_types
+    )
+    for tool_type in ToolType
+}
+
+# Rank of each priority when listing rule IDs (P0 first)
+_PRIORITY_ORDER: dict[RulePriority, int] = {
+    RulePriority.P0: 0,
+    RulePriority.P1: 1,
+    RulePriority.P2: 2,
+    RulePriority.P3: 3,
+}
+
+# Rank of each severity for min_severity filtering (LOW lowest)
+_SEVERITY_ORDER: dict[SeverityLevel, int] = {
+    SeverityLevel.LOW: 0,
+    SeverityLevel.MEDIUM: 1,
+    SeverityLevel.HIGH: 2,
+    SeverityLevel.CRITICAL: 3,
+}
+
+# Sorted, de-duplicated categories of the default rules
+_RULE_CATEGORIES: tuple[str, ...] = tuple(
+    sorted({r.category for r in ALL_DEFAULT_RULES})
+)
+
+# IDs of the default rules sorted by priority, category and ID
+_RULE_IDS: tuple[str, ...] = tuple(
+    r.rule_id
+    for r in sorted(
+        ALL_DEFAULT_RULES,
+        key=lambda r: (_PRIORITY_ORDER.get(r.priority, 99), r.category, r.rule_id),
+    )
+)
+
+# Indexes for get_default_rules(). Like RULES_BY_TOOL, each keeps
+# ALL_DEFAULT_RULES order.
+_RULES_BY_CATEGORY: dict[str, tuple[ValidationRule, ...]] = {
+    category: tuple(r for r in ALL_DEFAULT_RULES if r.category == category)
+    for category in _RULE_CATEGORIES
+}
+_RULES_BY_MIN_SEVERITY: dict[SeverityLevel, tuple[ValidationRule, ...]] = {
+    severity: tuple(
+        r
+        for r in ALL_DEFAULT_RULES
+        if _SEVERITY_ORDER.get(r.severity, 0) >= _SEVERITY_ORDER[severity]
+    )
+    for severity in SeverityLevel
+}
+
+# Default rules by ID for get_rule_by_id(). Rule IDs are unique, which
+# test_default_rule_ids_are_unique enforces.
+_RULES_BY_ID: dict[str, ValidationRule] = {r.rule_id: r for r in ALL_DEFAULT_RULES}
 
 def get_default_rules(
     tool_type: ToolType | None = None,
@@ -884,28 +946,31 @@ def get_default_rules(
             min_severity=SeverityLevel.HIGH
         )
     """
-    rules = ALL_DEFAULT_RULES.copy()
+    if not (tool_type or category or min_severity):
+        return list(ALL_DEFAULT_RULES)
 
-    # Filter by tool type
+    # Start from the smallest precomputed index the filters select
+    candidates = []
     if tool_type:
-        rules = [r for r in rules if tool_type in r.tool_types or not r.tool_types]
-
-    # Filter by category
+        candidates.append(RULES_BY_TOOL.get(tool_type, ()))
     if category:
-        rules = [r for r in rules if r.category == category]
-
-    # Filter by severity
+        candidates.append(_RULES_BY_CATEGORY.get(category, ()))
     if min_severity:
-        severity_order = {
-            SeverityLevel.LOW: 0,
-            SeverityLevel.MEDIUM: 1,
-            SeverityLevel.HIGH: 2,
-            SeverityLevel.CRITICAL: 3,
-        }
-        min_level = severity_order[min_severity]
-        rules = [r for r in rules if severity_order.get(r.severity, 0) >= min_level]
-
-    return rules
+        candidates.append(_RULES_BY_MIN_SEVERITY[min_severity])
+    if len(candidates) == 1:
+        # A single filter, which the index already applied
+        return list(candidates[0])
+    rules = min(candidates, key=len)
+
+    # Apply the remaining filters; the order of the index is kept
+    min_level = _SEVERITY_ORDER[min_severity] if min_severity else 0
+    return [
+        r
+        for r in rules
+        if (not tool_type or tool_type in r.tool_types or not r.tool_types)
+        and (not category or r.category == category)
+        and _SEVERITY_ORDER.get(r.severity, 0) >= min_level
+    ]
 
 
 def get_rule_by_id(rule_id: str) -> ValidationRule | None:
@@ -918,10 +983,7 @@ def get_rule_by_id(rule_id: str) -> ValidationRule | None:
     Returns:
         ValidationRule if found, None otherwise
     """
-    for rule in ALL_DEFAULT_RULES:
-        if rule.rule_id == rule_id:
-            return rule
-    return None
+    return _RULES_BY_ID.get(rule_id)
 
 
 def list_rule_categories() -> list[str]:
@@ -931,8 +993,7 @@ def list_rule_categories() -> list[str]:
     Returns:
         List of category names
     """
-    categories = set(r.category for r in ALL_DEFAULT_RULES)
-    return sorted(categories)
+    return list(_RULE_CATEGORIES)
 
 
 def list_rule_ids() -> list[str]:
@@ -942,16 +1003,4 @@ def list_rule_ids() -> list[str]:
     Returns:
         List of rule IDs sorted by priority and category
     """
-    priority_order = {
-        RulePriority.P0: 0,
-        RulePriority.P1: 1,
-        RulePriority.P2: 2,
-        RulePriority.P3: 3,
-    }
-
-    sorted_rules = sorted(
-        ALL_DEFAULT_RULES,
-        key=lambda r: (priority_order.get(r.priority, 99), r.category, r.rule_id),
-    )
-
-    return [r.rule_id for r in sorted_rules]
+    return list(_RULE_IDS)
@@ -9,6 +9,7 @@ from pathlib import Path
 
 import pytest
 
+from security.output_validation import allowed_paths
 from security.output_validation.allowed_paths import (
     AllowedPathsChecker,
     compile_glob_patterns,
@@ -251,6 +252,45 @@ class TestAllowedPathsChecker:
         )
         assert config_checker.has_allowed_paths()
 
+    def test_combined_regex_agrees_with_fnmatch(self, temp_project_dir):
+        """Test the combined allowlist regex matches exactly what fnmatch does."""
+        patterns = ["tests/**", "*.tmp", "[!s]rc/*.py", "docs/?.md", "docs/index.md",
+                    "Makefile"]
+        checker = AllowedPathsChecker(
+            temp_project_dir,
+            OutputValidationConfig(allowed_paths=patterns)
+        )
+
+        for path in ("tests/a/b.py", "x.tmp", "arc/m.py", "src/m.py", "docs/a.md",
+                     "docs/ab.md", "other/file.py", "docs/index.md", "docs/index.mdx",
+                     "Makefile", "Makefile/x"):
+            expected = any(
+                checker._matches_pattern(path, pattern) for pattern in patterns
+            )
+            assert checker.is_allowed(path) is expected
+
+    def test_patterns_compiled_on_first_check(self, temp_project_dir, test_config):
+        """Test the allowlist regexes are only compiled once a path is checked."""
+        checker = AllowedPathsChecker(temp_project_dir, test_config)
+        assert checker._allowed_regexes is None
+
+        assert checker.is_allowed("tests/test_api.py")
+        assert checker._allowed_regexes is not None
+
+    def test_match_results_cached(self, temp_project_dir, test_config, monkeypatch):
+        """Test repeated paths reuse the cached result, least recent evicted."""
+        monkeypatch.setattr(allowed_paths, "MATCH_CACHE_SIZE", 2)
+        checker = AllowedPathsChecker(temp_project_dir, test_config)
+
+        assert checker.is_allowed("tests/test_api.py")
+        assert not checker.is_allowed("src/main.py")
+        assert checker.is_allowed("tests/test_api.py")
+        assert list(checker._match_cache) == ["src/main.py", "tests/test_api.py"]
+
+        assert checker.is_allowed("build/app.js")
+        assert list(checker._match_cache) == ["tests/test_api.py", "build/app.js"]
+        assert checker._match_cache["tests/test_api.py"] == "tests/**"
+
 
 # =============================================================================
 # Convenience Functions Tests
@@ -265,6 +305,23 @@ class TestConvenienceFunctions:
         assert is_path_allowed("build/app.js", temp_project_dir, test_config)
         assert not is_path_allowed("src/main.py", temp_project_dir, test_config)
 
+    def test_is_path_allowed_reuses_checker(self, temp_project_dir, test_config):
+        """Test is_path_allowed keeps one checker per project and allowlist."""
+        assert is_path_allowed("tests/test.py", temp_project_dir, test_config)
+        checker = allowed_paths._get_checker(
+            str(temp_project_dir), tuple(test_config.allowed_paths)
+        )
+        assert "tests/test.py" in checker._match_cache
+
+        # A changed allowlist gets its own checker
+        test_config.allowed_paths = ["src/**"]
+        assert is_path_allowed("src/main.py", temp_project_dir, test_config)
+        assert not is_path_allowed("tests/test.py", temp_project_dir, test_config)
+
+    def test_is_path_allowed_empty_config(self, temp_project_dir, empty_config):
+        """Test is_path_allowed rejects every path when nothing is configured."""
+        assert not is_path_allowed("tests/test.py", temp_project_dir, empty_config)
+
     def test_get_allowed_paths(self, temp_project_dir, test_config):
         """Test get_allowed_paths convenience function."""
         patterns = get_allowed_paths(temp_project_dir, test_config)
@@ -393,6 +450,32 @@ class TestEdgeCases:
         # Invalid patterns should be skipped (logged as warning)
         assert len(checker.allowed_patterns) == 1  # Only the valid one
 
+    def test_relative_path_resolved_to_absolute(self, temp_project_dir):
+        """Test relative paths are matched absolute with symlinks resolved."""
+        build_dir = temp_project_dir.resolve() / "build"
+        build_dir.mkdir()
+        config = OutputValidationConfig(allowed_paths=[f"{build_dir}/*"])
+        checker = AllowedPathsChecker(temp_project_dir, config)
+
+        assert checker.is_allowed("src/../build/app.js")
+
+        (temp_project_dir / "link").symlink_to(build_dir, target_is_directory=True)
+        assert checker.is_allowed("link/app.js")
+        # The link may change, so the result is not cached
+        assert "link/app.js" not in checker._match_cache
+
+    def test_symlink_escaping_project_not_allowed(self, temp_project_dir, tmp_path):
+        """Test a relative path through a link out of the project is not allowed."""
+        project_dir = temp_project_dir.resolve()
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (project_dir / "link").symlink_to(outside, target_is_directory=True)
+        config = OutputValidationConfig(allowed_paths=[f"{project_dir}/**"])
+        checker = AllowedPathsChecker(project_dir, config)
+
+        assert checker.is_allowed("src/app.py")
+        assert not checker.is_allowed("link/x")
+
     def test_absolute_pattern_in_config(self, temp_project_dir):
         """Test absolute path patterns in config."""
         abs_path = str(temp_project_dir / "build")
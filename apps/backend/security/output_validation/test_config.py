@@ -11,6 +11,7 @@ from pathlib import Path
 import pytest
 
 # Import the module under test
+from security.output_validation import config as config_module
 from security.output_validation.config import (
     CONFIG_FILENAMES,
     ValidationConfigLoader,
@@ -20,7 +21,7 @@ from security.output_validation.config import (
     is_yaml_available,
     load_validation_config,
 )
-from security.output_validation.models import SeverityLevel
+from security.output_validation.models import OutputValidationConfig, SeverityLevel
 
 
 # =============================================================================
@@ -185,6 +186,14 @@ class TestValidationConfigLoader:
         assert config.version == "1.0"
         assert loader.has_config_file() is True
 
+    def test_json_fallback_without_orjson(self, valid_json_config: Path, monkeypatch):
+        """Test the stdlib json fallback reads the same config data."""
+        loader = ValidationConfigLoader(valid_json_config.parent.parent)
+        data = loader._read_config_file(valid_json_config)
+
+        monkeypatch.setattr(config_module, "HAS_ORJSON", False)
+        assert loader._read_config_file(valid_json_config) == data
+
     def test_load_with_valid_yaml_config(self, valid_yaml_config: Path):
         """Test loading a valid YAML config file."""
         loader = ValidationConfigLoader(valid_yaml_config.parent.parent)
@@ -308,6 +317,22 @@ class TestModuleFunctions:
 
         assert config1 is config2
 
+    def test_load_validation_config_reloads_on_change(self, valid_json_config: Path):
+        """Test that editing or removing the config file invalidates the cache."""
+        project_dir = valid_json_config.parent.parent
+        config1 = load_validation_config(project_dir)
+
+        valid_json_config.write_text(
+            json.dumps({"strict_mode": True, "version": "2.0"})
+        )
+        config2 = load_validation_config(project_dir)
+        assert config2 is not config1
+        assert config2.strict_mode is True
+        assert load_validation_config(project_dir) is config2
+
+        valid_json_config.unlink()
+        assert load_validation_config(project_dir) == OutputValidationConfig()
+
     def test_get_validation_config(self, valid_json_config: Path):
         """Test get_validation_config function."""
         project_dir = valid_json_config.parent.parent
@@ -6,6 +6,8 @@ Tests for loading, validating, and merging custom validation rules from
 project configuration.
 """
 
+import sys
+
 import pytest
 
 from security.output_validation.config import OutputValidationConfig
@@ -153,6 +155,34 @@ class TestPatternSafetyValidation:
 
             assert "nested quantifiers" in str(exc_info.value).lower()
 
+    def test_nested_quantifiers_behind_alternation(self):
+        """Test that nesting hidden behind alternation or groups is rejected."""
+        nested_quantifier_patterns = [
+            r"(\w+|-)+$",
+            r"((a+))+",
+            r"(x|\d+)*y",
+        ]
+
+        for pattern in nested_quantifier_patterns:
+            with pytest.raises(CustomRuleError) as exc_info:
+                validate_pattern_safety(pattern, "regex")
+
+            assert "nested quantifiers" in str(exc_info.value).lower()
+
+        # Bounded inner repeats stay allowed
+        validate_pattern_safety(r"(\d{1,3}\.){3}\d+", "regex")
+        validate_pattern_safety(r"(a|b)+", "regex")
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 11), reason="atomic groups need Python 3.11"
+    )
+    def test_nested_quantifiers_inside_atomic_group(self):
+        """Test that nesting inside an atomic group is rejected."""
+        with pytest.raises(CustomRuleError) as exc_info:
+            validate_pattern_safety(r"((?>a+)|b)+", "regex")
+
+        assert "nested quantifiers" in str(exc_info.value).lower()
+
     def test_overlapping_alternations(self):
         """Test that overlapping alternations are rejected."""
         overlapping_patterns = [
@@ -251,6 +281,29 @@ class TestLoadCustomRules:
         assert rules[0].rule_id == "rule-1"
         assert rules[1].rule_id == "rule-2"
 
+    def test_repeated_text_shares_one_string(self):
+        """Test that rules repeating a message or suggestion share the string."""
+        advice = "".join(["Review ", "before running"])
+        config = OutputValidationConfig(
+            custom_rules=[
+                {
+                    "rule_id": f"rule-{n}",
+                    "name": f"Rule {n}",
+                    "description": "Rule",
+                    "pattern": f"pattern-{n}",
+                    "message": "".join(["Blocked ", "by policy"]),
+                    "suggestions": ["".join(["Review ", "before running"])],
+                }
+                for n in (1, 2)
+            ]
+        )
+
+        rules = load_custom_rules(config)
+
+        assert rules[0].message is rules[1].message
+        assert rules[0].suggestions[0] is rules[1].suggestions[0]
+        assert rules[0].suggestions == [advice]
+
     def test_load_disabled_custom_rule(self):
         """Test that disabled custom rules are not loaded."""
         config = OutputValidationConfig(
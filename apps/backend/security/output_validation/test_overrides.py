@@ -22,15 +22,19 @@ from unittest import mock
 
 import pytest
 
+from . import overrides
 from .models import OverrideToken
 from .overrides import (
     TokenStorage,
     OverrideTokenManager,
     cleanup_expired_tokens,
+    clear_manager_cache,
     format_command_scope,
     format_file_scope,
     generate_override_token,
+    is_token_id,
     list_override_tokens,
+    new_token_id,
     parse_scope,
     revoke_override_token,
     use_override_token,
@@ -107,6 +111,46 @@ def test_parse_scope_invalid():
     assert scope_value == "invalid_scope"
 
 
+def test_token_expiry_epoch_tracks_expires_at():
+    """Test that the cached expiry follows changes to expires_at."""
+    token = OverrideToken(token_id="t", rule_id="bash-rm-rf")
+    assert token.expires_epoch == float("inf")
+
+    future = datetime.now(timezone.utc) + timedelta(hours=1)
+    token.expires_at = future.isoformat()
+    assert token.expires_epoch == pytest.approx(future.timestamp())
+    assert token.is_valid() is True
+    assert token.is_valid(now=future.timestamp() + 1) is False
+
+    token.expires_at = "not-a-date"
+    assert token.is_valid() is False
+
+
+def test_token_serialized_form_is_cached():
+    """Test that the serialized dict is reused until a field changes."""
+    token = OverrideToken(token_id="t", rule_id="bash-rm-rf", max_uses=2)
+    first = token.serialized()
+    assert token.serialized() is first
+    assert token.to_dict() == first
+    assert token.to_dict() is not first
+
+    token.use_token()
+    assert token.serialized() is not first
+    assert token.serialized()["use_count"] == 1
+
+
+def test_new_token_id_format():
+    """Test generated token ids and legacy UUID ids are recognised."""
+    token_id = new_token_id()
+    assert len(token_id) == 26
+    assert is_token_id(token_id)
+    assert new_token_id() != token_id
+
+    assert is_token_id("123e4567-e89b-12d3-a456-426614174000")
+    assert not is_token_id("--include-expired")
+    assert not is_token_id("")
+
+
 # =============================================================================
 # TOKEN STORAGE TESTS
 # =============================================================================
@@ -125,6 +169,20 @@ def test_storage_creates_auto_claude_dir(storage: TokenStorage, temp_project_dir
     assert auto_claude_dir.is_dir()
 
 
+def test_storage_recreates_removed_auto_claude_dir(temp_project_dir: Path):
+    """Test saving after .auto-claude was removed behind a cached storage."""
+    import shutil
+
+    TokenStorage(temp_project_dir)
+    shutil.rmtree(temp_project_dir / ".auto-claude")
+
+    # Directory is known-ready in this process, so it is not re-created here
+    storage = TokenStorage(temp_project_dir)
+    storage.add_token(OverrideToken(token_id="test-token-1", rule_id="bash-rm-rf"))
+    assert storage.save_tokens() is True
+    assert storage.tokens_file.exists()
+
+
 def test_storage_load_empty(storage: TokenStorage):
     """Test loading when tokens file doesn't exist."""
     tokens = storage.load_tokens()
@@ -177,6 +235,53 @@ def test_storage_get_token(storage: TokenStorage):
     assert storage.get_token("non-existent") is None
 
 
+def test_storage_get_token_lazy(storage: TokenStorage):
+    """Test single-token lookup without a full load."""
+    for i in range(3):
+        storage.add_token(OverrideToken(token_id=f"token-{i}", rule_id="bash-rm-rf"))
+    storage.add_token(
+        OverrideToken(token_id="used-up", rule_id="bash-rm-rf", max_uses=1, use_count=1)
+    )
+    storage.save_tokens()
+
+    fresh = TokenStorage(storage.project_dir)
+    retrieved = fresh.get_token_lazy("token-1")
+    assert retrieved is not None
+    assert retrieved.token_id == "token-1"
+
+    assert fresh.get_token_lazy("used-up") is None
+    assert fresh.get_token_lazy("non-existent") is None
+    # Lookup must not populate the storage
+    assert fresh.tokens == {}
+
+
+def test_storage_get_token_lazy_sees_revocation_while_dirty(storage: TokenStorage):
+    """Test that unsaved changes don't hide a token revoked by another process."""
+    storage.add_token(OverrideToken(token_id="revoked", rule_id="bash-rm-rf"))
+    storage.save_tokens()
+    storage.add_token(OverrideToken(token_id="unsaved", rule_id="bash-rm-rf"))
+
+    other = TokenStorage(storage.project_dir)
+    other.load_tokens()
+    assert other.remove_token("revoked") is True
+    other.save_tokens()
+
+    assert storage.get_token_lazy("revoked") is None
+    assert storage.get_token_lazy("unsaved") is not None
+    assert set(TokenStorage(storage.project_dir).load_tokens()) == {"unsaved"}
+
+
+def test_storage_get_token_lazy_empty_storage_not_reread(storage: TokenStorage):
+    """Test that an empty but current storage answers without reading the file."""
+    storage.add_token(OverrideToken(token_id="token-1", rule_id="bash-rm-rf"))
+    storage.remove_token("token-1")
+    storage.save_tokens()
+
+    with mock.patch.object(overrides, "_read_tokens_data") as read:
+        assert storage.get_token_lazy("token-1") is None
+    read.assert_not_called()
+
+
 def test_storage_remove_token(storage: TokenStorage):
     """Test removing a token."""
     token = OverrideToken(
@@ -264,6 +369,37 @@ def test_storage_list_tokens(storage: TokenStorage):
     assert filtered[0].token_id == "token-1"
 
 
+def test_storage_cleanup_sees_in_place_changes(storage: TokenStorage):
+    """Test that cleanup sees expiry and limits changed on stored tokens."""
+    expiring = OverrideToken(token_id="expiring", rule_id="bash-rm-rf", max_uses=0)
+    limited = OverrideToken(
+        token_id="limited", rule_id="bash-rm-rf", max_uses=5, use_count=1
+    )
+    storage.add_token(expiring)
+    storage.add_token(limited)
+    assert storage.cleanup_expired() == 0
+
+    expiring.expires_at = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+    limited.max_uses = 1
+    assert storage.cleanup_expired() == 2
+    assert storage.tokens == {}
+
+
+def test_storage_rule_index_follows_changes(storage: TokenStorage):
+    """Test that rule filtering stays correct across replace and remove."""
+    storage.add_token(OverrideToken(token_id="token-1", rule_id="bash-rm-rf"))
+    storage.add_token(OverrideToken(token_id="token-2", rule_id="bash-rm-rf"))
+
+    # Re-adding under another rule moves the token
+    storage.add_token(OverrideToken(token_id="token-2", rule_id="bash-chmod-777"))
+    assert [t.token_id for t in storage.list_tokens(rule_id="bash-rm-rf")] == ["token-1"]
+    assert [t.token_id for t in storage.list_tokens(rule_id="bash-chmod-777")] == ["token-2"]
+
+    storage.remove_token("token-1")
+    assert storage.list_tokens(rule_id="bash-rm-rf") == []
+    assert storage.tokens_for_rule("bash-rm-rf") == []
+
+
 # =============================================================================
 # OVERRIDE TOKEN MANAGER TESTS
 # =============================================================================
@@ -682,6 +818,81 @@ def test_cleanup_expired_tokens(temp_project_dir: Path):
     assert count >= 1
 
 
+def test_convenience_functions_share_manager(temp_project_dir: Path):
+    """Test that convenience functions reuse one manager per project."""
+    token = generate_override_token(
+        rule_id="bash-rm-rf",
+        project_dir=temp_project_dir,
+    )
+
+    with mock.patch.object(overrides, "OverrideTokenManager") as manager_cls:
+        assert validate_override_token(
+            token_id=token.token_id,
+            rule_id="bash-rm-rf",
+            project_dir=temp_project_dir / ".auto-claude" / "..",
+        ) is True
+        manager_cls.assert_not_called()
+
+    clear_manager_cache(temp_project_dir)
+
+
+def test_cached_manager_sees_external_changes(temp_project_dir: Path):
+    """Test that a cached manager reloads when the file changes on disk."""
+    generate_override_token(rule_id="bash-rm-rf", project_dir=temp_project_dir)
+
+    # Another process (simulated by a separate manager) adds a token
+    other = OverrideTokenManager(temp_project_dir)
+    token = other.generate_token(rule_id="bash-chmod-777")
+    other.flush()
+
+    assert validate_override_token(
+        token_id=token.token_id,
+        rule_id="bash-chmod-777",
+        project_dir=temp_project_dir,
+    ) is True
+
+    clear_manager_cache(temp_project_dir)
+
+
+def test_cached_manager_sees_deleted_file(temp_project_dir: Path):
+    """Test that deleting the tokens file revokes tokens in a cached manager."""
+    token = generate_override_token(
+        rule_id="bash-rm-rf", project_dir=temp_project_dir
+    )
+    tokens_file = temp_project_dir / ".auto-claude" / "override-tokens.json"
+    tokens_file.unlink()
+
+    assert list_override_tokens(project_dir=temp_project_dir) == []
+    assert validate_and_use_override_token(
+        token_id=token.token_id,
+        rule_id="bash-rm-rf",
+        project_dir=temp_project_dir,
+    ) is False
+    clear_manager_cache(temp_project_dir)
+    assert not tokens_file.exists()
+
+
+def test_save_merges_changes_from_other_manager(temp_project_dir: Path):
+    """Test that saving a stale view keeps another manager's changes."""
+    manager1 = OverrideTokenManager(temp_project_dir)
+    revoked = manager1.generate_token(rule_id="bash-rm-rf")
+    manager1.flush()
+    # Not yet written, so the first manager keeps its view of the file
+    added = manager1.generate_token(rule_id="bash-rm-rf")
+
+    # Another process revokes the token and creates its own
+    manager2 = OverrideTokenManager(temp_project_dir)
+    assert manager2.revoke_token(revoked.token_id) is True
+    created = manager2.generate_token(rule_id="bash-chmod-777")
+    manager2.flush()
+
+    assert manager1.flush() is True
+
+    saved = set(OverrideTokenManager(temp_project_dir).storage.load_tokens())
+    assert saved == {created.token_id, added.token_id}
+    assert set(manager1.storage.tokens) == saved
+
+
 # =============================================================================
 # INTEGRATION TESTS
 # =============================================================================
@@ -691,6 +902,7 @@ def test_token_persistence_across_managers(temp_project_dir: Path):
     # Create token with first manager
     manager1 = OverrideTokenManager(temp_project_dir)
     token = manager1.generate_token(rule_id="bash-rm-rf")
+    manager1.flush()
 
     # Load with second manager
     manager2 = OverrideTokenManager(temp_project_dir)
@@ -832,6 +1044,7 @@ def test_token_json_format(temp_project_dir: Path):
         reason="Test token",
         creator="test-user",
     )
+    manager.flush()
 
     # Load JSON file
     tokens_file = temp_project_dir / ".auto-claude" / "override-tokens.json"
@@ -851,6 +1064,47 @@ def test_token_json_format(temp_project_dir: Path):
     assert token_data["creator"] == "test-user"
 
 
+def test_mutations_batched_until_flush(temp_project_dir: Path):
+    """Test that manager mutations are written once, on flush."""
+    manager = OverrideTokenManager(temp_project_dir)
+    for _ in range(5):
+        manager.generate_token(rule_id="bash-rm-rf")
+
+    tokens_file = temp_project_dir / ".auto-claude" / "override-tokens.json"
+    assert not tokens_file.exists()
+    assert manager.storage.dirty is True
+
+    assert manager.flush() is True
+    assert manager.storage.dirty is False
+
+    with open(tokens_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    assert len(data["tokens"]) == 5
+
+
+def test_unchanged_file_is_not_reparsed(temp_project_dir: Path):
+    """Test that a manager only re-reads the tokens file after it changes."""
+    manager = OverrideTokenManager(temp_project_dir)
+    manager.generate_token(rule_id="bash-rm-rf")
+    manager.flush()
+    assert manager.storage.is_stale() is False
+
+    with mock.patch.object(
+        overrides, "_read_tokens_data", wraps=overrides._read_tokens_data
+    ) as read:
+        manager.list_tokens(rule_id="bash-rm-rf")
+        assert read.call_count == 0
+
+        other = OverrideTokenManager(temp_project_dir)
+        other.generate_token(rule_id="bash-chmod-777")
+        other.flush()
+        assert manager.storage.is_stale() is True
+
+        reads_before = read.call_count
+        assert len(manager.list_tokens(rule_id="bash-chmod-777")) == 1
+        assert read.call_count == reads_before + 1
+
+
 def test_invalid_json_is_handled(temp_project_dir: Path):
     """Test that invalid JSON is handled gracefully."""
     # Create invalid JSON file
@@ -292,6 +292,7 @@ def test_token_persistence():
         # Create token with first manager
         manager1 = OverrideTokenManager(project_dir)
         token = manager1.generate_token(rule_id="bash-rm-rf")
+        manager1.flush()
         print_success(f"Generated token with manager1: {token.token_id}")
 
         # Load with second manager
@@ -431,6 +432,7 @@ def test_json_format():
             reason="Test token",
             creator="test-user",
         )
+        manager.flush()
         print_success(f"Generated token: {token.token_id}")
 
         # Load JSON file
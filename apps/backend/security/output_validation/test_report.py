@@ -5,6 +5,7 @@ Tests for Validation Report Generator
 Comprehensive pytest test suite for the validation report generation module.
 """
 
+import io
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -28,6 +29,13 @@ from security.output_validation.models import (
 # FIXTURES
 # =============================================================================
 
+def render(emit, *args):
+    """Render a single report section emitter to a string."""
+    out = io.StringIO()
+    emit(out, *args)
+    return out.getvalue()
+
+
 @pytest.fixture
 def logger():
     """Create a ValidationEventLogger for testing."""
@@ -168,9 +176,24 @@ def test_generate_markdown_with_events(logger_with_events):
     assert "write-system-file" in markdown
 
 
+def test_generate_markdown_computes_statistics_once(logger_with_events, monkeypatch):
+    """Test statistics are computed once per report, not once per section."""
+    calls = []
+    get_statistics = logger_with_events.get_statistics
+
+    def counting_get_statistics():
+        calls.append(1)
+        return get_statistics()
+
+    monkeypatch.setattr(logger_with_events, "get_statistics", counting_get_statistics)
+    ValidationReportGenerator(logger_with_events).generate_markdown()
+
+    assert len(calls) == 1
+
+
 def test_generate_header(report_gen):
     """Test header generation."""
-    header = report_gen._generate_header()
+    header = render(report_gen._emit_header, report_gen.logger.get_statistics())
 
     assert "# Output Validation Report" in header
     assert "**Generated:**" in header
@@ -180,7 +203,7 @@ def test_generate_header(report_gen):
 def test_generate_summary_section(logger_with_events):
     """Test summary section generation."""
     report_gen = ValidationReportGenerator(logger=logger_with_events)
-    summary = report_gen._generate_summary_section()
+    summary = render(report_gen._emit_summary_section, report_gen.logger.get_statistics())
 
     assert "## Summary" in summary
     assert "| Metric | Count |" in summary
@@ -191,7 +214,7 @@ def test_generate_blocked_section(logger_with_events):
     """Test blocked operations section generation."""
     report_gen = ValidationReportGenerator(logger_with_events)
     blocked = logger_with_events.get_blocked_events()
-    section = report_gen._generate_blocked_section(blocked)
+    section = render(report_gen._emit_blocked_section, blocked)
 
     assert "## Blocked Operations" in section
     assert "### bash-rm-rf-root" in section
@@ -221,7 +244,7 @@ def test_generate_blocked_section_multiple_same_rule(logger):
 
     report_gen = ValidationReportGenerator(logger)
     blocked = logger.get_blocked_events()
-    section = report_gen._generate_blocked_section(blocked)
+    section = render(report_gen._emit_blocked_section, blocked)
 
     assert "## Blocked Operations" in section
     assert "### bash-rm-rf" in section
@@ -236,7 +259,7 @@ def test_generate_warning_section(logger_with_events):
     """Test warnings section generation."""
     report_gen = ValidationReportGenerator(logger_with_events)
     warnings = logger_with_events.get_warning_events()
-    section = report_gen._generate_warning_section(warnings)
+    section = render(report_gen._emit_warning_section, warnings)
 
     assert "## Warnings" in section
     assert "### bash-sudo" in section
@@ -249,7 +272,7 @@ def test_generate_override_section(logger_with_events):
     """Test override section generation."""
     report_gen = ValidationReportGenerator(logger_with_events)
     overrides = logger_with_events.get_override_events()
-    section = report_gen._generate_override_section(overrides)
+    section = render(report_gen._emit_override_section, overrides)
 
     assert "## Override Tokens Used" in section
     assert "`token-123`" in markdown_escape(section)
@@ -260,7 +283,7 @@ def test_generate_override_section(logger_with_events):
 def test_generate_tool_statistics(logger_with_events):
     """Test tool statistics section generation."""
     report_gen = ValidationReportGenerator(logger_with_events)
-    section = report_gen._generate_tool_statistics()
+    section = render(report_gen._emit_tool_statistics, report_gen.logger.get_statistics())
 
     assert "## Statistics by Tool" in section
     assert "| Tool | Validations |" in section
@@ -272,7 +295,7 @@ def test_generate_tool_statistics(logger_with_events):
 def test_generate_severity_breakdown(logger_with_events):
     """Test severity breakdown section generation."""
     report_gen = ValidationReportGenerator(logger_with_events)
-    section = report_gen._generate_severity_breakdown()
+    section = render(report_gen._emit_severity_breakdown, report_gen.logger.get_statistics())
 
     assert "## Blocked Operations by Severity" in section
     assert "| Severity | Count |" in section
@@ -281,7 +304,7 @@ def test_generate_severity_breakdown(logger_with_events):
 
 def test_generate_footer(report_gen):
     """Test footer generation."""
-    footer = report_gen._generate_footer()
+    footer = render(report_gen._emit_footer)
 
     assert "---" in footer
     assert "*This report was generated by" in footer
@@ -381,6 +404,19 @@ def test_save_to_file_without_path(tmp_path, logger_with_events):
     assert expected_path.exists()
 
 
+def test_save_to_file_matches_generated_markdown(tmp_path, logger_with_events):
+    """Test the streamed file has the same content as generate_markdown."""
+    report_gen = ValidationReportGenerator(logger=logger_with_events)
+    report_path = report_gen.save_to_file(tmp_path / "report.md")
+
+    def strip_timestamp(text):
+        return [line for line in text.splitlines() if not line.startswith("**Generated:**")]
+
+    saved = report_path.read_text(encoding="utf-8")
+    assert strip_timestamp(saved) == strip_timestamp(report_gen.generate_markdown())
+    assert saved.endswith("documentation.\n")
+
+
 def test_save_to_file_no_path_available(logger):
     """Test save to file when no path is available."""
     report_gen = ValidationReportGenerator(logger=logger, spec_dir=None)
@@ -20,11 +20,37 @@ by adding content-based pattern matching that catches:
 5. Command chains (dangerous operations combined with &&, |, ;)
 """
 
+import re
 from typing import Any
 
 from ..models import OutputValidationConfig, ToolType, ValidationResult
 from ..pattern_detector import PatternDetector
 
+# Command separators (&&, ||, ;), captured so the split keeps them
+_COMMAND_SEPARATOR_RE = re.compile(r"(&&|\|\||;)")
+
+# Obfuscation techniques reported by _detect_obfuscation, in report order.
+# Compiled once here instead of going through re's pattern cache per call.
+_OBFUSCATION_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    # Base64 encoding/decoding
+    ("base64", re.compile(r"base64\s+(-d|--decode|-e|--encode)", re.IGNORECASE)),
+    # Variable expansion
+    ("variable_expansion", re.compile(r"\$\{?\w+\}?")),
+    # Command substitution
+    ("command_substitution", re.compile(r"\$\(|`.*`")),
+    # XOR/encoding operations in perl/python one-liners
+    (
+        "xor_encoding",
+        re.compile(
+            r"(perl|python|awk).*\s(xor|decode|unpack|chr|encode)\s*\(", re.IGNORECASE
+        ),
+    ),
+    # Hex encoding (\xNN)
+    ("hex_encoding", re.compile(r"\\x[0-9a-f]{2}", re.IGNORECASE)),
+    # Octal encoding (\NNN)
+    ("octal_encoding", re.compile(r"\\[0-9]{3}")),
+)
+
 
 async def validate_bash(
     tool_input: dict[str, Any],
@@ -157,8 +183,6 @@ async def _analyze_command_chain(
         >>> assert "ls -la" in commands
         >>> assert "grep test" in commands
     """
-    import re
-
     # Split on command separators, but preserve quoted strings
     # This is a simplified version - full shell parsing is complex
 
@@ -167,7 +191,7 @@ async def _analyze_command_chain(
 
     # Split on &&, ||, ; while preserving the operators for context
     # We use a regex to split but keep delimiters
-    parts = re.split(r"(&&|\|\||;)", command)
+    parts = _COMMAND_SEPARATOR_RE.split(command)
 
     # Reconstruct segments
     segments = []
@@ -220,35 +244,7 @@ async def _detect_obfuscation(command: str) -> list[str]:
         >>> assert "variable_expansion" in obfuscation
         >>> assert "base64" in obfuscation
     """
-    import re
-
-    detected = []
-
-    # Base64 encoding/decoding
-    if re.search(r"base64\s+(-d|--decode|-e|--encode)", command, re.IGNORECASE):
-        detected.append("base64")
-
-    # Variable expansion
-    if re.search(r"\$\{?\w+\}?", command):
-        detected.append("variable_expansion")
-
-    # Command substitution
-    if re.search(r"\$\(|`.*`", command):
-        detected.append("command_substitution")
-
-    # XOR/encoding operations in perl/python one-liners
-    if re.search(r"(perl|python|awk).*\s(xor|decode|unpack|chr|encode)\s*\(", command, re.IGNORECASE):
-        detected.append("xor_encoding")
-
-    # Hex encoding (\xNN)
-    if re.search(r"\\x[0-9a-f]{2}", command, re.IGNORECASE):
-        detected.append("hex_encoding")
-
-    # Octal encoding (\NNN)
-    if re.search(r"\\[0-9]{3}", command):
-        detected.append("octal_encoding")
-
-    return detected
+    return [name for name, pattern in _OBFUSCATION_PATTERNS if pattern.search(command)]
 
 
 async def validate_bash_advanced(